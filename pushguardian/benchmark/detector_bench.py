@@ -0,0 +1,185 @@
+"""Micro-benchmark for hard-policy detectors (no LLM / network calls).
+
+Usage:
+    python -m pushguardian.benchmark.detector_bench [--lines 200000] [--repeat 3] [--workers 4]
+"""
+
+import argparse
+import random
+import re
+import string
+import time
+from typing import Callable, List
+
+from ..detectors.parallel import detect_secrets_parallel
+from ..detectors.secrets import detect_secrets, detect_secrets_in_diff
+from ..diff_model import parse_diff
+from ..report.models import Finding
+
+
+DEFAULT_SECRET_PATTERNS = [
+    "sk-",
+    "AKIA",
+    "BEGIN PRIVATE KEY",
+    "BEGIN RSA PRIVATE KEY",
+    "xoxb-",
+    "ghp_",
+    "gho_",
+    "github_pat_",
+    "Bearer eyJ",
+]
+
+
+def legacy_detect_secrets(diff_text: str, secret_patterns: List[str]) -> List[Finding]:
+    """Pattern-by-pattern implementation kept as the reference for benchmarks and equivalence tests."""
+    findings = []
+
+    for pattern in secret_patterns:
+        try:
+            regex = re.compile(pattern)
+        except re.error:
+            regex = re.compile(re.escape(pattern))
+
+        for line_num, line in enumerate(diff_text.split("\n"), start=1):
+            if not line.startswith("+"):
+                continue
+
+            for _ in regex.finditer(line):
+                findings.append(
+                    Finding(
+                        kind="secret",
+                        title=f"시크릿 패턴 감지: {pattern}",
+                        detail=f"라인 {line_num}: {line[:100]}...",
+                        confidence=1.0,
+                        severity="critical",
+                        fix_now=(
+                            "1. 코드에서 시크릿을 즉시 제거하세요\n"
+                            "2. 노출된 자격증명을 교체/폐기하세요\n"
+                            "3. 환경 변수나 시크릿 매니저를 사용하세요"
+                        ),
+                    )
+                )
+
+    return findings
+
+
+def generate_synthetic_diff(num_lines: int, secret_every: int = 5000, seed: int = 42) -> str:
+    """Generate a synthetic diff with mostly clean code and a few planted secrets."""
+    rng = random.Random(seed)
+    lines = []
+    file_index = 0
+
+    for i in range(num_lines):
+        if i % 500 == 0:
+            file_index += 1
+            path = f"src/module_{file_index}.py"
+            lines.extend([
+                f"diff --git a/{path} b/{path}",
+                "index 1111111..2222222 100644",
+                f"--- a/{path}",
+                f"+++ b/{path}",
+                "@@ -1,0 +1,500 @@",
+            ])
+
+        if secret_every and i % secret_every == secret_every - 1:
+            lines.append(f"+API_KEY = 'sk-{''.join(rng.choices(string.ascii_letters, k=32))}'")
+        else:
+            words = " ".join(rng.choices(["value", "result", "self", "return", "data", "item"], k=6))
+            lines.append(f"+    {words}  # {i}")
+
+    return "\n".join(lines)
+
+
+def _time_call(func: Callable[[], object], repeat: int) -> float:
+    """Return best wall-clock time (ms) over `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def benchmark_secret_scan(num_lines: int = 200_000, repeat: int = 3) -> dict:
+    """
+    Compare the single-pass scanner with the legacy per-pattern loop.
+
+    Returns:
+        Dictionary with timings (ms), speedup and whether findings are identical
+    """
+    diff_text = generate_synthetic_diff(num_lines)
+    patterns = DEFAULT_SECRET_PATTERNS
+
+    legacy_ms = _time_call(lambda: legacy_detect_secrets(diff_text, patterns), repeat)
+    current_ms = _time_call(lambda: detect_secrets(diff_text, patterns), repeat)
+
+    identical = [f.to_dict() for f in legacy_detect_secrets(diff_text, patterns)] == [
+        f.to_dict() for f in detect_secrets(diff_text, patterns)
+    ]
+
+    return {
+        "lines": num_lines,
+        "diff_bytes": len(diff_text.encode("utf-8")),
+        "legacy_ms": round(legacy_ms, 2),
+        "current_ms": round(current_ms, 2),
+        "speedup": round(legacy_ms / current_ms, 2) if current_ms else float("inf"),
+        "identical": identical,
+    }
+
+
+def benchmark_parallel_scan(num_lines: int = 500_000, workers: int = 4, repeat: int = 3) -> dict:
+    """
+    Compare the in-process scan with the file-sharded process-pool scan.
+
+    Returns:
+        Dictionary with timings (ms), speedup and whether findings are identical
+    """
+    model = parse_diff(generate_synthetic_diff(num_lines))
+    patterns = DEFAULT_SECRET_PATTERNS
+    config = {"parallel_scan": {"enabled": True, "min_added_lines": 1, "max_workers": workers}}
+
+    serial_ms = _time_call(lambda: detect_secrets_in_diff(model, patterns), repeat)
+    parallel_ms = _time_call(lambda: detect_secrets_parallel(model, patterns, config), repeat)
+
+    identical = [f.to_dict() for f in detect_secrets_in_diff(model, patterns)] == [
+        f.to_dict() for f in detect_secrets_parallel(model, patterns, config)
+    ]
+
+    return {
+        "lines": num_lines,
+        "workers": workers,
+        "serial_ms": round(serial_ms, 2),
+        "parallel_ms": round(parallel_ms, 2),
+        "speedup": round(serial_ms / parallel_ms, 2) if parallel_ms else float("inf"),
+        "identical": identical,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PushGuardian detector micro-benchmark")
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=0, help="also benchmark the process-pool scan")
+    args = parser.parse_args()
+
+    result = benchmark_secret_scan(args.lines, args.repeat)
+
+    print("🔍 detect_secrets benchmark")
+    print(f"  lines:      {result['lines']:,} ({result['diff_bytes'] / 1_000_000:.1f} MB)")
+    print(f"  legacy:     {result['legacy_ms']:.2f}ms")
+    print(f"  current:    {result['current_ms']:.2f}ms")
+    print(f"  speedup:    x{result['speedup']}")
+    print(f"  identical:  {result['identical']}")
+
+    if args.workers:
+        result = benchmark_parallel_scan(args.lines, args.workers, args.repeat)
+
+        print(f"\n⚡ parallel scan benchmark ({result['workers']} workers)")
+        print(f"  serial:     {result['serial_ms']:.2f}ms")
+        print(f"  parallel:   {result['parallel_ms']:.2f}ms")
+        print(f"  speedup:    x{result['speedup']}")
+        print(f"  identical:  {result['identical']}")
+
+
+if __name__ == "__main__":
+    main()
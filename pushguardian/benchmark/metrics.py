@@ -6,6 +6,19 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 
+# 신뢰 도메인 (검색 품질 지표, research fast path의 원리 링크 판정에 사용)
+HIGH_QUALITY_DOMAINS = frozenset({
+    "owasp.org",
+    "cheatsheetseries.owasp.org",
+    "nist.gov",
+    "cwe.mitre.org",
+    "nvd.nist.gov",
+    "docs.github.com",
+    "security.googleblog.com",
+    "learn.microsoft.com",
+})
+
+
 @dataclass
 class NodeMetrics:
     """Metrics for a single node execution."""
@@ -93,6 +106,10 @@ class BenchmarkResult:
     total_search_time_ms: float = 0.0
     llm_calls_count: int = 0
 
+    # LLM response cache (pushguardian.llm.cache)
+    llm_cache_hits: int = 0
+    llm_cache_misses: int = 0
+
     # Error tracking
     errors: List[str] = field(default_factory=list)
 
@@ -108,16 +125,7 @@ class MetricsCollector:
         self.node_metrics: List[NodeMetrics] = []
         self.search_metrics: List[SearchQualityMetrics] = []
 
-        self.high_quality_domains = {
-            "owasp.org",
-            "cheatsheetseries.owasp.org",
-            "nist.gov",
-            "cwe.mitre.org",
-            "nvd.nist.gov",
-            "docs.github.com",
-            "security.googleblog.com",
-            "learn.microsoft.com",
-        }
+        self.high_quality_domains = HIGH_QUALITY_DOMAINS
 
     def start_workflow(self):
         """Mark workflow start time."""
@@ -177,8 +185,16 @@ class MetricsCollector:
                 metrics.results_count = len(evidence.principle_links) + len(getattr(evidence, "example_links", []))
 
         elif node_name == "observation_validate":
-            metrics.llm_called = True
-            metrics.llm_model = "gpt-4o-mini"
+            evidence = state.get("evidence")
+            observations = getattr(evidence, "llm_observations", None) or [{}]
+            if observations[-1].get("fast_path"):
+                # 규칙 기반 fast path로 판정 (LLM 호출 없음)
+                metrics.llm_model = "rule-based (fast path)"
+            else:
+                metrics.llm_called = True
+                # research.combined_observe_plan: 1회 호출(observe+plan) vs 기존 2회 호출 비교용
+                combined = (state.get("config") or {}).get("research", {}).get("combined_observe_plan", True)
+                metrics.llm_model = "gpt-4o-mini (observe+plan)" if combined else "gpt-4o-mini (observe, plan)"
 
         # Track errors
         if "errors" in state and state["errors"]:
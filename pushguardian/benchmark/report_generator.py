@@ -44,6 +44,10 @@ def generate_markdown_report(results: List[BenchmarkResult]) -> str:
         lines.append(f"- **Average Total Duration:** {avg_duration:.2f}s")
         lines.append(f"- **Average Search Time:** {avg_search_time:.2f}ms")
         lines.append(f"- **Average LLM Calls:** {avg_llm_calls:.1f} per test")
+        cache_hits = sum(r.llm_cache_hits for r in results)
+        cache_lookups = cache_hits + sum(r.llm_cache_misses for r in results)
+        hit_rate = cache_hits / cache_lookups * 100 if cache_lookups else 0.0
+        lines.append(f"- **LLM Cache:** {cache_hits} hits / {cache_lookups - cache_hits} misses ({hit_rate:.0f}% hit rate)")
         lines.append(f"- **Average Query Length:** {avg_query_length:.1f} words")
         lines.append(f"- **Total Searches Performed:** {total_searches}")
         lines.append(f"- **Average Principle Links:** {avg_principle_links:.1f}")
@@ -91,6 +95,7 @@ def generate_markdown_report(results: List[BenchmarkResult]) -> str:
         lines.append(f"| **Total Duration** | {result.total_duration_ms:.2f}ms ({result.total_duration_sec:.2f}s) |")
         lines.append(f"| **Search Time** | {result.total_search_time_ms:.2f}ms |")
         lines.append(f"| **LLM Calls** | {result.llm_calls_count} |")
+        lines.append(f"| **LLM Cache Hits / Misses** | {result.llm_cache_hits} / {result.llm_cache_misses} |")
         lines.append(f"| **Research Iterations** | {result.research_iterations} |")
         lines.append("")
 
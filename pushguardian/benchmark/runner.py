@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import List
 from .metrics import MetricsCollector, BenchmarkResult
 from ..graph import build_graph
+from ..llm.cache import cache_stats, reset_cache_stats
 
 
 def run_benchmark_on_file(test_file: Path, test_name: str) -> BenchmarkResult:
@@ -26,6 +27,7 @@ def run_benchmark_on_file(test_file: Path, test_name: str) -> BenchmarkResult:
     # Create metrics collector
     collector = MetricsCollector()
     collector.start_workflow()
+    reset_cache_stats()
 
     # Build and run graph
     graph = build_graph()
@@ -154,7 +156,11 @@ def run_benchmark_on_file(test_file: Path, test_name: str) -> BenchmarkResult:
                 traceback.print_exc()
 
     # Finalize and return results
-    return collector.finalize(test_name, str(test_file), final_state)
+    result = collector.finalize(test_name, str(test_file), final_state)
+    stats = cache_stats()
+    result.llm_cache_hits = stats["hits"]
+    result.llm_cache_misses = stats["misses"]
+    return result
 
 
 def run_all_benchmarks(examples_dir: Path) -> List[BenchmarkResult]:
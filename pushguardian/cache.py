@@ -0,0 +1,135 @@
+"""Persistent on-disk key/value cache (SQLite) with size-bounded LRU eviction."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+class SqliteCache:
+    """
+    Small JSON key/value store backed by a single SQLite file.
+
+    - 값은 JSON 직렬화하여 저장하고, 접근 시각(last_access)을 갱신해 LRU 순서를 유지
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 접근하지 않은 항목부터 제거
+    - 같은 프로세스 내 여러 스레드에서 사용할 수 있도록 lock으로 보호
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = 64 * 1024 * 1024):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Batch lookup: {key: value} for every key that is cached."""
+        found: dict[str, Any] = {}
+        if not keys:
+            return found
+
+        now = time.time()
+        with self._lock:
+            # SQLite 변수 개수 제한을 피하기 위해 나눠서 조회
+            for i in range(0, len(keys), 500):
+                batch = keys[i : i + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM entries WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, value in rows:
+                    found[key] = json.loads(value)
+            if found:
+                self._conn.executemany(
+                    "UPDATE entries SET last_access = ? WHERE key = ?", [(now, k) for k in found]
+                )
+                self._conn.commit()
+        return found
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value."""
+        self.put_many({key: value})
+
+    def put_many(self, items: dict[str, Any]) -> None:
+        """Store several values in one transaction, then enforce the size bound."""
+        if not items:
+            return
+
+        now = time.time()
+        rows = []
+        for key, value in items.items():
+            payload = json.dumps(value, ensure_ascii=False)
+            rows.append((key, payload, len(payload.encode("utf-8")), now))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._evict()
+            self._conn.commit()
+
+    def delete_prefix(self, prefix: str, keep_prefix: str | None = None) -> int:
+        """
+        Delete entries whose key starts with prefix (except those starting with keep_prefix).
+
+        Returns:
+            Number of deleted entries
+        """
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        sql = "DELETE FROM entries WHERE key LIKE ? ESCAPE '\\'"
+        params: list[str] = [escaped + "%"]
+        if keep_prefix:
+            escaped_keep = keep_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql += " AND key NOT LIKE ? ESCAPE '\\'"
+            params.append(escaped_keep + "%")
+
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            self._conn.commit()
+            return cursor.rowcount
+
+    def total_bytes(self) -> int:
+        """Total payload size currently stored."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the store fits in max_bytes (lock held)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        to_free = total - self.max_bytes
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_access ASC"):
+            victims.append((key,))
+            to_free -= size
+            if to_free <= 0:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
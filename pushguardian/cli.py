@@ -1,12 +1,30 @@
 """CLI entry point for pre-push hook."""
 
+import os
 import sys
 from pathlib import Path
 from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
-from .git_ops import get_diff_range, get_repo_root
-from .graph import run_guardian
+from .config import load_config
+from .cache import SqliteCache
+from .diff_model import chunk_header, parse_diff
+from .detectors.classify import classify_files, paths_with_policy
+from .detectors.files import detect_sensitive_files
+from .detectors.scan_cache import detect_secrets_cached, open_scan_cache
+from .detectors.secrets import detect_secrets_in_diff
+from .detectors.stack_guess import guess_stacks, identify_weak_stacks
+from .git_objects import GitObjectReader
+from .git_ops import (
+    ChangedFile,
+    get_diff_range,
+    get_name_status,
+    get_repo_root,
+    resolve_push_base,
+    stream_diff_range,
+    stream_diff_range_sharded,
+)
+from .report.models import Evidence, Finding
 
 console = Console()
 
@@ -52,6 +70,217 @@ def human_decision_prompt(state: dict) -> str:
         return "allow", None
 
 
+def name_precheck(entries: list[ChangedFile], config: dict) -> tuple[list[Finding], list[str]]:
+    """
+    Phase 1: decide what can be decided from file names alone.
+
+    Args:
+        entries: Changed files of the push (from get_name_status)
+        config: Loaded configuration
+
+    Returns:
+        (sensitive-file findings, weak stacks touched)
+    """
+    paths = [entry.path for entry in entries]
+    findings = detect_sensitive_files(paths, config.get("hard_abort", {}).get("file_patterns", []))
+
+    detected_stacks = guess_stacks(paths, config.get("custom_stacks"))
+    weak_touched = identify_weak_stacks(detected_stacks, config.get("stacks_known", []), config.get("stacks_weak", []))
+    return findings, weak_touched
+
+
+def fast_block_state(findings: list[Finding], weak_touched: list[str], config: dict) -> dict:
+    """
+    Report for a push blocked by name rules, without running the analysis graph.
+
+    Args:
+        findings: Sensitive-file findings from name_precheck
+        weak_touched: Weak stacks touched by the push
+        config: Loaded configuration
+
+    Returns:
+        Minimal state for human_decision_prompt (report_md, decision, severity, risk_score, report_path)
+    """
+    from .report.writer import generate_report_md, save_report
+
+    state = {
+        "config": config,
+        "decision": "block",
+        "severity": "critical",
+        "risk_score": 1.0,
+        "report_path": None,
+    }
+    state["report_md"] = generate_report_md(
+        findings=findings,
+        evidence=Evidence(),
+        severity=state["severity"],
+        risk_score=state["risk_score"],
+        decision=state["decision"],
+        weak_stack_touched=weak_touched,
+    )
+
+    try:
+        state["report_path"] = save_report(state["report_md"], config.get("report_dir", "."))
+    except Exception as e:
+        console.print(f"[yellow]리포트 저장 실패: {e}[/yellow]")
+
+    return state
+
+
+def patch_pathspecs(entries: list[ChangedFile], repo_root: str, config: dict) -> tuple[list[str], list[ChangedFile]]:
+    """
+    Phase 2 pathspecs: leave files above diff_stream.max_file_bytes out of the patch.
+
+    Blob sizes come from the shared cat-file pipe (one pipelined batch for the whole push).
+
+    Returns:
+        (pathspecs for git diff, entries excluded from the patch)
+    """
+    max_file_bytes = config.get("diff_stream", {}).get("max_file_bytes", 5_000_000)
+    if not max_file_bytes:
+        return [], []
+
+    from .repo_context import get_repo_context
+
+    blobs = [entry.new_blob or entry.old_blob for entry in entries]
+    sizes = get_repo_context(repo_root).objects.info_many(blob for blob in blobs if blob)
+
+    excluded = []
+    for entry, blob in zip(entries, blobs):
+        info = sizes.get(blob) if blob else None
+        if info is not None and info.size > max_file_bytes:
+            excluded.append(entry)
+
+    # literal: 경로의 glob 문자를 그대로 해석 / exclude: 나머지 파일은 모두 diff
+    # 이름 변경은 원래 경로도 제외해야 삭제 쪽 전체 패치가 나오지 않음 (복사는 원본이 그대로 남으므로 제외하지 않음)
+    paths = []
+    for entry in excluded:
+        if entry.status.startswith("R") and entry.old_path:
+            paths.append(entry.old_path)
+        paths.append(entry.path)
+    return [f":(exclude,literal){path}" for path in paths], excluded
+
+
+def resolve_diff_shards(file_count: int, config: dict) -> int:
+    """
+    Number of concurrent `git diff` processes for a push (1 = single process).
+
+    Sharding only pays off for very wide pushes (diff_stream.shard_min_files);
+    diff_stream.shards = 0 means one shard per CPU core.
+    """
+    stream_config = config.get("diff_stream", {})
+    if file_count < stream_config.get("shard_min_files", 5000):
+        return 1
+    shards = stream_config.get("shards", 0) or os.cpu_count() or 1
+    return max(1, min(int(shards), file_count))
+
+
+def _header_only(entry: ChangedFile) -> str:
+    """diff section header for a file whose patch was not fetched (keeps path and blob SHAs)."""
+    zero = "0" * 40
+    return (
+        f"diff --git a/{entry.old_path or entry.path} b/{entry.path}\n"
+        f"index {entry.old_blob or zero}..{entry.new_blob or zero}\n"
+    )
+
+
+def _retain_overflow(
+    chunk: str,
+    secret_patterns: list[str],
+    classify_config: dict,
+    objects: GitObjectReader | None,
+    scan_cache: SqliteCache | None,
+) -> bool:
+    """
+    Hard secret rules for a file section about to be cut to its header.
+
+    The graph never sees that body, so it is checked here (with the same file-class
+    policies and blob scan cache as hard_policy_check) and kept in full when it matches.
+    """
+    model = parse_diff(chunk)
+    if classify_config.get("enabled", True):
+        file_classes = classify_files(model, classify_config, objects=objects)
+        model = model.select(paths_with_policy(file_classes, classify_config, ("full", "hard_only")))
+    # 이미 같은 정책으로 스캔한 blob은 캐시 결과를 사용 (재푸시 시 정규식 재스캔 없음)
+    if scan_cache is not None:
+        return bool(detect_secrets_cached(model, secret_patterns, scan_cache))
+    return bool(detect_secrets_in_diff(model, secret_patterns))
+
+
+def collect_push_diff(
+    local_sha: str,
+    remote_sha: str,
+    repo_root: str,
+    config: dict,
+    entries: list[ChangedFile] | None = None,
+    base: str | None = None,
+) -> str:
+    """
+    Read the push diff incrementally, keeping a bounded amount of patch text for the graph.
+
+    - git diff 출력을 파일 단위로 스트리밍 (시크릿/민감 파일 규칙은 그래프의 hard_policy_check가 한 번만 검사)
+    - 보관하는 diff 텍스트는 max_retained_bytes로 제한: 초과분은 파일 헤더만 보관
+    - 단, 헤더만 남길 파일은 그래프가 본문을 볼 수 없으므로 여기서 시크릿 규칙을 검사하고 걸리면 전체를 보관
+    - 모든 파일을 끝까지 읽음 (중간에 끊지 않으므로 뒤쪽 파일도 그래프에서 분석됨)
+    - entries(1단계 name-status 결과)가 있으면 max_file_bytes를 넘는 파일은 패치를 받지 않고 헤더만 보관
+
+    Args:
+        local_sha: Local commit SHA
+        remote_sha: Remote commit SHA (or all zeros for new branch)
+        repo_root: Git repository root
+        config: Loaded configuration
+        entries: Changed files from the name-status phase (optional)
+        base: New-branch base from resolve_push_base (resolved by git_ops when omitted)
+
+    Returns:
+        Diff text for the analysis graph
+    """
+    stream_config = config.get("diff_stream", {})
+    if not stream_config.get("enabled", True):
+        return get_diff_range(local_sha, remote_sha, repo_root, base=base)
+
+    from .repo_context import get_repo_context
+
+    max_retained = stream_config.get("max_retained_bytes", 8_000_000)
+    secret_patterns = config.get("hard_abort", {}).get("secret_patterns", [])
+    classify_config = config.get("file_classes", {})
+    objects = get_repo_context(repo_root).objects
+    scan_cache = open_scan_cache(config, secret_patterns)
+
+    pathspecs, excluded = patch_pathspecs(entries, repo_root, config) if entries else ([], [])
+
+    parts = []
+    retained = 0
+
+    # 변경 파일이 아주 많으면 경로 목록을 샤드로 나눠 git diff를 동시에 실행 (출력 순서는 동일)
+    num_shards = resolve_diff_shards(len(entries), config) if entries else 1
+    if num_shards > 1:
+        skipped = {entry.path for entry in excluded}
+        wanted = [entry for entry in entries if entry.path not in skipped]
+        chunks = stream_diff_range_sharded(local_sha, remote_sha, repo_root, wanted, num_shards, base)
+    else:
+        chunks = stream_diff_range(local_sha, remote_sha, repo_root, pathspecs, base)
+    try:
+        for chunk in chunks:
+            if retained + len(chunk) <= max_retained or _retain_overflow(
+                chunk, secret_patterns, classify_config, objects, scan_cache
+            ):
+                parts.append(chunk)
+                retained += len(chunk)
+            else:
+                # Keep file headers so changed files / stacks are still known downstream
+                parts.append(chunk_header(chunk))
+    finally:
+        chunks.close()
+        if scan_cache is not None:
+            scan_cache.close()
+
+    # Files left out of the patch still show up (path, blob SHAs) for classification and stacks
+    parts.extend(_header_only(entry) for entry in excluded)
+
+    return "".join(parts)
+
+
 def main():
     """Main CLI entry point for pre-push hook."""
     # Parse arguments from git pre-push hook
@@ -94,15 +323,42 @@ def main():
     console.print(f"[cyan]{remote_name} 으로의 푸시를 분석 중입니다...[/cyan]")
 
     try:
-        # Get diff
-        diff_text = get_diff_range(local_sha, remote_sha, repo_root)
+        config = load_config()
+
+        # 새 브랜치의 기준 커밋(rev-list --boundary)은 푸시당 한 번만 계산해서
+        # name-status, 패치, diff 샤드, patch-id 계산이 모두 공유
+        base = resolve_push_base(local_sha, remote_sha, repo_root)
+
+        # Phase 1: names only (git diff --raw) → sensitive files block without fetching any patch
+        entries = None
+        if config.get("diff_stream", {}).get("name_precheck", True):
+            entries = get_name_status(local_sha, remote_sha, repo_root, base)
+        if entries is not None:
+            if not entries:
+                console.print("[yellow]변경 사항이 감지되지 않았습니다. 푸시를 허용합니다.[/yellow]")
+                sys.exit(0)
+
+            name_findings, weak_touched = name_precheck(entries, config)
+            if name_findings:
+                console.print("[red]민감한 파일이 포함되어 있어 diff를 받지 않고 바로 차단합니다.[/red]")
+                state = fast_block_state(name_findings, weak_touched, config)
+                human_decision_prompt(state)
+                if state.get("report_path"):
+                    console.print(f"\n[green]📄 리포트 저장 경로:[/green] {state['report_path']}")
+                console.print("\n[bold red]⛔ 푸시가 차단되었습니다. 이슈를 수정한 뒤 다시 시도해 주세요.[/bold red]\n")
+                sys.exit(1)
+
+        # Phase 2: patch text (streamed with a bounded amount kept; hard rules run in the graph)
+        diff_text = collect_push_diff(local_sha, remote_sha, repo_root, config, entries, base)
 
         if not diff_text.strip():
             console.print("[yellow]변경 사항이 감지되지 않았습니다. 푸시를 허용합니다.[/yellow]")
             sys.exit(0)
 
-        # Run guardian
-        state = run_guardian(diff_text, mode="cli", repo_root=repo_root)
+        # Run guardian (imported here so name-only blocks don't pay for loading the graph)
+        from .graph import run_guardian
+
+        state = run_guardian(diff_text, mode="cli", repo_root=repo_root, push_range=(local_sha, remote_sha, base))
 
         # Human decision
         final_decision, override_reason = human_decision_prompt(state)
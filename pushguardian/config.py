@@ -37,21 +37,58 @@ def load_config(config_path: str | Path | None = None) -> Dict[str, Any]:
         "version": 1,
         "report_dir": os.path.expandvars("%USERPROFILE%\\Documents\\PushGuardian\\reports"),
         "override_dir": os.path.expandvars("%USERPROFILE%\\Documents\\PushGuardian\\overrides"),
-        "history_scan_commits": 5,
+        "history_scan_commits": 100,
         "stacks_known": ["python", "git"],
         "stacks_weak": ["react", "typescript", "docker", "kubernetes"],
+        "custom_stacks": {},
         "hard_abort": {
             "file_patterns": [".env", ".env.*", "*.pem", "*.key", "id_rsa", "id_rsa.*"],
             "secret_patterns": ["sk-", "AKIA", "BEGIN PRIVATE KEY", "BEGIN RSA PRIVATE KEY"],
         },
+        "scan_cache": {"enabled": True, "max_bytes": 64 * 1024 * 1024},
+        "diff_stream": {
+            "enabled": True,
+            "max_retained_bytes": 8_000_000,
+            "name_precheck": True,
+            "max_file_bytes": 5_000_000,
+            "shard_min_files": 5000,
+            "shards": 0,
+        },
+        "result_cache": {"enabled": True, "max_bytes": 16 * 1024 * 1024},
+        "llm_cache": {"enabled": True, "ttl_hours": 168, "max_bytes": 32 * 1024 * 1024},
+        "parallel_scan": {"enabled": True, "min_added_lines": 50_000, "max_workers": 0},
+        "file_classes": {
+            "enabled": True,
+            "policies": {"binary": "skip", "generated": "hard_only", "vendored": "hard_only", "oversized": "hard_only"},
+            "max_changed_lines": 5000,
+            "max_blob_bytes": 1_000_000,
+        },
+        "entropy": {
+            "enabled": True,
+            "min_length": 20,
+            "thresholds": {"hex": 3.0, "base64": 4.5},
+            "context_keywords": [
+                "secret", "token", "passwd", "password", "pwd", "api_key", "apikey", "api-key",
+                "access_key", "private_key", "client_secret", "credential", "auth", "bearer", "key",
+            ],
+        },
         "soft_checks": [
             {"name": "dto_schema_bypass", "description": "DTO/Schema bypass detection"},
             {"name": "dependency_risk", "description": "Dependency version changes"},
             {"name": "permission_risk", "description": "Permission file changes"},
         ],
+        "soft_judge": {
+            "chunk_token_budget": 3000,
+            "max_chunks": 12,
+            "max_concurrency": 4,
+            "llm_timeout": 60,
+            "max_retries": 2,
+        },
         "research": {
             "max_loops": 2,
             "require_categories": ["principle", "example"],
+            "combined_observe_plan": True,
+            "fast_path": {"enabled": True, "min_principle_links": 1, "min_example_links": 1},
         },
         "ui": {"show_markdown_in_terminal": True},
     }
@@ -0,0 +1,161 @@
+"""Changed-file classification (binary / generated / vendored / oversized) and analysis policies."""
+
+import re
+from typing import Dict, Iterable, List, Optional
+from ..diff_model import DiffModel, FileDiff
+from ..git_objects import GitObjectReader
+from .files import compile_file_patterns
+
+
+# 분류 결과별 기본 분석 정책
+#   skip      : 내용 검사/LLM 모두 생략 (민감 파일 경로 규칙은 항상 적용)
+#   hard_only : 하드 규칙(시크릿/엔트로피)만 검사, LLM 프롬프트에서는 제외
+#   full      : 모든 분석
+POLICIES = ("skip", "hard_only", "full")
+
+DEFAULT_CLASSIFY_CONFIG = {
+    "enabled": True,
+    "policies": {"binary": "skip", "generated": "hard_only", "vendored": "hard_only", "oversized": "hard_only"},
+    "max_changed_lines": 5000,
+    "max_blob_bytes": 1_000_000,
+    "generated_paths": [
+        "*.min.js", "*.min.css", "*.map", "*.lock", "package-lock.json", "pnpm-lock.yaml",
+        "go.sum", "*.snap", "*.pb.go", "*_pb2.py", "*.generated.*", "*/__snapshots__/*",
+        "dist/*", "build/*",
+    ],
+    "vendored_paths": ["vendor/*", "*/vendor/*", "node_modules/*", "*/node_modules/*", "third_party/*"],
+}
+
+# 생성된 파일 표식 (파일 앞부분의 추가 라인에서만 확인)
+_GENERATED_MARKERS = ("@generated", "do not edit", "auto-generated", "autogenerated", "code generated by")
+_SNIFF_LINES = 20
+# 이보다 긴 라인이 있으면 minified 번들로 판단
+_MINIFIED_LINE_LENGTH = 1000
+# diff 본문이 잘린(헤더만 남은) 파일은 이 크기 이하일 때만 blob을 읽어 확인
+_SNIFF_BLOB_BYTES = 256 * 1024
+# git과 같은 바이너리 판정: 앞 8000 bytes에 NUL이 있으면 바이너리
+_BINARY_SNIFF_BYTES = 8000
+
+_FULL_SHA_RE = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+
+def _sniff_generated(diff_model: DiffModel, file_diff: FileDiff) -> bool:
+    """Cheap content check on the first added lines: generator markers or minified lines."""
+    text = diff_model.text
+    for _, _, start, end in file_diff.added_lines[:_SNIFF_LINES]:
+        if end - start > _MINIFIED_LINE_LENGTH:
+            return True
+        line = text[start:end].lower()
+        if any(marker in line for marker in _GENERATED_MARKERS):
+            return True
+    return False
+
+
+def _sniff_generated_blob(content: bytes) -> bool:
+    """Same checks as _sniff_generated, on the first lines of a blob."""
+    for line in content.split(b"\n", _SNIFF_LINES)[:_SNIFF_LINES]:
+        if len(line) > _MINIFIED_LINE_LENGTH:
+            return True
+        lowered = line.decode("utf-8", errors="replace").lower()
+        if any(marker in lowered for marker in _GENERATED_MARKERS):
+            return True
+    return False
+
+
+def _new_blob(file_diff: FileDiff) -> Optional[str]:
+    """Full new-blob SHA of a file section (None for deletions / abbreviated SHAs)."""
+    blob = file_diff.new_blob
+    if not blob or not _FULL_SHA_RE.match(blob) or not blob.strip("0"):
+        return None
+    return blob
+
+
+def classify_files(
+    diff_model: DiffModel,
+    config: Optional[dict] = None,
+    objects: Optional[GitObjectReader] = None,
+) -> Dict[str, str]:
+    """
+    Tag every changed file as binary, vendored, generated, oversized or normal.
+
+    Binary files are recognised from the diff's "Binary files ... differ" line;
+    changed-line counts come from the diff itself.
+
+    Args:
+        diff_model: Parsed diff
+        config: config["file_classes"] (path rules, size limit, policies)
+        objects: Optional cat-file reader; new-blob sizes (max_blob_bytes) are looked up over
+            its pipe, and files whose diff body was dropped are sniffed from the blob
+            (NUL bytes → binary, generator markers → generated)
+
+    Returns:
+        {filepath: class}; the first matching class in the order above wins
+    """
+    config = {**DEFAULT_CLASSIFY_CONFIG, **(config or {})}
+    generated = compile_file_patterns(config.get("generated_paths") or [])
+    vendored = compile_file_patterns(config.get("vendored_paths") or [])
+    max_changed = config.get("max_changed_lines", 5000)
+    max_blob_bytes = config.get("max_blob_bytes", 1_000_000)
+
+    blob_info = {}
+    if objects is not None:
+        blob_info = objects.info_many(blob for blob in map(_new_blob, diff_model.files) if blob)
+
+    classes: Dict[str, str] = {}
+    for file_diff in diff_model.files:
+        path = file_diff.path
+        if not path:
+            continue
+
+        info = blob_info.get(_new_blob(file_diff) or "")
+        # 헤더만 남은 파일(패치를 받지 않았거나 보관 한도 초과)은 작은 blob만 읽어 내용으로 판정
+        content = None
+        if info is not None and not file_diff.hunks and not file_diff.is_binary and info.size <= _SNIFF_BLOB_BYTES:
+            content = objects.read(info.sha) or b""
+
+        if file_diff.is_binary or (content is not None and b"\0" in content[:_BINARY_SNIFF_BYTES]):
+            classes[path] = "binary"
+        elif vendored.match(path) is not None:
+            classes[path] = "vendored"
+        elif generated.match(path) is not None or _sniff_generated(diff_model, file_diff):
+            classes[path] = "generated"
+        elif content is not None and _sniff_generated_blob(content):
+            classes[path] = "generated"
+        elif file_diff.added_count + file_diff.removed_count > max_changed:
+            classes[path] = "oversized"
+        elif info is not None and info.size > max_blob_bytes:
+            classes[path] = "oversized"
+        else:
+            classes[path] = "normal"
+
+    return classes
+
+
+def policy_for(file_class: str, config: Optional[dict] = None) -> str:
+    """Analysis policy ("skip" | "hard_only" | "full") for a file class."""
+    if file_class == "normal":
+        return "full"
+    policies = {**DEFAULT_CLASSIFY_CONFIG["policies"], **((config or {}).get("policies") or {})}
+    policy = policies.get(file_class, "full")
+    return policy if policy in POLICIES else "full"
+
+
+def paths_with_policy(file_classes: Dict[str, str], config: Optional[dict], policies: Iterable[str]) -> List[str]:
+    """Paths whose policy is one of `policies`, in classification (diff) order."""
+    wanted = set(policies)
+    return [path for path, file_class in file_classes.items() if policy_for(file_class, config) in wanted]
+
+
+def llm_diff_text(diff_model: DiffModel, file_classes: Dict[str, str], config: Optional[dict] = None) -> str:
+    """
+    Diff text sent to the LLM judge: only files with the "full" policy.
+
+    Returns the original text unchanged when nothing was excluded (e.g. pasted
+    snippets without file headers).
+    """
+    full = set(paths_with_policy(file_classes, config, ("full",)))
+    if len(full) == len(file_classes):
+        return diff_model.text
+
+    text = diff_model.text
+    return "".join(text[f.start:f.end] for f in diff_model.files if f.path in full)
@@ -0,0 +1,230 @@
+"""High-entropy string detection (catches random-looking secrets without a known prefix)."""
+
+import importlib.util
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from ..diff_model import DiffModel
+from ..report.models import Finding
+from .classify import DEFAULT_CLASSIFY_CONFIG
+from .files import compile_file_patterns
+from .secrets import compile_secret_patterns
+
+
+_HEX_CHARS = b"0123456789abcdefABCDEF"
+
+# 토큰이 아주 길면 앞부분만 사용 (히스토그램 배열 크기 제한)
+MAX_TOKEN_LENGTH = 256
+# 한 번에 히스토그램을 계산하는 토큰 수 (메모리: BATCH_SIZE x 256 x 8 bytes)
+BATCH_SIZE = 4096
+
+DEFAULT_ENTROPY_CONFIG = {
+    "enabled": True,
+    "min_length": 20,
+    "thresholds": {"hex": 3.0, "base64": 4.5},
+    # 토큰을 제외한 라인에 이 단어 중 하나가 있어야 보고 (커밋 SHA, integrity/checksum 해시 오탐 방지)
+    "context_keywords": [
+        "secret", "token", "passwd", "password", "pwd", "api_key", "apikey", "api-key",
+        "access_key", "private_key", "client_secret", "credential", "auth", "bearer", "key",
+    ],
+}
+
+# 검사하지 않는 파일 클래스 (해시가 많은 lock/빌드 산출물, 외부 코드)
+_EXCLUDED_CLASSES = ("generated", "vendored")
+
+
+def shannon_entropy_batch(tokens: List[bytes]):
+    """
+    Shannon entropy (bits per char) and hex-charset flag for many tokens at once.
+
+    Tokens are packed into a zero-padded (n, max_len) uint8 matrix; per-row byte
+    histograms come from a single np.bincount over (row * 256 + byte).
+
+    Args:
+        tokens: ASCII tokens (non-empty, at most MAX_TOKEN_LENGTH bytes)
+
+    Returns:
+        (entropy, is_hex) numpy arrays of length len(tokens)
+    """
+    import numpy as np
+
+    n = len(tokens)
+    lengths = np.fromiter((len(t) for t in tokens), dtype=np.int64, count=n)
+    width = int(lengths.max())
+
+    matrix = np.frombuffer(b"".join(t.ljust(width, b"\0") for t in tokens), dtype=np.uint8).reshape(n, width)
+
+    rows = np.arange(n, dtype=np.int64)[:, None] * 256
+    counts = np.bincount((rows + matrix).ravel(), minlength=n * 256).reshape(n, 256)
+    counts[:, 0] = 0  # padding
+
+    probs = counts / lengths[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        entropy = -np.where(probs > 0, probs * np.log2(probs), 0.0).sum(axis=1)
+
+    hex_table = np.zeros(256, dtype=bool)
+    hex_table[list(_HEX_CHARS)] = True
+    hex_table[0] = True  # padding
+    is_hex = hex_table[matrix].all(axis=1)
+
+    return entropy, is_hex
+
+
+@lru_cache(maxsize=8)
+def _token_regex(min_length: int) -> re.Pattern:
+    return re.compile(rf"[A-Za-z0-9+/=_\-]{{{min_length},}}")
+
+
+def _keyword_pattern(keyword: str) -> str:
+    """Match keyword as an identifier word: key, apiKey, api_key, API_KEY (not keyboard, monkey, MONKEY)."""
+    lower = keyword.lower()
+    variants = [
+        rf"(?<![A-Za-z]){re.escape(lower)}(?![a-z])",  # snake_case / camelCase 첫 단어
+        rf"{re.escape(lower.capitalize())}(?![a-z])",  # camelCase 뒷 단어
+        rf"(?<![A-Z]){re.escape(lower.upper())}(?![A-Z])",  # UPPER_SNAKE
+    ]
+    return "|".join(variants)
+
+
+@lru_cache(maxsize=8)
+def _context_regex(keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    if not keywords:
+        return None
+    return re.compile("|".join(_keyword_pattern(keyword) for keyword in keywords))
+
+
+def _collect_tokens(
+    diff_model: DiffModel,
+    min_length: int,
+    excluded_paths: set,
+    secret_patterns: List[str],
+    context: Optional[re.Pattern] = None,
+) -> List[Tuple[int, str, bytes]]:
+    """
+    Candidate tokens as (line_index, line, token) from added lines.
+
+    긴 토큰은 드물기 때문에 라인별로 검사하지 않고 diff 전체에 정규식을 한 번 돌린 뒤,
+    매치 위치를 이진 탐색으로 추가된 라인에 대응시킨다. context가 있으면 토큰을 뺀
+    나머지 라인에 키 이름(secret, token, ...)이 있는 토큰만 후보로 남긴다.
+    """
+    scanner = compile_secret_patterns(secret_patterns) if secret_patterns else None
+    gate = scanner.combined if scanner is not None else None
+    text = diff_model.text
+
+    records = [rec for f in diff_model.files if f.path not in excluded_paths for rec in f.added_lines]
+    records.extend(diff_model.stray_added_lines)
+    records.sort()
+    starts = [start for _, _, start, _ in records]
+
+    candidates = []
+    skipped_line = -1
+    for match in _token_regex(min_length).finditer(text):
+        pos = bisect_right(starts, match.start()) - 1
+        if pos < 0:
+            continue
+        line_index, _, start, end = records[pos]
+        if match.end() > end or line_index == skipped_line:
+            continue  # context/removed/header line, or a line already reported by detect_secrets
+
+        token = match.group()
+        if match.start() == start:
+            token = token[1:]  # leading "+" marker
+            if len(token) < min_length:
+                continue
+
+        line = text[start:end]
+        # 이미 시크릿 패턴에 걸리는 라인은 detect_secrets가 보고하므로 중복 보고하지 않음
+        if gate is not None and gate.search(line):
+            skipped_line = line_index
+            continue
+        if context is not None and not context.search(
+            text[start:match.start()] + " " + text[match.end():end]
+        ):
+            continue
+        candidates.append((line_index, line, token[:MAX_TOKEN_LENGTH].encode("ascii")))
+    return candidates
+
+
+def detect_high_entropy_strings(
+    diff_model: DiffModel,
+    entropy_config: Optional[Dict] = None,
+    secret_patterns: Optional[List[str]] = None,
+    file_classes: Optional[Dict[str, str]] = None,
+    classify_config: Optional[Dict] = None,
+) -> List[Finding]:
+    """
+    Detect random-looking tokens (hex / base64) assigned to secret-like names in added lines.
+
+    Findings are advisory (severity "medium"): a high-entropy value is often a
+    commit SHA or a checksum, so callers should not hard-block on them.
+
+    Args:
+        diff_model: Parsed diff
+        entropy_config: config["entropy"] (min_length, thresholds per charset, context_keywords)
+        secret_patterns: hard_abort.secret_patterns; lines they match are skipped
+            because detect_secrets already reports them
+        file_classes: classify_files result; generated/vendored files are skipped
+        classify_config: config["file_classes"]; its generated_paths/vendored_paths are
+            skipped too (also when classification is disabled)
+
+    Returns:
+        List of Finding objects, at most one per line (highest-entropy token),
+        in diff order
+
+    Raises:
+        ImportError: NumPy is not installed (callers report it as a warning)
+    """
+    config = {**DEFAULT_ENTROPY_CONFIG, **(entropy_config or {})}
+    if not config.get("enabled", True):
+        return []
+
+    if importlib.util.find_spec("numpy") is None:
+        raise ImportError("high-entropy detection requires numpy (pip install numpy, or set entropy.enabled: false)")
+
+    thresholds = {**DEFAULT_ENTROPY_CONFIG["thresholds"], **(config.get("thresholds") or {})}
+    min_length = config.get("min_length", 20)
+
+    classify_config = {**DEFAULT_CLASSIFY_CONFIG, **(classify_config or {})}
+    matcher = compile_file_patterns(
+        list(classify_config.get("generated_paths") or []) + list(classify_config.get("vendored_paths") or [])
+    )
+    excluded_paths = {
+        path for path, file_class in (file_classes or {}).items() if file_class in _EXCLUDED_CLASSES
+    }
+    excluded_paths.update(p for p in diff_model.paths() if matcher.match(p) is not None)
+
+    context = _context_regex(tuple(config.get("context_keywords") or ()))
+    candidates = _collect_tokens(diff_model, min_length, excluded_paths, secret_patterns or [], context)
+
+    best: Dict[int, Tuple[float, str, str]] = {}  # line_index -> (entropy, charset, line)
+    for offset in range(0, len(candidates), BATCH_SIZE):
+        batch = candidates[offset:offset + BATCH_SIZE]
+        entropy, is_hex = shannon_entropy_batch([token for _, _, token in batch])
+
+        for (line_index, line, _), value, hex_token in zip(batch, entropy.tolist(), is_hex.tolist()):
+            charset = "hex" if hex_token else "base64"
+            if value < thresholds[charset]:
+                continue
+            if line_index not in best or value > best[line_index][0]:
+                best[line_index] = (value, charset, line)
+
+    findings = []
+    for line_index in sorted(best):
+        value, charset, line = best[line_index]
+        findings.append(
+            Finding(
+                kind="secret",
+                title=f"고엔트로피 문자열 감지 ({charset}, 엔트로피 {value:.2f})",
+                detail=f"라인 {line_index}: {line[:100]}...",
+                confidence=0.6,
+                severity="medium",
+                fix_now=(
+                    "1. 무작위 토큰/키로 보이는 값이 실제 시크릿인지 확인하세요\n"
+                    "2. 시크릿이라면 코드에서 제거하고 자격증명을 교체하세요\n"
+                    "3. 오탐이라면 entropy.context_keywords 또는 thresholds를 조정하세요"
+                ),
+            )
+        )
+
+    return findings
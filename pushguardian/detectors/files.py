@@ -1,11 +1,103 @@
 """File pattern detection (hard abort rules)."""
 
+import fnmatch
 import re
-from pathlib import Path
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from ..report.models import Finding
 
 
+_GLOB_META = set("*?[")
+_GLOB_SPLIT_RE = re.compile(r"\*|\?|\[[^\]]*\]?")
+
+
+class FileMatcher:
+    """
+    Compiled file-pattern policy (fnmatch semantics, case-insensitive).
+
+    - "*.pem" 같은 확장자 패턴은 dict 조회, ".env" 같은 고정 이름은 set 조회로 O(1) 판정
+    - 나머지 glob 패턴은 named group 교대 정규식 하나로 합치고, 패턴의 고정 문자열이
+      경로에 없으면 정규식 검사 자체를 생략 (대부분의 일반 소스 파일)
+    - 패턴은 파일 이름(basename)과 전체 경로 양쪽에 매칭하고, 여러 개가 맞으면 목록상 먼저 나온 패턴을 보고
+    """
+
+    def __init__(self, patterns: Tuple[str, ...]):
+        self.patterns = patterns
+        self.extensions: Dict[str, int] = {}  # ".pem" -> pattern index
+        self.names: Dict[str, int] = {}  # ".env" -> pattern index
+        globs: List[str] = []
+        # glob 패턴별 반드시 포함되어야 하는 가장 긴 고정 문자열 (하나라도 ""이면 사전 필터 불가)
+        self.required: List[str] = []
+
+        for index, pattern in enumerate(patterns):
+            lowered = pattern.lower()
+            suffix = lowered[1:]
+            if lowered.startswith("*.") and "." not in suffix[1:] and not (set(suffix) & _GLOB_META):
+                self.extensions.setdefault(suffix, index)
+            elif not (set(lowered) & _GLOB_META):
+                self.names.setdefault(lowered, index)
+            else:
+                globs.append(f"(?P<p{index}>{fnmatch.translate(pattern)})")
+                self.required.append(max(_GLOB_SPLIT_RE.split(lowered), key=len))
+
+        self.combined: Optional[re.Pattern] = re.compile("|".join(globs), re.IGNORECASE) if globs else None
+        self.gate: Optional[re.Pattern] = None
+        if globs and all(self.required):
+            self.gate = re.compile("|".join(re.escape(literal) for literal in self.required))
+
+    def _glob_index(self, value: str) -> Optional[int]:
+        match = self.combined.match(value)
+        if match is None:
+            return None
+        # 교대 정규식은 앞쪽 대안부터 시도하므로 lastgroup이 가장 앞선 glob 패턴
+        return int(match.lastgroup[1:])
+
+    def match(self, filepath: str) -> Optional[int]:
+        """
+        Return the index of the first pattern matching filepath, or None.
+
+        Args:
+            filepath: Changed file path (repo-relative, "/" separated)
+        """
+        lowered = filepath.lower()
+        name = lowered[lowered.rfind("/") + 1:]
+
+        candidates = []
+        dot = name.rfind(".")
+        if dot != -1 and name[dot:] in self.extensions:
+            candidates.append(self.extensions[name[dot:]])
+        if name in self.names:
+            candidates.append(self.names[name])
+        if lowered in self.names:
+            candidates.append(self.names[lowered])
+
+        if self.combined is not None and (self.gate is None or self.gate.search(lowered)):
+            for value in (name, lowered):
+                index = self._glob_index(value)
+                if index is not None:
+                    candidates.append(index)
+
+        return min(candidates) if candidates else None
+
+
+@lru_cache(maxsize=32)
+def _compile(patterns: Tuple[str, ...]) -> FileMatcher:
+    return FileMatcher(patterns)
+
+
+def compile_file_patterns(file_patterns: List[str]) -> FileMatcher:
+    """
+    Compile file patterns once (cached by pattern list) for reuse across runs.
+
+    Args:
+        file_patterns: List of glob-style patterns (from config)
+
+    Returns:
+        FileMatcher instance
+    """
+    return _compile(tuple(file_patterns))
+
+
 def detect_sensitive_files(changed_files: List[str], file_patterns: List[str]) -> List[Finding]:
     """
     Detect sensitive file patterns in changed files.
@@ -18,43 +110,30 @@ def detect_sensitive_files(changed_files: List[str], file_patterns: List[str]) -
         List of Finding objects for detected sensitive files
     """
     findings = []
+    if not file_patterns:
+        return findings
+
+    matcher = compile_file_patterns(file_patterns)
 
     for filepath in changed_files:
-        path = Path(filepath)
-
-        for pattern in file_patterns:
-            # Convert glob pattern to regex
-            # Simple conversion: * -> .*, ? -> .
-            regex_pattern = pattern.replace(".", r"\.").replace("*", ".*").replace("?", ".")
-            regex_pattern = f"^{regex_pattern}$"
-
-            try:
-                regex = re.compile(regex_pattern, re.IGNORECASE)
-            except re.error:
-                # Fallback to simple string matching
-                if pattern.lower() in filepath.lower():
-                    regex = None
-                    match = True
-                else:
-                    continue
-            else:
-                match = regex.match(path.name) or regex.match(filepath)
-
-            if match:
-                findings.append(
-                    Finding(
-                        kind="file",
-                        title=f"민감한 파일 감지: {pattern}",
-                        detail=f"파일: {filepath}",
-                        confidence=1.0,
-                        severity="critical",
-                        fix_now=(
-                            "1. git 추적에서 민감한 파일을 제거하세요\n"
-                            "2. .gitignore에 추가하여 향후 커밋을 방지하세요\n"
-                            "3. 이미 푸시했다면 git filter-branch나 BFG Repo-Cleaner를 사용하세요"
-                        ),
-                    )
-                )
-                break  # One finding per file is enough
+        index = matcher.match(filepath)
+        if index is None:
+            continue
+
+        # One finding per file is enough
+        findings.append(
+            Finding(
+                kind="file",
+                title=f"민감한 파일 감지: {matcher.patterns[index]}",
+                detail=f"파일: {filepath}",
+                confidence=1.0,
+                severity="critical",
+                fix_now=(
+                    "1. git 추적에서 민감한 파일을 제거하세요\n"
+                    "2. .gitignore에 추가하여 향후 커밋을 방지하세요\n"
+                    "3. 이미 푸시했다면 git filter-branch나 BFG Repo-Cleaner를 사용하세요"
+                ),
+            )
+        )
 
     return findings
@@ -0,0 +1,196 @@
+"""Process-pool secret scanning for very large pushes (sharded by file)."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Sequence, Tuple
+
+from ..diff_model import DiffModel, FileDiff
+from ..report.models import Finding
+from .secrets import compile_secret_patterns, detect_secrets_in_diff, scan_file_hits, secret_finding
+
+
+# 워커 1개당 샤드 수: 파일 크기 편차가 커도 코어가 놀지 않도록 잘게 나눔
+_SHARDS_PER_WORKER = 4
+
+
+def resolve_workers(config: dict) -> int:
+    """Number of worker processes to use (parallel_scan.max_workers, 0 = all cores)."""
+    max_workers = config.get("parallel_scan", {}).get("max_workers", 0) or os.cpu_count() or 1
+    return max(1, int(max_workers))
+
+
+def should_parallelize(added_lines: int, config: dict) -> bool:
+    """
+    Decide whether a scan is worth the process-pool startup cost.
+
+    Args:
+        added_lines: Number of added lines that would be scanned
+        config: Loaded configuration (uses parallel_scan)
+
+    Returns:
+        True only for large scans on a machine with more than one worker available
+    """
+    parallel_config = config.get("parallel_scan", {})
+    if not parallel_config.get("enabled", True):
+        return False
+    if added_lines < parallel_config.get("min_added_lines", 50_000):
+        return False
+    return resolve_workers(config) > 1
+
+
+def _scan_shard(
+    patterns: Tuple[str, ...], active: List[int], shard: List[Tuple[int, List[str]]]
+) -> List[Tuple[int, List[Tuple[int, int]]]]:
+    """
+    Worker entry point: scan the added lines of several files.
+
+    Args:
+        patterns: Secret patterns (compiled once per worker via the lru_cache)
+        active: Pattern indexes that passed the literal prefilter
+        shard: [(file_position, [added line text, ...]), ...]
+
+    Returns:
+        [(file_position, [(pattern_index, ordinal), ...]), ...]
+    """
+    scanner = compile_secret_patterns(list(patterns))
+    results = []
+    for position, lines in shard:
+        hits = scanner.scan(enumerate(lines), active)
+        results.append((position, [(index, ordinal) for index, ordinal, _ in hits]))
+    return results
+
+
+def _make_shards(
+    diff_model: DiffModel, file_diffs: Sequence[FileDiff], num_shards: int
+) -> List[List[Tuple[int, List[str]]]]:
+    """Split files into contiguous shards of roughly equal added-line count."""
+    text = diff_model.text
+    total = sum(f.added_count for f in file_diffs)
+    target = max(1, -(-total // num_shards))
+
+    shards: List[List[Tuple[int, List[str]]]] = []
+    current: List[Tuple[int, List[str]]] = []
+    current_lines = 0
+    for position, file_diff in enumerate(file_diffs):
+        if not file_diff.added_lines:
+            continue
+        current.append((position, [text[start:end] for _, _, start, end in file_diff.added_lines]))
+        current_lines += file_diff.added_count
+        if current_lines >= target:
+            shards.append(current)
+            current, current_lines = [], 0
+    if current:
+        shards.append(current)
+    return shards
+
+
+def scan_files_parallel(
+    diff_model: DiffModel,
+    file_diffs: Sequence[FileDiff],
+    secret_patterns: List[str],
+    active: List[int],
+    max_workers: int,
+) -> List[List[Tuple[int, int]]]:
+    """
+    Scan file sections in a process pool.
+
+    Results don't depend on scheduling: they are placed back by file position,
+    so callers get exactly what scan_file_hits would return file by file.
+
+    Args:
+        diff_model: Parsed diff that owns file_diffs
+        file_diffs: File sections to scan
+        secret_patterns: List of regex patterns to detect (from config)
+        active: Pattern indexes to consider
+        max_workers: Worker process count
+
+    Returns:
+        One list of (pattern_index, ordinal) hits per file, in file_diffs order
+
+    Raises:
+        OSError / BrokenProcessPool: the pool could not be started or a worker died
+    """
+    results: List[List[Tuple[int, int]]] = [[] for _ in file_diffs]
+    if not active:
+        return results
+
+    shards = _make_shards(diff_model, file_diffs, max_workers * _SHARDS_PER_WORKER)
+    patterns = tuple(secret_patterns)
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(shards)) or 1) as pool:
+        futures = [pool.submit(_scan_shard, patterns, active, shard) for shard in shards]
+        for future in futures:
+            for position, hits in future.result():
+                results[position] = hits
+
+    return results
+
+
+def scan_files(
+    diff_model: DiffModel,
+    file_diffs: Sequence[FileDiff],
+    secret_patterns: List[str],
+    active: List[int],
+    config: dict,
+) -> List[List[Tuple[int, int]]]:
+    """
+    Scan file sections, in a process pool when the scan is large enough.
+
+    Small pushes (below parallel_scan.min_added_lines) stay in-process; if the
+    pool can't be used (e.g. restricted sandbox) the scan falls back to serial.
+
+    Returns:
+        One list of (pattern_index, ordinal) hits per file, in file_diffs order
+    """
+    added_lines = sum(f.added_count for f in file_diffs)
+    if should_parallelize(added_lines, config):
+        try:
+            return scan_files_parallel(diff_model, file_diffs, secret_patterns, active, resolve_workers(config))
+        except (OSError, BrokenProcessPool):
+            pass
+
+    scanner = compile_secret_patterns(secret_patterns)
+    return [scan_file_hits(scanner, diff_model, file_diff, active) for file_diff in file_diffs]
+
+
+def detect_secrets_parallel(diff_model: DiffModel, secret_patterns: List[str], config: dict) -> List[Finding]:
+    """
+    Detect secrets with file-sharded worker processes for very large diffs.
+
+    Findings are identical (content and order) to detect_secrets_in_diff, which
+    is used directly below the parallel_scan threshold.
+
+    Args:
+        diff_model: Parsed diff
+        secret_patterns: List of regex patterns to detect (from config)
+        config: Loaded configuration (uses parallel_scan)
+
+    Returns:
+        List of Finding objects for detected secrets
+    """
+    added_lines = sum(f.added_count for f in diff_model.files)
+    if not should_parallelize(added_lines, config):
+        return detect_secrets_in_diff(diff_model, secret_patterns)
+
+    scanner = compile_secret_patterns(secret_patterns)
+    active = scanner.active_patterns(diff_model.text)
+    if not active:
+        return []
+
+    text = diff_model.text
+    hits: List[Tuple[int, int, str]] = []
+    per_file = scan_files(diff_model, diff_model.files, secret_patterns, active, config)
+    for file_diff, file_hits in zip(diff_model.files, per_file):
+        for pattern_index, ordinal in file_hits:
+            line_index, _, start, end = file_diff.added_lines[ordinal]
+            hits.append((pattern_index, line_index, text[start:end]))
+
+    if diff_model.stray_added_lines:
+        stray = ((line_index, text[start:end]) for line_index, _, start, end in diff_model.stray_added_lines)
+        hits.extend(scanner.scan(stray, active))
+
+    # 단일 프로세스 스캔과 같은 순서: 패턴 순, 그다음 diff 내 위치 순
+    hits.sort(key=lambda hit: (hit[0], hit[1]))
+
+    return [secret_finding(scanner.patterns[index], line_num, line) for index, line_num, line in hits]
@@ -0,0 +1,157 @@
+"""Content-addressed cache of hard-policy secret scans, keyed by git blob SHA."""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from ..cache import SqliteCache
+from ..diff_model import DiffModel, FileDiff
+from ..report.models import Finding
+from .parallel import scan_files
+from .secrets import compile_secret_patterns, scan_file_hits, secret_finding
+
+
+# 캐시 결과 포맷/스캐너 동작이 바뀌면 올려서 기존 항목을 무효화
+SCAN_CACHE_VERSION = 1
+
+_FULL_SHA_RE = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+_ZERO_SHA_RE = re.compile(r"^0+$")
+
+
+def policy_hash(secret_patterns: List[str]) -> str:
+    """Stable hash of the compiled secret policy (patterns + cache format version)."""
+    payload = json.dumps({"version": SCAN_CACHE_VERSION, "secret_patterns": list(secret_patterns)})
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def blob_key(file_diff: FileDiff) -> Optional[str]:
+    """
+    Cache key for a file section: "<old_blob>..<new_blob>" with full SHAs.
+
+    Added lines of a section are fully determined by the old/new blob pair, so the
+    pair is what makes the result content-addressed. Abbreviated SHAs (pasted
+    diffs) and deleted files are not cached.
+
+    Sections without hunks are not cached either: a header-only section (patch
+    skipped by diff_stream.max_file_bytes / max_retained_bytes) carries the full
+    blob pair but none of its lines, so storing its empty result would mark
+    content that was never read as clean.
+    """
+    if not file_diff.hunks:
+        return None
+    old_blob, new_blob = file_diff.old_blob, file_diff.new_blob
+    if not old_blob or not new_blob:
+        return None
+    if not _FULL_SHA_RE.match(old_blob) or not _FULL_SHA_RE.match(new_blob):
+        return None
+    if _ZERO_SHA_RE.match(new_blob):
+        return None
+    return f"{old_blob}..{new_blob}"
+
+
+def open_scan_cache(config: dict, secret_patterns: List[str]) -> Optional[SqliteCache]:
+    """
+    Open the scan cache under the report dir, dropping entries of older policies.
+
+    Args:
+        config: Loaded configuration (uses report_dir and scan_cache)
+        secret_patterns: Current hard_abort.secret_patterns
+
+    Returns:
+        SqliteCache, or None when disabled or the cache file can't be opened
+    """
+    cache_config = config.get("scan_cache", {})
+    if not cache_config.get("enabled", True):
+        return None
+
+    report_dir = config.get("report_dir")
+    if not report_dir:
+        return None
+
+    try:
+        cache = SqliteCache(
+            Path(report_dir) / ".cache" / "scan_cache.sqlite",
+            max_bytes=cache_config.get("max_bytes", 64 * 1024 * 1024),
+        )
+        # hard_abort 패턴이 바뀌면 이전 정책으로 만든 결과는 자동 폐기
+        current = policy_hash(secret_patterns)
+        cache.delete_prefix("secret:", keep_prefix=f"secret:{current}:")
+        return cache
+    except Exception:
+        return None
+
+
+def detect_secrets_cached(
+    diff_model: DiffModel, secret_patterns: List[str], cache: SqliteCache, config: Optional[dict] = None
+) -> List[Finding]:
+    """
+    Detect secrets, scanning only blob pairs that were never scanned under this policy.
+
+    Findings are identical (content and order) to detect_secrets_in_diff.
+
+    Args:
+        diff_model: Parsed diff
+        secret_patterns: List of regex patterns to detect (from config)
+        cache: Opened scan cache
+        config: Loaded configuration; when given, large sets of cache misses are
+            scanned in a process pool (parallel_scan)
+
+    Returns:
+        List of Finding objects for detected secrets
+    """
+    scanner = compile_secret_patterns(secret_patterns)
+    prefix = f"secret:{policy_hash(secret_patterns)}:"
+    text = diff_model.text
+
+    keyed = []
+    for file_diff in diff_model.files:
+        key = blob_key(file_diff)
+        keyed.append((file_diff, prefix + key if key else None))
+
+    try:
+        cached = cache.get_many([key for _, key in keyed if key])
+    except Exception:
+        # 캐시를 읽을 수 없으면 (database is locked 등) 모든 파일을 새로 스캔
+        cached = {}
+
+    misses = [file_diff for file_diff, key in keyed if key not in cached]
+    scanned = {}
+    if misses:
+        active = scanner.active_patterns(text)
+        if config is not None:
+            miss_hits = scan_files(diff_model, misses, secret_patterns, active, config)
+        else:
+            miss_hits = [scan_file_hits(scanner, diff_model, file_diff, active) for file_diff in misses]
+        scanned = {id(file_diff): file_hits for file_diff, file_hits in zip(misses, miss_hits)}
+
+    to_store = {}
+    hits: List[Tuple[int, int, str]] = []
+
+    for file_diff, key in keyed:
+        if key in cached:
+            file_hits = cached[key]
+        else:
+            file_hits = scanned[id(file_diff)]
+            if key:
+                to_store[key] = file_hits
+
+        for pattern_index, ordinal in file_hits:
+            line_index, _, start, end = file_diff.added_lines[ordinal]
+            hits.append((pattern_index, line_index, text[start:end]))
+
+    # Stray lines outside any file section have no blob identity: always scan
+    if diff_model.stray_added_lines:
+        stray = ((line_index, text[start:end]) for line_index, _, start, end in diff_model.stray_added_lines)
+        hits.extend(scanner.scan(stray))
+
+    try:
+        cache.put_many(to_store)
+    except Exception:
+        pass  # 저장 실패는 다음 실행에서 다시 스캔할 뿐이므로 무시
+
+    # Same order as the single-pass scan: by pattern, then by position in the diff
+    hits.sort(key=lambda hit: (hit[0], hit[1]))
+
+    return [secret_finding(scanner.patterns[index], line_num, line) for index, line_num, line in hits]
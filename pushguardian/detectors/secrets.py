@@ -1,10 +1,155 @@
 """Secret pattern detection (hard abort rules)."""
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+from ..diff_model import DiffModel, FileDiff
 from ..report.models import Finding
 
 
+# 정규식 메타문자가 하나도 없으면 평범한 토큰(sk-, AKIA, ghp_ 등)으로 보고 str 검색을 사용
+_REGEX_META = set(".^$*+?{}[]\\|()")
+
+# 교대 정규식으로 합치면 의미가 바뀌는 패턴 (번호 역참조, 전역 inline flag)
+_UNGATEABLE = re.compile(r"\\\d|\(\?[aiLmsux]+\)")
+
+
+class SecretScanner:
+    """
+    Compiled scanner that matches every secret pattern in a single pass over the lines.
+
+    - 모든 패턴을 named group 교대(alternation) 정규식 하나로 합쳐, 라인당 한 번만 검사
+    - 평범한 토큰 패턴은 전체 텍스트에 대한 리터럴 사전 필터로 아예 등장하지 않으면 제외
+    - 후보 라인에서만 패턴별 매치 개수를 세어, 기존 구현과 동일한 Finding을 만든다
+    """
+
+    def __init__(self, patterns: Tuple[str, ...]):
+        self.patterns = patterns
+        self.literals: List[str | None] = []
+        self.regexes: List[re.Pattern] = []
+
+        for pattern in patterns:
+            # Create regex pattern (case-sensitive for most secrets)
+            try:
+                regex = re.compile(pattern)
+            except re.error:
+                # If pattern is not valid regex, treat as literal string
+                regex = re.compile(re.escape(pattern))
+
+            is_literal = regex.pattern == re.escape(pattern) or not (set(pattern) & _REGEX_META)
+            self.literals.append(pattern if is_literal and pattern else None)
+            self.regexes.append(regex)
+
+        self.combined = self._build_gate(range(len(patterns)))
+
+    def _build_gate(self, indexes: Iterable[int]) -> re.Pattern | None:
+        """
+        Combine patterns into one named-group alternation used as a per-line gate.
+
+        Returns None when the patterns can't be safely combined (backreferences or
+        global inline flags), in which case every added line is a candidate.
+        """
+        indexes = list(indexes)
+        if any(_UNGATEABLE.search(self.regexes[i].pattern) for i in indexes):
+            return None
+        try:
+            return re.compile("|".join(f"(?P<p{i}>{self.regexes[i].pattern})" for i in indexes))
+        except re.error:
+            return None
+
+    def active_patterns(self, text: str) -> List[int]:
+        """Return indexes of patterns that can possibly match somewhere in text (literal prefilter)."""
+        return [
+            index
+            for index, literal in enumerate(self.literals)
+            if literal is None or literal in text
+        ]
+
+    def _count(self, index: int, line: str) -> int:
+        """Count non-overlapping matches of one pattern in a line (same semantics as finditer)."""
+        literal = self.literals[index]
+        if literal is not None:
+            return line.count(literal)
+        return sum(1 for _ in self.regexes[index].finditer(line))
+
+    def scan(
+        self, lines: Iterable[Tuple[int, str]], active: List[int] | None = None
+    ) -> List[Tuple[int, int, str]]:
+        """
+        Scan added lines once for all patterns.
+
+        Args:
+            lines: Iterable of (line_num, line) pairs, already restricted to added lines
+            active: Pattern indexes to consider (defaults to all)
+
+        Returns:
+            List of (pattern_index, line_num, line) hits, one per match,
+            ordered by pattern then line (the order detect_secrets has always reported)
+        """
+        if active is None:
+            active = list(range(len(self.patterns)))
+        if not active:
+            return []
+
+        gate = self.combined if len(active) == len(self.patterns) else self._build_gate(active)
+
+        hits_by_pattern: dict[int, List[Tuple[int, int, str]]] = {i: [] for i in active}
+
+        for line_num, line in lines:
+            if gate is not None and not gate.search(line):
+                continue
+            for index in active:
+                for _ in range(self._count(index, line)):
+                    hits_by_pattern[index].append((index, line_num, line))
+
+        hits: List[Tuple[int, int, str]] = []
+        for index in sorted(hits_by_pattern):
+            hits.extend(hits_by_pattern[index])
+        return hits
+
+
+@lru_cache(maxsize=32)
+def _compile(patterns: Tuple[str, ...]) -> SecretScanner:
+    return SecretScanner(patterns)
+
+
+def compile_secret_patterns(secret_patterns: List[str]) -> SecretScanner:
+    """
+    Compile secret patterns once (cached by pattern list) for reuse across runs.
+
+    Args:
+        secret_patterns: List of regex patterns to detect (from config)
+
+    Returns:
+        SecretScanner instance
+    """
+    return _compile(tuple(secret_patterns))
+
+
+def secret_finding(pattern: str, line_num: int, line: str) -> Finding:
+    """Build the Finding reported for a single secret match."""
+    return Finding(
+        kind="secret",
+        title=f"시크릿 패턴 감지: {pattern}",
+        detail=f"라인 {line_num}: {line[:100]}...",
+        confidence=1.0,
+        severity="critical",
+        fix_now=(
+            "1. 코드에서 시크릿을 즉시 제거하세요\n"
+            "2. 노출된 자격증명을 교체/폐기하세요\n"
+            "3. 환경 변수나 시크릿 매니저를 사용하세요"
+        ),
+    )
+
+
+def _iter_added_lines(diff_text: str) -> Iterable[Tuple[int, str]]:
+    """Yield (line_num, line) for added lines (+) of a diff."""
+    for line_num, line in enumerate(diff_text.split("\n"), start=1):
+        # Only check added lines
+        if line.startswith("+"):
+            yield line_num, line
+
+
 def detect_secrets(diff_text: str, secret_patterns: List[str]) -> List[Finding]:
     """
     Detect secret patterns in diff text.
@@ -16,37 +161,62 @@ def detect_secrets(diff_text: str, secret_patterns: List[str]) -> List[Finding]:
     Returns:
         List of Finding objects for detected secrets
     """
-    findings = []
+    scanner = compile_secret_patterns(secret_patterns)
 
-    for pattern in secret_patterns:
-        # Create regex pattern (case-sensitive for most secrets)
-        try:
-            regex = re.compile(pattern)
-        except re.error:
-            # If pattern is not valid regex, treat as literal string
-            regex = re.compile(re.escape(pattern))
+    # 리터럴 사전 필터: 전체 diff에 한 번도 등장하지 않는 토큰은 라인 스캔에서 제외
+    active = scanner.active_patterns(diff_text)
+    if not active:
+        return []
 
-        # Search in diff (only in added lines: +)
-        for line_num, line in enumerate(diff_text.split("\n"), start=1):
-            # Only check added lines
-            if not line.startswith("+"):
-                continue
+    hits = scanner.scan(_iter_added_lines(diff_text), active)
+
+    return [secret_finding(scanner.patterns[index], line_num, line) for index, line_num, line in hits]
+
+
+def detect_secrets_in_diff(
+    diff_model: DiffModel, secret_patterns: List[str], paths: List[str] | None = None
+) -> List[Finding]:
+    """
+    Detect secret patterns using an already-parsed DiffModel (no re-splitting of the diff).
+
+    Args:
+        diff_model: Parsed diff shared through GuardianState
+        secret_patterns: List of regex patterns to detect (from config)
+        paths: Restrict the scan to these files (defaults to every added line)
+
+    Returns:
+        List of Finding objects for detected secrets
+    """
+    scanner = compile_secret_patterns(secret_patterns)
+
+    active = scanner.active_patterns(diff_model.text)
+    if not active:
+        return []
+
+    lines = ((added.line_index, added.text) for added in diff_model.iter_added_lines(paths))
+    hits = scanner.scan(lines, active)
 
-            matches = regex.finditer(line)
-            for match in matches:
-                findings.append(
-                    Finding(
-                        kind="secret",
-                        title=f"시크릿 패턴 감지: {pattern}",
-                        detail=f"라인 {line_num}: {line[:100]}...",
-                        confidence=1.0,
-                        severity="critical",
-                        fix_now=(
-                            "1. 코드에서 시크릿을 즉시 제거하세요\n"
-                            "2. 노출된 자격증명을 교체/폐기하세요\n"
-                            "3. 환경 변수나 시크릿 매니저를 사용하세요"
-                        ),
-                    )
-                )
-
-    return findings
+    return [secret_finding(scanner.patterns[index], line_num, line) for index, line_num, line in hits]
+
+
+def scan_file_hits(
+    scanner: SecretScanner, diff_model: DiffModel, file_diff: FileDiff, active: List[int] | None = None
+) -> List[Tuple[int, int]]:
+    """
+    Scan one file section and return position-independent hits.
+
+    Args:
+        scanner: Compiled scanner
+        diff_model: Parsed diff that owns file_diff
+        file_diff: File section to scan
+        active: Pattern indexes to consider (defaults to all)
+
+    Returns:
+        List of (pattern_index, ordinal) where ordinal indexes file_diff.added_lines,
+        so results stay valid wherever the file appears in a later diff
+    """
+    text = diff_model.text
+    lines = (
+        (ordinal, text[start:end]) for ordinal, (_, _, start, end) in enumerate(file_diff.added_lines)
+    )
+    return [(index, ordinal) for index, ordinal, _ in scanner.scan(lines, active)]
@@ -1,7 +1,9 @@
 """Stack inference from file extensions and paths."""
 
-from pathlib import Path
-from typing import List, Set
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 
 
 STACK_INDICATORS = {
@@ -57,39 +59,109 @@ STACK_INDICATORS = {
 }
 
 
-def guess_stacks(changed_files: List[str]) -> Set[str]:
+class StackIndex:
+    """
+    Lookup tables built once from stack indicators.
+
+    - 확장자 → 스택, 파일 이름 → 스택은 dict 조회 한 번
+    - 경로 패턴("src/main/java/" 등)은 디렉터리 세그먼트 trie로 저장하여,
+      경로의 각 디렉터리 위치에서 trie를 따라가며 일치하는 패턴을 찾는다
+    """
+
+    def __init__(self, indicators: Dict[str, dict]):
+        self.by_extension: Dict[str, Set[str]] = {}
+        self.by_filename: Dict[str, Set[str]] = {}
+        # 노드: (자식 dict, 이 노드에서 끝나는 패턴의 스택 set)
+        self.path_trie: Tuple[dict, Set[str]] = ({}, set())
+
+        for stack_name, stack in indicators.items():
+            for ext in stack.get("extensions", []):
+                self.by_extension.setdefault(ext.lower(), set()).add(stack_name)
+            for filename in stack.get("files", []):
+                self.by_filename.setdefault(filename.lower(), set()).add(stack_name)
+            for path_pattern in stack.get("paths", []):
+                segments = [seg for seg in path_pattern.lower().split("/") if seg]
+                if not segments:
+                    continue
+                node = self.path_trie
+                for seg in segments:
+                    node = node[0].setdefault(seg, ({}, set()))
+                node[1].add(stack_name)
+
+    def classify(self, filepath: str) -> Set[str]:
+        """Stacks indicated by a single changed file path."""
+        lowered = filepath.lower()
+        segments = lowered.split("/")
+        filename = segments[-1]
+        stacks: Set[str] = set()
+
+        ext = os.path.splitext(filename)[1]
+        if ext in self.by_extension:
+            stacks |= self.by_extension[ext]
+        if filename in self.by_filename:
+            stacks |= self.by_filename[filename]
+
+        # 디렉터리 세그먼트만 검사 (마지막 세그먼트는 파일 이름)
+        children = self.path_trie[0]
+        if children:
+            directories = segments[:-1]
+            for i in range(len(directories)):
+                node = children.get(directories[i])
+                j = i + 1
+                while node is not None:
+                    stacks |= node[1]
+                    if j >= len(directories):
+                        break
+                    node = node[0].get(directories[j])
+                    j += 1
+
+        return stacks
+
+
+@lru_cache(maxsize=8)
+def _build_index(custom_stacks_json: str) -> StackIndex:
+    indicators = {name: dict(stack) for name, stack in STACK_INDICATORS.items()}
+    for stack_name, stack in json.loads(custom_stacks_json).items():
+        if stack_name in indicators:
+            # 기존 스택 확장: 지시자 목록을 합친다
+            merged = indicators[stack_name]
+            for key in ("extensions", "paths", "files"):
+                merged[key] = list(merged.get(key, [])) + list(stack.get(key, []) or [])
+        else:
+            indicators[stack_name] = stack
+    return StackIndex(indicators)
+
+
+def get_stack_index(custom_stacks: Optional[Dict[str, dict]] = None) -> StackIndex:
+    """
+    Return the (cached) index for built-in indicators plus user-defined stacks.
+
+    Args:
+        custom_stacks: {stack_name: {"extensions": [...], "paths": [...], "files": [...]}}
+            from config; an existing stack name extends the built-in indicators
+
+    Returns:
+        StackIndex instance
+    """
+    return _build_index(json.dumps(custom_stacks or {}, sort_keys=True))
+
+
+def guess_stacks(changed_files: List[str], custom_stacks: Optional[Dict[str, dict]] = None) -> Set[str]:
     """
     Guess which stacks/technologies are touched based on changed files.
 
     Args:
         changed_files: List of file paths that changed
+        custom_stacks: User-defined stack indicators (config custom_stacks)
 
     Returns:
         Set of stack names (e.g., {'react', 'typescript', 'docker'})
     """
-    detected_stacks = set()
+    index = get_stack_index(custom_stacks)
 
+    detected_stacks = set()
     for filepath in changed_files:
-        path = Path(filepath)
-        ext = path.suffix.lower()
-        filename = path.name.lower()
-
-        # Check each stack
-        for stack_name, indicators in STACK_INDICATORS.items():
-            # Check extension
-            if ext in indicators["extensions"]:
-                detected_stacks.add(stack_name)
-                continue
-
-            # Check path patterns
-            for path_pattern in indicators["paths"]:
-                if path_pattern.lower() in filepath.lower():
-                    detected_stacks.add(stack_name)
-                    break
-
-            # Check specific files
-            if filename in [f.lower() for f in indicators["files"]]:
-                detected_stacks.add(stack_name)
+        detected_stacks |= index.classify(filepath)
 
     return detected_stacks
 
@@ -0,0 +1,332 @@
+"""Structured, single-pass model of a unified git diff shared by every node."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+_DIFF_GIT_LINE_RE = re.compile(r"^diff --git .*$", re.MULTILINE)
+
+
+class AddedLine(NamedTuple):
+    """An added (+) line of the diff."""
+
+    line_index: int  # 1-based line number inside the diff text (what reports show as "라인 N")
+    lineno: int  # line number in the new file (0 if the hunk header was missing/invalid)
+    path: str  # file the line belongs to ("" for stray lines outside any file section)
+    text: str  # raw line including the leading "+"
+
+
+@dataclass
+class DiffHunk:
+    """One @@ hunk of a file diff."""
+
+    old_start: int
+    old_count: int
+    new_start: int
+    new_count: int
+    start: int  # offset of the "@@" line in DiffModel.text
+    end: int = 0  # offset just past the last line of the hunk
+    # 연속으로 추가/삭제된 라인 구간: [(start_line, end_line), ...] (추가=새 파일 기준, 삭제=이전 파일 기준)
+    added: List[Tuple[int, int]] = field(default_factory=list)
+    removed: List[Tuple[int, int]] = field(default_factory=list)
+
+    @property
+    def new_range(self) -> Tuple[int, int]:
+        """New-file line range covered by the hunk (same convention as parse_diff_hunks)."""
+        return (self.new_start, self.new_start + self.new_count - 1)
+
+
+@dataclass
+class FileDiff:
+    """Diff section of a single file (from "diff --git" to the next one)."""
+
+    path: str
+    old_path: Optional[str]
+    start: int  # offset of the "diff --git" line in DiffModel.text
+    end: int = 0  # offset just past the last line of the section
+    status: str = "modified"  # added | deleted | renamed | modified
+    is_binary: bool = False
+    old_blob: Optional[str] = None  # from the "index <old>..<new>" line
+    new_blob: Optional[str] = None
+    hunks: List[DiffHunk] = field(default_factory=list)
+    # (line_index, lineno, start_offset, end_offset) for every added line
+    added_lines: List[Tuple[int, int, int, int]] = field(default_factory=list)
+    removed_count: int = 0
+
+    @property
+    def added_count(self) -> int:
+        return len(self.added_lines)
+
+
+@dataclass
+class DiffModel:
+    """
+    Parsed diff, built once per run.
+
+    Offsets are character offsets into `text`, so slicing never re-parses or
+    re-splits the whole diff.
+    """
+
+    text: str
+    files: List[FileDiff] = field(default_factory=list)
+    # "+" lines that appear outside any "diff --git" section (e.g. a pasted snippet)
+    stray_added_lines: List[Tuple[int, int, int, int]] = field(default_factory=list)
+
+    def paths(self) -> List[str]:
+        """Changed file paths in diff order."""
+        return [f.path for f in self.files if f.path]
+
+    def file(self, path: str) -> Optional[FileDiff]:
+        """First file section for path, or None."""
+        for file_diff in self.files:
+            if file_diff.path == path:
+                return file_diff
+        return None
+
+    def file_text(self, path: str) -> str:
+        """Raw diff text of a single file section ("" if the file isn't in the diff)."""
+        file_diff = self.file(path)
+        if file_diff is None:
+            return ""
+        return self.text[file_diff.start:file_diff.end]
+
+    def select(self, paths: Iterable[str]) -> "DiffModel":
+        """
+        View of the model restricted to some files.
+
+        The text and offsets are shared, so line numbers reported from the view
+        are the same as in the full diff. Stray lines are kept.
+        """
+        wanted = set(paths)
+        return DiffModel(
+            text=self.text,
+            files=[f for f in self.files if f.path in wanted],
+            stray_added_lines=self.stray_added_lines,
+        )
+
+    def hunk_ranges(self) -> Dict[str, List[Tuple[int, int]]]:
+        """New-file line ranges per file: {filepath: [(start_line, end_line), ...]}."""
+        return {f.path: [h.new_range for h in f.hunks] for f in self.files if f.path}
+
+    def iter_added_lines(self, paths: Optional[List[str]] = None) -> Iterator[AddedLine]:
+        """
+        Iterate added lines in diff order.
+
+        Args:
+            paths: Restrict to these files (stray lines are only included when paths is None)
+        """
+        wanted = set(paths) if paths is not None else None
+        text = self.text
+
+        files = [f for f in self.files if wanted is None or f.path in wanted]
+
+        if wanted is None and self.stray_added_lines:
+            # stray 라인이 파일 섹션 사이에 끼어 있을 수 있으므로 diff 순서대로 병합
+            records = [(rec, "") for rec in self.stray_added_lines]
+            records.extend((rec, f.path) for f in files for rec in f.added_lines)
+            records.sort(key=lambda item: item[0][0])
+            for (line_index, lineno, start, end), path in records:
+                yield AddedLine(line_index, lineno, path, text[start:end])
+            return
+
+        # 파일 섹션은 이미 diff 순서이므로 그대로 순회
+        for file_diff in files:
+            for line_index, lineno, start, end in file_diff.added_lines:
+                yield AddedLine(line_index, lineno, file_diff.path, text[start:end])
+
+
+def _parse_diff_git_line(line: str) -> Tuple[str, Optional[str]]:
+    """Extract (new_path, old_path) from a "diff --git a/x b/y" line."""
+    parts = line.split()
+    if len(parts) >= 4:
+        # Extract b/path (new version), remove 'a/' / 'b/' prefix
+        return parts[3][2:], parts[2][2:]
+    return "", None
+
+
+def parse_diff(diff_text: str) -> DiffModel:
+    """
+    Parse a unified git diff into a DiffModel in a single pass.
+
+    The parser is lenient: pasted snippets without headers, bare "@@" lines and
+    trailing-whitespace-stripped context lines are all accepted.
+
+    Args:
+        diff_text: Git diff output
+
+    Returns:
+        DiffModel referencing diff_text (no copies of the text are kept)
+    """
+    model = DiffModel(text=diff_text)
+
+    current_file: Optional[FileDiff] = None
+    current_hunk: Optional[DiffHunk] = None
+    in_hunk = False
+    old_left = new_left = -1  # remaining lines in the current hunk (-1 = unknown)
+    old_line = new_line = 0
+
+    offset = 0
+    for line_index, line in enumerate(diff_text.split("\n"), start=1):
+        line_start = offset
+        line_end = offset + len(line)
+        offset = line_end + 1
+
+        if in_hunk:
+            marker = line[:1]
+            if marker in ("+", "-", " ", "\\") or line == "":
+                if marker == "+":
+                    record = (line_index, new_line, line_start, line_end)
+                    if current_file is not None:
+                        current_file.added_lines.append(record)
+                    else:
+                        model.stray_added_lines.append(record)
+                    if current_hunk is not None:
+                        _extend_run(current_hunk.added, new_line)
+                        new_line += 1
+                        new_left -= 1
+                elif marker == "-":
+                    if current_file is not None:
+                        current_file.removed_count += 1
+                    if current_hunk is not None:
+                        _extend_run(current_hunk.removed, old_line)
+                        old_line += 1
+                        old_left -= 1
+                elif marker != "\\" and current_hunk is not None:
+                    old_line += 1
+                    new_line += 1
+                    old_left -= 1
+                    new_left -= 1
+
+                if current_hunk is not None:
+                    current_hunk.end = min(offset, len(diff_text))
+                    if old_left <= 0 and new_left <= 0:
+                        in_hunk = False
+                continue
+
+            # Hunk ended by a non-hunk line: fall through to header handling
+            in_hunk = False
+
+        if line.startswith("diff --git"):
+            if current_file is not None:
+                current_file.end = line_start
+            path, old_path = _parse_diff_git_line(line)
+            current_file = FileDiff(path=path, old_path=old_path, start=line_start)
+            current_hunk = None
+            model.files.append(current_file)
+            continue
+
+        if line.startswith("@@"):
+            match = HUNK_HEADER_RE.match(line)
+            in_hunk = True
+            if match and current_file is not None:
+                old_start = int(match.group(1))
+                old_count = int(match.group(2)) if match.group(2) is not None else 1
+                new_start = int(match.group(3))
+                new_count = int(match.group(4)) if match.group(4) is not None else 1
+                current_hunk = DiffHunk(
+                    old_start=old_start,
+                    old_count=old_count,
+                    new_start=new_start,
+                    new_count=new_count,
+                    start=line_start,
+                    end=min(offset, len(diff_text)),
+                )
+                current_file.hunks.append(current_hunk)
+                old_line, new_line = old_start, new_start
+                old_left, new_left = old_count, new_count
+            else:
+                # Bare/invalid "@@": keep collecting +/- lines, but without line numbers
+                current_hunk = None
+                old_left = new_left = -1
+                new_line = 0
+            continue
+
+        if current_file is not None:
+            if line.startswith("new file mode"):
+                current_file.status = "added"
+            elif line.startswith("deleted file mode"):
+                current_file.status = "deleted"
+            elif line.startswith("rename from") or line.startswith("similarity index"):
+                current_file.status = "renamed"
+            elif line.startswith("index "):
+                blobs = line.split()[1].split("..")
+                if len(blobs) == 2:
+                    current_file.old_blob, current_file.new_blob = blobs
+            elif line.startswith("Binary files") or line.startswith("GIT binary patch"):
+                current_file.is_binary = True
+            elif line.startswith("--- ") or line.startswith("+++ "):
+                pass
+            elif line.startswith("+"):
+                current_file.added_lines.append((line_index, 0, line_start, line_end))
+            continue
+
+        if line.startswith("+") and not line.startswith("+++ "):
+            model.stray_added_lines.append((line_index, 0, line_start, line_end))
+
+    if current_file is not None:
+        current_file.end = len(diff_text)
+
+    return model
+
+
+def split_file_sections(diff_text: str) -> Dict[str, str]:
+    """
+    Split a diff into per-file sections without parsing hunks.
+
+    Only the "diff --git" header lines are scanned, so callers that need a few
+    files out of a large diff can parse just those sections later.
+
+    Args:
+        diff_text: Unified diff text
+
+    Returns:
+        {filepath: section text} in diff order (the first section wins for repeated paths)
+    """
+    sections: Dict[str, str] = {}
+    matches = list(_DIFF_GIT_LINE_RE.finditer(diff_text))
+    for i, match in enumerate(matches):
+        path, _ = _parse_diff_git_line(match.group())
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(diff_text)
+        if path and path not in sections:
+            sections[path] = diff_text[match.start():end]
+    return sections
+
+
+def iter_file_chunks(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Group a stream of diff lines into per-file diff sections.
+
+    Only one file section is buffered at a time, so memory stays bounded by the
+    largest single file diff instead of the whole push.
+
+    Args:
+        lines: Diff lines without trailing newlines (e.g. from a git subprocess)
+
+    Yields:
+        Diff text of one file section (lines before the first "diff --git" form their own chunk)
+    """
+    buffer: List[str] = []
+    for line in lines:
+        if line.startswith("diff --git") and buffer:
+            yield "\n".join(buffer) + "\n"
+            buffer = []
+        buffer.append(line)
+
+    if buffer:
+        yield "\n".join(buffer) + "\n"
+
+
+def chunk_header(chunk: str) -> str:
+    """Header part of a file section (everything before the first hunk)."""
+    idx = chunk.find("\n@@")
+    return chunk if idx == -1 else chunk[: idx + 1]
+
+
+def _extend_run(runs: List[Tuple[int, int]], line_no: int) -> None:
+    """Append line_no to the last run if contiguous, otherwise start a new run."""
+    if runs and runs[-1][1] == line_no - 1:
+        runs[-1] = (runs[-1][0], line_no)
+    else:
+        runs.append((line_no, line_no))
@@ -0,0 +1,150 @@
+"""Long-lived `git cat-file --batch` reader: object lookups over one pipe instead of a process per call."""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, NamedTuple, Optional
+
+
+# info_many 파이프라이닝 단위 (--batch-check 응답 한 줄 ≈ 50 bytes, 파이프 버퍼 64KB 이내)
+_PIPELINE_CHUNK = 512
+
+
+class ObjectInfo(NamedTuple):
+    """Result of a --batch-check lookup."""
+
+    sha: str
+    type: str  # blob | tree | commit | tag
+    size: int
+
+
+class GitObjectReader:
+    """
+    Persistent `git cat-file --batch-check` / `--batch` processes for one repository.
+
+    - 프로세스는 처음 사용할 때 한 번만 띄우고, 이후 요청은 같은 파이프로 처리
+    - rev 표현식(SHA, "HEAD:path", "origin/main" 등)을 그대로 사용할 수 있음
+    - 여러 스레드에서 호출해도 요청/응답이 섞이지 않도록 lock으로 보호
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._check: Optional[subprocess.Popen] = None
+        self._batch: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _start(self, mode: str) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["git", "cat-file", mode],
+            cwd=self.root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    @staticmethod
+    def _request(proc: subprocess.Popen, rev: str) -> bytes:
+        try:
+            proc.stdin.write(rev.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+        except OSError:
+            # cat-file exited (e.g. not a git repository)
+            return b""
+        return proc.stdout.readline()
+
+    @staticmethod
+    def _parse_header(header: bytes) -> Optional[ObjectInfo]:
+        parts = header.decode("utf-8", errors="replace").split()
+        # "<rev> missing" / "<rev> ambiguous" / "" (process died)
+        if len(parts) != 3 or not parts[2].isdigit():
+            return None
+        return ObjectInfo(parts[0], parts[1], int(parts[2]))
+
+    def info(self, rev: str) -> Optional[ObjectInfo]:
+        """SHA, type and size of an object, or None if it doesn't exist."""
+        if not rev or "\n" in rev:
+            return None
+        with self._lock:
+            if self._check is None:
+                self._check = self._start("--batch-check")
+            return self._parse_header(self._request(self._check, rev))
+
+    def info_many(self, revs: Iterable[str]) -> Dict[str, Optional[ObjectInfo]]:
+        """
+        Batch lookup: {rev: ObjectInfo or None}.
+
+        Requests are pipelined in chunks (write all, then read all) so a push
+        with thousands of files costs a handful of pipe round-trips.
+        """
+        revs = [rev for rev in dict.fromkeys(revs) if rev and "\n" not in rev]
+        found: Dict[str, Optional[ObjectInfo]] = {}
+        with self._lock:
+            if self._check is None:
+                self._check = self._start("--batch-check")
+            proc = self._check
+            # 출력 파이프 버퍼가 가득 차지 않도록 나눠서 요청
+            for i in range(0, len(revs), _PIPELINE_CHUNK):
+                chunk = revs[i:i + _PIPELINE_CHUNK]
+                try:
+                    proc.stdin.write(b"".join(rev.encode("utf-8") + b"\n" for rev in chunk))
+                    proc.stdin.flush()
+                except OSError:
+                    return {rev: None for rev in revs}
+                for rev in chunk:
+                    found[rev] = self._parse_header(proc.stdout.readline())
+        return found
+
+    def exists(self, rev: str) -> bool:
+        """True if rev resolves to an object."""
+        return self.info(rev) is not None
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Full SHA of rev (like `git rev-parse --verify`), or None."""
+        info = self.info(rev)
+        return info.sha if info else None
+
+    def size(self, rev: str) -> Optional[int]:
+        """Object size in bytes, or None."""
+        info = self.info(rev)
+        return info.size if info else None
+
+    def read(self, rev: str) -> Optional[bytes]:
+        """Raw object contents (e.g. a blob), or None if it doesn't exist."""
+        if not rev or "\n" in rev:
+            return None
+        with self._lock:
+            if self._batch is None:
+                self._batch = self._start("--batch")
+            info = self._parse_header(self._request(self._batch, rev))
+            if info is None:
+                return None
+            data = self._batch.stdout.read(info.size + 1)  # contents + trailing LF
+        return data[:-1]
+
+    def read_text(self, rev: str) -> Optional[str]:
+        """Object contents decoded as UTF-8 (invalid bytes replaced)."""
+        data = self.read(rev)
+        return data.decode("utf-8", errors="replace") if data is not None else None
+
+    def close(self) -> None:
+        """Stop the cat-file processes (they are restarted on next use)."""
+        with self._lock:
+            for proc in (self._check, self._batch):
+                if proc is None:
+                    continue
+                try:
+                    proc.stdin.close()
+                    proc.wait(timeout=5)
+                except Exception:
+                    proc.kill()
+                finally:
+                    proc.stdout.close()
+            self._check = self._batch = None
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,11 +1,139 @@
 """Git operations: diff extraction, file parsing, history scanning."""
 
+import heapq
+import queue
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional
+from .diff_model import DiffModel, iter_file_chunks, parse_diff
+from .git_objects import GitObjectReader
 
 
-def get_diff_range(local_ref: str, remote_ref: str, repo_root: Optional[str] = None) -> str:
+# Git's empty tree SHA - represents "no content"
+EMPTY_TREE = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+
+# 샤드 diff에서 git 호출 하나에 넣는 pathspec 총 길이 상한 (명령줄 길이 제한 대비, Windows 32K)
+_MAX_PATHSPEC_CHARS = 30_000
+
+# 샤드마다 소비되기 전까지 버퍼에 담아 둘 수 있는 파일 청크 수 (메모리 상한)
+_SHARD_BUFFER_CHUNKS = 64
+
+
+class ChangedFile(NamedTuple):
+    """One entry of `git diff --raw` (name + status, with blob SHAs)."""
+
+    status: str  # A | M | D | R | C | T
+    path: str  # new path for renames/copies
+    old_blob: Optional[str]  # None when added
+    new_blob: Optional[str]  # None when deleted
+    old_path: Optional[str] = None  # source path of renames/copies
+
+
+def _is_new_branch(remote_ref: str) -> bool:
+    """remote_ref is all zeros (new branch) or missing."""
+    return remote_ref == "0" * 40 or not remote_ref or remote_ref == "0"
+
+
+def get_new_branch_base(local_ref: str, repo_root: Optional[str] = None) -> str:
+    """
+    Find what a new branch should be diffed against: the boundary of commits the remote already has.
+
+    Uses `git rev-list --boundary <local> --not --remotes`, so only commits that
+    are not reachable from any remote-tracking ref are analyzed.
+
+    Args:
+        local_ref: Local commit SHA being pushed
+        repo_root: Git repository root (defaults to cwd)
+
+    Returns:
+        Base commit SHA, local_ref itself when nothing is new, or the empty tree
+        when no remote-tracking ref shares history with local_ref
+    """
+    cmd = ["git", "rev-list", "--boundary", local_ref, "--not", "--remotes"]
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=repo_root or None, encoding="utf-8")
+
+    if result.returncode != 0:
+        return EMPTY_TREE
+
+    lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+    if not lines:
+        # Every commit is already on a remote: nothing new to analyze
+        return local_ref
+
+    boundaries = [line[1:] for line in lines if line.startswith("-")]
+    if not boundaries:
+        # No shared history with any remote (first push of the repo)
+        return EMPTY_TREE
+    if len(boundaries) == 1:
+        return boundaries[0]
+
+    # Several boundaries (merges of remote branches): diff from their common ancestor
+    cmd = ["git", "merge-base", "--octopus", *boundaries]
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=repo_root or None, encoding="utf-8")
+    if result.returncode == 0 and result.stdout.strip():
+        return result.stdout.strip()
+
+    return EMPTY_TREE
+
+
+def resolve_push_base(local_ref: str, remote_ref: str, repo_root: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve the new-branch base of a push once, to pass as `base` to the diff helpers below.
+
+    Args:
+        local_ref: Local commit SHA being pushed
+        remote_ref: Remote commit SHA (or all zeros for new branch)
+        repo_root: Git repository root (defaults to cwd)
+
+    Returns:
+        get_new_branch_base result for a new branch, None for an existing branch
+    """
+    if _is_new_branch(remote_ref):
+        return get_new_branch_base(local_ref, repo_root)
+    return None
+
+
+def build_diff_command(
+    local_ref: str,
+    remote_ref: str,
+    repo_root: Optional[str] = None,
+    pathspecs: Optional[List[str]] = None,
+    base: Optional[str] = None,
+) -> List[str]:
+    """
+    Build the git diff command for the push range.
+
+    Args:
+        local_ref: Local commit SHA (e.g., HEAD)
+        remote_ref: Remote commit SHA (or all zeros for new branch)
+        repo_root: Git repository root (used to resolve the new-branch base)
+        pathspecs: Optional pathspecs appended after "--" (e.g. ":(exclude,literal)big.bin")
+        base: New-branch base from resolve_push_base (resolved here when omitted)
+
+    Returns:
+        git command as argument list
+    """
+    # Check if remote_ref is new branch (all zeros) or doesn't exist
+    if _is_new_branch(remote_ref):
+        # New branch: diff only what no remote-tracking ref has yet
+        base = base or get_new_branch_base(local_ref, repo_root)
+        cmd = ["git", "diff", "--full-index", base, local_ref]
+    else:
+        # Existing branch: normal diff
+        # --full-index: 전체 blob SHA를 남겨 blob 단위 스캔 캐시 키로 사용
+        cmd = ["git", "diff", "--full-index", f"{remote_ref}..{local_ref}"]
+
+    if pathspecs:
+        cmd += ["--", *pathspecs]
+    return cmd
+
+
+def get_diff_range(
+    local_ref: str, remote_ref: str, repo_root: Optional[str] = None, shards: int = 1, base: Optional[str] = None
+) -> str:
     """
     Get git diff for the push range.
 
@@ -13,6 +141,9 @@ def get_diff_range(local_ref: str, remote_ref: str, repo_root: Optional[str] = N
         local_ref: Local commit SHA (e.g., HEAD)
         remote_ref: Remote commit SHA (or all zeros for new branch)
         repo_root: Git repository root (defaults to cwd)
+        shards: Run this many `git diff` processes concurrently, split by changed path
+            (same output as a single diff; see stream_diff_range_sharded)
+        base: New-branch base from resolve_push_base (resolved here when omitted)
 
     Returns:
         Diff text as string
@@ -22,16 +153,14 @@ def get_diff_range(local_ref: str, remote_ref: str, repo_root: Optional[str] = N
     else:
         cwd = None
 
-    # Check if remote_ref is new branch (all zeros) or doesn't exist
-    # Git's empty tree SHA - represents "no content"
-    EMPTY_TREE = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+    if shards > 1:
+        # name-status와 샤드별 git diff가 같은 기준 커밋을 쓰도록 한 번만 계산
+        base = base or resolve_push_base(local_ref, remote_ref, cwd)
+        entries = get_name_status(local_ref, remote_ref, cwd, base)
+        if entries:
+            return "".join(stream_diff_range_sharded(local_ref, remote_ref, cwd, entries, shards, base))
 
-    if remote_ref == "0" * 40 or not remote_ref or remote_ref == "0":
-        # New branch: diff against empty tree to get all changes
-        cmd = ["git", "diff", EMPTY_TREE, local_ref]
-    else:
-        # Existing branch: normal diff
-        cmd = ["git", "diff", f"{remote_ref}..{local_ref}"]
+    cmd = build_diff_command(local_ref, remote_ref, cwd, base=base)
 
     result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd, encoding="utf-8")
 
@@ -41,76 +170,380 @@ def get_diff_range(local_ref: str, remote_ref: str, repo_root: Optional[str] = N
     return result.stdout
 
 
-def parse_changed_files(diff_text: str) -> List[str]:
+def stream_git_lines(cmd: List[str], repo_root: Optional[str] = None) -> Iterator[str]:
     """
-    Extract changed file paths from git diff output.
+    Run a git command and yield stdout lines as git produces them (via Popen).
+
+    Closing the generator early terminates the git process, so callers can stop
+    reading as soon as they have what they need.
 
     Args:
-        diff_text: Git diff output
+        cmd: git command as argument list
+        repo_root: Git repository root (defaults to cwd)
 
-    Returns:
-        List of changed file paths
+    Yields:
+        Output lines without trailing newline
+
+    Raises:
+        RuntimeError: If git exits with a non-zero status
     """
-    files = []
+    proc = subprocess.Popen(
+        cmd,
+        cwd=repo_root or None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    finished = False
+    try:
+        for line in proc.stdout:
+            yield line[:-1] if line.endswith("\n") else line
+        finished = True
+    finally:
+        if not finished and proc.poll() is None:
+            # Consumer stopped early (e.g. hard block found): don't wait for the rest of the diff
+            proc.kill()
+        proc.stdout.close()
+        stderr = proc.stderr.read() if finished else ""
+        proc.stderr.close()
+        returncode = proc.wait()
+
+    if finished and returncode != 0:
+        raise RuntimeError(f"Git command failed: {stderr}")
+
+
+def stream_diff_range(
+    local_ref: str,
+    remote_ref: str,
+    repo_root: Optional[str] = None,
+    pathspecs: Optional[List[str]] = None,
+    base: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Stream the push-range diff file by file instead of capturing the whole stdout.
 
-    for line in diff_text.split("\n"):
-        # Look for diff --git a/path b/path
-        if line.startswith("diff --git"):
-            parts = line.split()
-            if len(parts) >= 4:
-                # Extract b/path (new version)
-                filepath = parts[3][2:]  # Remove 'b/' prefix
-                files.append(filepath)
+    Args:
+        local_ref: Local commit SHA (e.g., HEAD)
+        remote_ref: Remote commit SHA (or all zeros for new branch)
+        repo_root: Git repository root (defaults to cwd)
+        pathspecs: Optional pathspecs limiting which files are diffed
+        base: New-branch base from resolve_push_base (resolved here when omitted)
 
-    return files
+    Yields:
+        Diff text of one file section at a time, in git's output order
+    """
+    cmd = build_diff_command(local_ref, remote_ref, repo_root, pathspecs, base)
+    yield from iter_file_chunks(stream_git_lines(cmd, repo_root))
 
 
-def scan_history_for_first_appearance(
-    repo_root: str, added_lines: List[str], max_commits: int = 5
-) -> Optional[str]:
+def _pathspec_batches(groups: Iterable[List[str]]) -> List[List[str]]:
     """
-    Scan recent commit history to find when a line was first added.
+    Literal pathspecs, split so no single git command line gets too long.
 
     Args:
-        repo_root: Git repository root
-        added_lines: List of added line content to search for
-        max_commits: Number of recent commits to scan
+        groups: Paths that must stay in the same git invocation (e.g. both sides of a rename)
+    """
+    batches: List[List[str]] = []
+    current: List[str] = []
+    length = 0
+    for group in groups:
+        specs = [f":(literal){p}" for p in group]
+        size = sum(len(spec) + 1 for spec in specs)
+        if current and length + size > _MAX_PATHSPEC_CHARS:
+            batches.append(current)
+            current, length = [], 0
+        current.extend(specs)
+        length += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def stream_diff_range_sharded(
+    local_ref: str,
+    remote_ref: str,
+    repo_root: Optional[str],
+    entries: List[ChangedFile],
+    num_shards: int,
+    base: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Stream the push-range diff from several concurrent `git diff` processes.
 
-    Returns:
-        Commit SHA where line first appeared, or None
+    The changed files (in git's output order) are cut into contiguous shards and
+    each shard is diffed with literal pathspecs in its own thread/process. Chunks
+    are yielded shard by shard as soon as they arrive, so the result is
+    byte-for-byte the same as one `git diff` over the whole range.
+
+    Each shard hands its chunks over through a bounded queue: the shard being
+    consumed streams straight through, later shards run ahead until their buffer
+    is full (_SHARD_BUFFER_CHUNKS) and then wait, keeping memory bounded.
+
+    Closing the generator early stops every shard and kills its git process.
+
+    Args:
+        local_ref: Local commit SHA (e.g., HEAD)
+        remote_ref: Remote commit SHA (or all zeros for new branch)
+        repo_root: Git repository root (defaults to cwd)
+        entries: Files to diff, from get_name_status
+        num_shards: Number of concurrent git diff processes
+        base: New-branch base from resolve_push_base (resolved here when omitted)
+
+    Yields:
+        Diff text of one file section at a time, in git's output order
     """
-    if not added_lines:
-        return None
+    if not entries:
+        return
+
+    base_cmd = build_diff_command(local_ref, remote_ref, repo_root, base=base)
+    size = -(-len(entries) // max(1, num_shards))
+    shards = [entries[i:i + size] for i in range(0, len(entries), size)]
+    buffers = [queue.Queue(maxsize=_SHARD_BUFFER_CHUNKS) for _ in shards]
+    stop = threading.Event()
+    done = object()
+
+    def put(buffer: queue.Queue, item) -> bool:
+        # 소비자가 멈추면 (stop) 가득 찬 버퍼에서 영원히 기다리지 않도록 주기적으로 확인
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run_shard(shard: List[ChangedFile], buffer: queue.Queue) -> None:
+        try:
+            # rename은 원래 경로도 같은 호출에 넣어야 rename으로 인식됨
+            for batch in _pathspec_batches([p for p in (entry.old_path, entry.path) if p] for entry in shard):
+                lines = stream_git_lines(base_cmd + ["--", *batch], repo_root)
+                try:
+                    for chunk in iter_file_chunks(lines):
+                        if not put(buffer, chunk):
+                            return
+                finally:
+                    lines.close()
+        except Exception as e:
+            put(buffer, e)
+            return
+        put(buffer, done)
+
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        for shard, buffer in zip(shards, buffers):
+            pool.submit(run_shard, shard, buffer)
+        try:
+            # 완료 순서와 관계없이 샤드 순서대로 내보내 출력 순서를 고정
+            for buffer in buffers:
+                while True:
+                    item = buffer.get()
+                    if item is done:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+        finally:
+            stop.set()
+
+
+def get_name_status(
+    local_ref: str, remote_ref: str, repo_root: Optional[str] = None, base: Optional[str] = None
+) -> Optional[List[ChangedFile]]:
+    """
+    List the files changed in the push range without producing any patch text.
 
-    # Get recent commit SHAs
-    cmd = ["git", "log", f"-{max_commits}", "--format=%H"]
-    result = subprocess.run(
-        cmd, capture_output=True, text=True, cwd=repo_root, encoding="utf-8"
-    )
+    Uses `git diff --raw -z --no-abbrev` (name-status plus blob SHAs), which git
+    answers from the trees alone, so it stays fast even for huge pushes.
+
+    Args:
+        local_ref: Local commit SHA (e.g., HEAD)
+        remote_ref: Remote commit SHA (or all zeros for new branch)
+        repo_root: Git repository root (defaults to cwd)
+        base: New-branch base from resolve_push_base (resolved here when omitted)
+
+    Returns:
+        ChangedFile entries in git's output order, or None if git fails
+    """
+    cmd = build_diff_command(local_ref, remote_ref, repo_root, base=base)
+    cmd[2:3] = ["--raw", "-z", "--no-abbrev"]
 
+    result = subprocess.run(cmd, capture_output=True, cwd=repo_root or None)
     if result.returncode != 0:
         return None
 
-    commits = result.stdout.strip().split("\n")
+    entries: List[ChangedFile] = []
+    fields = result.stdout.decode("utf-8", errors="replace").split("\0")
+    i = 0
+    while i < len(fields):
+        meta = fields[i]
+        i += 1
+        if not meta.startswith(":"):
+            continue
+        # ":<old mode> <new mode> <old sha> <new sha> <status>\0<path>\0[<new path>\0]"
+        parts = meta[1:].split()
+        if len(parts) != 5:
+            continue
+        _, _, old_blob, new_blob, status = parts
+        path = fields[i] if i < len(fields) else ""
+        i += 1
+        old_path = None
+        if status[0] in "RC":
+            old_path, path = path, fields[i] if i < len(fields) else ""
+            i += 1
+        entries.append(
+            ChangedFile(
+                status=status[0],
+                path=path,
+                old_blob=old_blob if old_blob.strip("0") else None,
+                new_blob=new_blob if new_blob.strip("0") else None,
+                old_path=old_path,
+            )
+        )
+
+    return entries
+
+
+def get_patch_ids(
+    local_ref: str, remote_ref: str, repo_root: Optional[str] = None, base: Optional[str] = None
+) -> List[str]:
+    """
+    Compute `git patch-id --stable` for every commit in the push range.
+
+    Patch-ids stay the same across rebases and cherry-picks, so they identify
+    "the same change" even when commit SHAs differ.
 
-    # Search each commit for the added lines
-    for commit_sha in reversed(commits):  # Oldest first
-        cmd = ["git", "show", commit_sha]
+    Args:
+        local_ref: Local commit SHA (e.g., HEAD)
+        remote_ref: Remote commit SHA (or all zeros for new branch)
+        repo_root: Git repository root (defaults to cwd)
+        base: New-branch base from resolve_push_base (resolved here when omitted)
+
+    Returns:
+        Patch-ids in commit order (merge commits without a patch are skipped);
+        empty list if git fails
+    """
+    if _is_new_branch(remote_ref):
+        base = base or get_new_branch_base(local_ref, repo_root)
+        rev_range = [local_ref] if base == EMPTY_TREE else [f"{base}..{local_ref}"]
+    else:
+        rev_range = [f"{remote_ref}..{local_ref}"]
+
+    log = subprocess.Popen(
+        ["git", "log", "-p", "--no-color", "--reverse", *rev_range],
+        cwd=repo_root or None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
         result = subprocess.run(
-            cmd, capture_output=True, text=True, cwd=repo_root, encoding="utf-8"
+            ["git", "patch-id", "--stable"],
+            stdin=log.stdout,
+            capture_output=True,
+            cwd=repo_root or None,
         )
+    finally:
+        log.stdout.close()
+        log.wait()
 
-        if result.returncode != 0:
-            continue
+    if result.returncode != 0 or log.returncode != 0:
+        return []
 
-        commit_diff = result.stdout
+    patch_ids = []
+    for line in result.stdout.decode("utf-8", errors="replace").splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            patch_ids.append(parts[0])
+    return patch_ids
 
-        # Check if any of the added lines appear in this commit
-        for line in added_lines:
-            if line.strip() and line.strip() in commit_diff:
-                return commit_sha
 
-    return None
+def parse_changed_files(diff_text: str) -> List[str]:
+    """
+    Extract changed file paths from git diff output.
+
+    Prefer DiffModel.paths() when a parsed model is already available.
+
+    Args:
+        diff_text: Git diff output
+
+    Returns:
+        List of changed file paths
+    """
+    return parse_diff(diff_text).paths()
+
+
+def scan_history_first_seen(
+    repo_root: str,
+    lines: Optional[List[str]] = None,
+    paths: Optional[List[str]] = None,
+    max_commits: int = 100,
+    start_ref: str = "HEAD",
+) -> Dict[str, Optional[str]]:
+    """
+    Find the first commit (within the last max_commits) that introduced each line or file.
+
+    One `git log -p --reverse` stream answers every query: commits arrive
+    oldest first, so the first match is the first appearance. Reading stops
+    (and git is killed) as soon as every query has an answer.
+
+    Args:
+        repo_root: Git repository root
+        lines: Added line contents without the "+" marker (compared after
+            stripping surrounding whitespace)
+        paths: File paths to look for (first commit that added/renamed/copied them)
+        max_commits: Number of recent commits to scan
+        start_ref: Commit to walk back from (the pushed local SHA in the pre-push hook)
+
+    Returns:
+        {query: commit SHA or None} for every line and path queried
+        (lines are keyed by their stripped content)
+    """
+    line_queries = {}
+    for line in lines or []:
+        key = line.strip()
+        if key:
+            line_queries[key] = None
+    path_queries = {path: None for path in paths or []}
+    if not line_queries and not path_queries:
+        return {}
+
+    remaining = len(line_queries) + len(path_queries)
+    cmd = [
+        "git", "log", "-p", "--reverse", f"-{max_commits}", "--format=%x00%H",
+        "--no-color", "--no-ext-diff", "-U0", "--diff-filter=d", start_ref,
+    ]
+
+    commit = None
+    current_path = None
+    stream = stream_git_lines(cmd, repo_root)
+    try:
+        for line in stream:
+            if line.startswith("\0"):
+                commit = line[1:]
+                current_path = None
+            elif line.startswith("diff --git"):
+                parts = line.split()
+                current_path = parts[3][2:] if len(parts) >= 4 else None
+            elif line.startswith("+") and not line.startswith("+++ "):
+                key = line[1:].strip()
+                if key in line_queries and line_queries[key] is None:
+                    line_queries[key] = commit
+                    remaining -= 1
+            elif line.startswith(("new file mode", "rename to ", "copy to ")):
+                if current_path in path_queries and path_queries[current_path] is None:
+                    path_queries[current_path] = commit
+                    remaining -= 1
+            else:
+                continue
+
+            if remaining == 0:
+                break
+    except RuntimeError:
+        pass
+    finally:
+        stream.close()
+
+    return {**line_queries, **path_queries}
 
 
 def get_repo_root() -> str:
@@ -158,6 +591,100 @@ def fetch_base_branch(repo_root: str, base_branch: str) -> bool:
     return result.returncode == 0
 
 
+@dataclass
+class MergeSimulation:
+    """Result of an in-memory three-way merge (`git merge-tree --write-tree`)."""
+
+    tree: str  # 병합 결과 트리 (충돌 파일은 충돌 표시가 포함된 내용)
+    conflicts: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)  # path -> 충돌 구간 (병합 결과 라인)
+    messages: Dict[str, List[str]] = field(default_factory=dict)  # path -> ["CONFLICT (contents)", ...]
+
+    @property
+    def clean(self) -> bool:
+        return not self.conflicts
+
+
+def _conflict_marker_ranges(content: bytes) -> List[Tuple[int, int]]:
+    """Line ranges (1-based, inclusive) of <<<<<<< ... >>>>>>> blocks in a merged file."""
+    ranges = []
+    start = None
+    for lineno, line in enumerate(content.split(b"\n"), start=1):
+        if line.startswith(b"<<<<<<<") and start is None:
+            start = lineno
+        elif line.startswith(b">>>>>>>") and start is not None:
+            ranges.append((start, lineno))
+            start = None
+    return ranges
+
+
+def simulate_merge(
+    repo_root: str,
+    base_branch: str,
+    head_ref: str = "HEAD",
+    objects: Optional[GitObjectReader] = None,
+) -> Optional[MergeSimulation]:
+    """
+    Merge head_ref into base_branch in memory and report the exact conflicts.
+
+    Nothing in the working tree, index or refs is touched: `git merge-tree
+    --write-tree` only writes the merged tree/blobs to the object database.
+    Conflict hunks are read from the conflicted files of that tree.
+
+    Args:
+        repo_root: Git repository root
+        base_branch: Base branch (e.g., "origin/main")
+        head_ref: Commit being pushed
+        objects: cat-file reader used to read conflicted blobs (a temporary one if None)
+
+    Returns:
+        MergeSimulation, or None if the merge could not be simulated
+        (git older than 2.38, unknown refs, unrelated histories)
+    """
+    cmd = ["git", "merge-tree", "--write-tree", "-z", base_branch, head_ref]
+    result = subprocess.run(cmd, capture_output=True, cwd=repo_root)
+    # 0: 깔끔하게 병합됨, 1: 충돌 있음, 그 외: 시뮬레이션 불가
+    if result.returncode not in (0, 1):
+        return None
+
+    fields = result.stdout.decode("utf-8", errors="replace").split("\0")
+    if not fields[0].strip():
+        # 잘못된 ref 등: 일부 git 버전은 종료 코드 1과 빈 출력으로 실패를 알림
+        return None
+    simulation = MergeSimulation(tree=fields[0].strip())
+    if result.returncode == 0:
+        return simulation
+
+    # "<mode> <object> <stage>\t<path>" 항목들, 빈 필드로 끝남
+    i = 1
+    while i < len(fields) and fields[i]:
+        _, _, path = fields[i].partition("\t")
+        simulation.conflicts.setdefault(path, [])
+        i += 1
+    i += 1
+
+    # 안내 메시지: "<N>\0<path>...\0<type>\0<message>\0"
+    while i < len(fields) and fields[i].isdigit():
+        count = int(fields[i])
+        paths = fields[i + 1:i + 1 + count]
+        kind = fields[i + 1 + count] if i + 1 + count < len(fields) else ""
+        i += count + 3
+        if kind.startswith("CONFLICT"):
+            for path in paths:
+                simulation.messages.setdefault(path, []).append(kind)
+
+    reader = objects or GitObjectReader(repo_root)
+    try:
+        for path in simulation.conflicts:
+            content = reader.read(f"{simulation.tree}:{path}")
+            if content is not None:
+                simulation.conflicts[path] = _conflict_marker_ranges(content)
+    finally:
+        if objects is None:
+            reader.close()
+
+    return simulation
+
+
 def get_merge_base(repo_root: str, base_branch: str, head_ref: str = "HEAD") -> Optional[str]:
     """
     Get the merge base (common ancestor) between HEAD and base branch.
@@ -181,7 +708,7 @@ def get_merge_base(repo_root: str, base_branch: str, head_ref: str = "HEAD") ->
     return result.stdout.strip()
 
 
-def get_base_diff(repo_root: str, base_branch: str) -> str:
+def get_base_diff(repo_root: str, base_branch: str, paths: Optional[List[str]] = None) -> str:
     """
     Get diff from merge-base to base branch HEAD.
     This shows changes that happened on base branch since we diverged.
@@ -189,84 +716,114 @@ def get_base_diff(repo_root: str, base_branch: str) -> str:
     Args:
         repo_root: Git repository root
         base_branch: Base branch (e.g., "origin/main")
+        paths: Only diff these files (e.g. the files my push touches); None for the whole tree
 
     Returns:
         Diff text showing changes on base branch
     """
+    if paths is not None and not paths:
+        return ""
+
     # Get merge base
     merge_base = get_merge_base(repo_root, base_branch)
     if not merge_base:
         return ""
 
     # Get diff from merge-base to base branch HEAD
+    # 경로가 주어지면 내 변경 파일만 diff (긴 브랜치에서 main 전체 diff를 만들지 않음)
     cmd = ["git", "diff", merge_base, base_branch]
-    result = subprocess.run(
-        cmd, capture_output=True, text=True, cwd=repo_root, encoding="utf-8"
-    )
+    batches = _pathspec_batches([p] for p in dict.fromkeys(paths)) if paths else [[]]
 
-    if result.returncode != 0:
-        return ""
+    outputs = []
+    for batch in batches:
+        result = subprocess.run(
+            cmd + (["--", *batch] if batch else []),
+            capture_output=True, text=True, cwd=repo_root, encoding="utf-8",
+        )
+        if result.returncode != 0:
+            return ""
+        outputs.append(result.stdout)
 
-    return result.stdout
+    return "".join(outputs)
 
 
 def parse_diff_hunks(diff_text: str) -> dict[str, List[Tuple[int, int]]]:
     """
     Parse diff hunks to extract changed line ranges for each file.
 
+    Prefer DiffModel.hunk_ranges() when a parsed model is already available.
+
     Args:
         diff_text: Git diff output
 
     Returns:
         Dictionary: {filepath: [(start_line, end_line), ...]}
     """
-    hunks_by_file = {}
-    current_file = None
-
-    for line in diff_text.split("\n"):
-        # New file
-        if line.startswith("diff --git"):
-            parts = line.split()
-            if len(parts) >= 4:
-                current_file = parts[3][2:]  # Remove 'b/' prefix
-                hunks_by_file[current_file] = []
-
-        # Hunk header: @@ -10,7 +10,8 @@
-        elif line.startswith("@@") and current_file:
-            # Extract new file line range: +start,count
-            try:
-                parts = line.split("@@")[1].strip().split()
-                if len(parts) >= 2:
-                    new_range = parts[1]  # +10,8
-                    if new_range.startswith("+"):
-                        range_parts = new_range[1:].split(",")
-                        start = int(range_parts[0])
-                        count = int(range_parts[1]) if len(range_parts) > 1 else 1
-                        end = start + count - 1
-                        hunks_by_file[current_file].append((start, end))
-            except (ValueError, IndexError):
-                continue
+    return parse_diff(diff_text).hunk_ranges()
 
-    return hunks_by_file
 
-
-def detect_overlapping_files(my_diff: str, base_diff: str) -> List[str]:
+def detect_overlapping_files(my_diff: str | DiffModel, base_diff: str | DiffModel) -> List[str]:
     """
     Detect files that were modified in both my branch and base branch.
 
     Args:
-        my_diff: My branch's diff
-        base_diff: Base branch's diff
+        my_diff: My branch's diff (text or parsed DiffModel)
+        base_diff: Base branch's diff (text or parsed DiffModel)
 
     Returns:
         List of file paths that were modified in both diffs
     """
-    my_files = set(parse_changed_files(my_diff))
-    base_files = set(parse_changed_files(base_diff))
+    my_model = my_diff if isinstance(my_diff, DiffModel) else parse_diff(my_diff)
+    base_model = base_diff if isinstance(base_diff, DiffModel) else parse_diff(base_diff)
+
+    my_files = set(my_model.paths())
+    base_files = set(base_model.paths())
 
     return list(my_files & base_files)
 
 
+def _iter_overlaps(
+    my_hunks: List[Tuple[int, int]], base_hunks: List[Tuple[int, int]]
+) -> Iterator[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """
+    Sweep both range lists in start order, yielding every overlapping (mine, base) pair.
+
+    Each side keeps a min-heap (by end) of ranges that are still open; when a
+    range starts, ranges of the other side that ended before it are dropped and
+    every remaining one overlaps it.
+    """
+    events = sorted(
+        [(start, end, 0) for start, end in my_hunks] + [(start, end, 1) for start, end in base_hunks]
+    )
+    active: Tuple[list, list] = ([], [])
+    for start, end, side in events:
+        other = active[1 - side]
+        while other and other[0][0] < start:
+            heapq.heappop(other)
+        for other_end, other_start in other:
+            pair = ((start, end), (other_start, other_end))
+            yield pair if side == 0 else (pair[1], pair[0])
+        heapq.heappush(active[side], (end, start))
+
+
+def find_overlapping_ranges(
+    my_hunks: List[Tuple[int, int]], base_hunks: List[Tuple[int, int]]
+) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """
+    Find all overlapping line-range pairs between two sets of hunks.
+
+    O((n + m) log(n + m) + k) for n, m ranges and k overlapping pairs.
+
+    Args:
+        my_hunks: My changed line ranges [(start, end), ...] (inclusive)
+        base_hunks: Base branch changed line ranges
+
+    Returns:
+        Sorted list of (my_range, base_range) pairs that share at least one line
+    """
+    return sorted(_iter_overlaps(my_hunks, base_hunks))
+
+
 def check_line_overlap(my_hunks: List[Tuple[int, int]], base_hunks: List[Tuple[int, int]]) -> bool:
     """
     Check if any line ranges overlap between two sets of hunks.
@@ -278,10 +835,4 @@ def check_line_overlap(my_hunks: List[Tuple[int, int]], base_hunks: List[Tuple[i
     Returns:
         True if any overlap found
     """
-    for my_start, my_end in my_hunks:
-        for base_start, base_end in base_hunks:
-            # Check overlap: [my_start, my_end] intersects [base_start, base_end]
-            if not (my_end < base_start or my_start > base_end):
-                return True
-
-    return False
+    return next(_iter_overlaps(my_hunks, base_hunks), None) is not None
@@ -1,15 +1,19 @@
 """LangGraph workflow definition."""
 
-from typing import TypedDict, List, Annotated, Literal
+from typing import Dict, TypedDict, List, Annotated, Literal
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 from .config import load_config
-from .git_ops import parse_changed_files
-from .detectors.secrets import detect_secrets
+from .diff_model import DiffModel, parse_diff, split_file_sections
+from .git_ops import MergeSimulation
+from .detectors.scan_cache import open_scan_cache, detect_secrets_cached
+from .detectors.parallel import detect_secrets_parallel
+from .detectors.entropy import detect_high_entropy_strings
+from .detectors.classify import classify_files, paths_with_policy, llm_diff_text
 from .detectors.files import detect_sensitive_files
 from .detectors.stack_guess import guess_stacks, identify_weak_stacks
 from .llm.judge import run_soft_judge
-from .llm.observe import validate_observation
+from .llm.observe import fast_path_observation, observe_and_plan, validate_observation
 from .llm.research_planner import plan_next_research
 from .research.gather import gather_research, merge_evidence
 from .research.link_annotator import annotate_link_titles_with_llm
@@ -18,6 +22,8 @@ from .research.naver_filter import filter_naver_results
 from .research.naver_query_generator import generate_naver_query
 from .report.models import Finding, Evidence, ConflictWarning
 from .report.writer import generate_report_md, save_report
+from .result_cache import open_result_cache, result_key, dump_result, load_result
+import re
 import time
 
 
@@ -32,9 +38,12 @@ class GuardianState(TypedDict):
     # Input
     diff_text: str
     mode: Literal["cli", "web"]  # cli = pre-push hook, web = web demo
+    push_range: tuple | None  # (local_sha, remote_sha[, new-branch base]): patch-id 결과 캐시 키 계산용 (CLI)
 
     # Parsed data
+    diff_model: DiffModel | None  # scope_classify에서 한 번만 파싱하여 모든 노드가 공유
     changed_files: List[str]
+    file_classes: dict  # {filepath: binary|vendored|generated|oversized|normal} → 분석 정책 결정
     detected_stacks: List[str]
     weak_stack_touched: List[str]
 
@@ -85,14 +94,22 @@ class GuardianState(TypedDict):
 
     # Conflict detection (BETA)
     base_diff: str | None  # origin/main의 diff
+    base_diff_sections: Dict[str, str]  # base_diff의 파일별 구간 (헝크 파싱은 분석할 파일만, 필요할 때)
     conflict_files: List[str]  # 양쪽에서 수정된 파일 목록
     conflict_warnings: List[ConflictWarning]  # 충돌 경고
+    merge_simulation: MergeSimulation | None  # git merge-tree 시뮬레이션 결과 (CLI)
+
+    # Patch-id result cache
+    result_cache_key: str | None  # 이번 push의 patch-id 집합 키 (soft judge 실행 시에만 설정)
+    result_cache_hit: bool  # True면 soft judge/리서치를 캐시로 대체
 
 # Node functions
 def load_config_node(state: GuardianState) -> GuardianState:
     """Load configuration."""
     # Initialize defaults FIRST (before accessing state)
+    state.setdefault("diff_model", None)
     state.setdefault("changed_files", [])
+    state.setdefault("file_classes", {})
     state.setdefault("detected_stacks", [])
     state.setdefault("weak_stack_touched", [])
     state.setdefault("hard_findings", [])
@@ -115,8 +132,13 @@ def load_config_node(state: GuardianState) -> GuardianState:
     state.setdefault("human_approval_needed", False)
     state.setdefault("human_decision", None)
     state.setdefault("base_diff", None)
+    state.setdefault("base_diff_sections", {})
     state.setdefault("conflict_files", [])
     state.setdefault("conflict_warnings", [])
+    state.setdefault("merge_simulation", None)
+    state.setdefault("push_range", None)
+    state.setdefault("result_cache_key", None)
+    state.setdefault("result_cache_hit", False)
 
     # Now try to load config
     try:
@@ -147,16 +169,32 @@ def scope_classify_node(state: GuardianState) -> GuardianState:
     """Parse changed files and classify stack."""
     diff_text = state["diff_text"]
 
+    # Parse the diff once; every downstream node reads from this model
+    diff_model = parse_diff(diff_text)
+    state["diff_model"] = diff_model
+
     # Parse changed files
-    changed_files = parse_changed_files(diff_text)
+    changed_files = diff_model.paths()
     state["changed_files"] = changed_files
 
-    # Guess stacks
-    detected_stacks = guess_stacks(changed_files)
+    config = state["config"]
+
+    # Classify files (binary / vendored / generated / oversized) → skip, hard-rules-only or full analysis
+    classify_config = config.get("file_classes", {})
+    if classify_config.get("enabled", True):
+        objects = None
+        if state.get("mode") == "cli" and state.get("repo_root"):
+            from .repo_context import get_repo_context
+
+            # blob 크기/내용은 공유 cat-file 파이프로 조회 (파일마다 git 프로세스를 띄우지 않음)
+            objects = get_repo_context(state["repo_root"]).objects
+        state["file_classes"] = classify_files(diff_model, classify_config, objects=objects)
+
+    # Guess stacks (built-in indicators + config custom_stacks)
+    detected_stacks = guess_stacks(changed_files, config.get("custom_stacks"))
     state["detected_stacks"] = list(detected_stacks)
 
     # Identify weak stacks
-    config = state["config"]
     stacks_known = config.get("stacks_known", [])
     stacks_weak = config.get("stacks_weak", [])
 
@@ -168,7 +206,7 @@ def scope_classify_node(state: GuardianState) -> GuardianState:
 
 def conflict_detect_node(state: GuardianState) -> GuardianState:
     """Detect potential merge conflicts (BETA)."""
-    from .git_ops import fetch_base_branch, get_base_diff, detect_overlapping_files
+    from .git_ops import fetch_base_branch, get_base_diff
 
     config = state["config"]
     conflict_config = config.get("conflict_detection", {})
@@ -194,6 +232,8 @@ def conflict_detect_node(state: GuardianState) -> GuardianState:
 
             state["diff_text"] = my_diff_part  # Update to only my diff
             state["base_diff"] = base_diff_part
+            state["diff_model"] = parse_diff(my_diff_part)
+            state["changed_files"] = state["diff_model"].paths()
         else:
             # No base diff provided, skip
             return state
@@ -208,17 +248,30 @@ def conflict_detect_node(state: GuardianState) -> GuardianState:
         if auto_fetch:
             fetch_base_branch(repo_root, base_branch)
 
-        base_diff = get_base_diff(repo_root, base_branch)
+        from .repo_context import get_repo_context
+
+        # base 브랜치가 없으면 merge-base/diff 프로세스를 띄우지 않음 (공유 cat-file 파이프로 확인)
+        if not get_repo_context(repo_root).objects.exists(base_branch):
+            return state
+
+        # Only the files my push touches (renames: both paths) — base 쪽 전체 트리 diff는 만들지 않음
+        my_model = state.get("diff_model") or parse_diff(state["diff_text"])
+        my_paths = [p for f in my_model.files for p in (f.old_path, f.path) if p]
+        base_diff = get_base_diff(repo_root, base_branch, my_paths)
         state["base_diff"] = base_diff
 
     # Detect overlapping files
-    my_diff = state["diff_text"]
     base_diff = state.get("base_diff", "")
 
     if not base_diff:
         return state
 
-    conflict_files = detect_overlapping_files(my_diff, base_diff)
+    my_model = state.get("diff_model") or parse_diff(state["diff_text"])
+    # base diff는 파일 헤더만 훑어 나누고, 헝크 파싱은 conflict_analyze에서 파일별로
+    base_sections = split_file_sections(base_diff)
+    state["base_diff_sections"] = base_sections
+
+    conflict_files = [path for path in my_model.paths() if path in base_sections]
     state["conflict_files"] = conflict_files
 
     print(f"🔍 충돌 감지: {len(conflict_files)}개 파일이 양쪽에서 수정됨")
@@ -226,78 +279,143 @@ def conflict_detect_node(state: GuardianState) -> GuardianState:
     return state
 
 
+def _merge_conflict_warning(
+    filepath: str, ranges: list, kinds: list, my_file_diff: str, base_file_diff: str, base_branch: str
+) -> ConflictWarning:
+    """Exact warning for a file git cannot merge (from the merge-tree simulation, no LLM)."""
+    where = ", ".join(f"{start}-{end}" for start, end in ranges) or "파일 전체"
+    return ConflictWarning(
+        file_path=filepath,
+        conflict_probability=1.0,
+        conflict_type="merge_conflict",
+        recommendation="manual_merge",
+        advice_ko=(
+            f"- 충돌 위치: {filepath} 라인 {where} (병합 결과 기준)\n"
+            f"- 충돌 종류: {', '.join(kinds) or 'CONFLICT'}\n"
+            f"- 근거: git merge-tree로 {base_branch}와의 병합을 로컬에서 시뮬레이션한 결과\n"
+            f"- 해결: 푸시 전에 {base_branch}를 병합(또는 rebase)하고 충돌 표시를 정리하세요"
+        ),
+        merge_suggestion_ko=(
+            f"`git merge {base_branch}` 후 {filepath}의 `<<<<<<<` ~ `>>>>>>>` 구간을 수동으로 병합하세요."
+        ),
+        my_changes=my_file_diff[:500],
+        their_changes=base_file_diff[:500],
+        line_overlap=True,
+    )
+
+
 def conflict_analyze_node(state: GuardianState) -> GuardianState:
-    """Analyze conflicts using LLM (BETA)."""
-    from .git_ops import parse_diff_hunks, check_line_overlap
-    from .llm.conflict_analyzer import analyze_conflict
+    """Analyze conflicts: exact git merge simulation first, LLM only for suspected semantic clashes (BETA)."""
+    from .git_ops import find_overlapping_ranges
 
     conflict_files = state.get("conflict_files", [])
     if not conflict_files:
         return state
 
-    my_diff = state["diff_text"]
-    base_diff = state.get("base_diff", "")
+    my_model = state.get("diff_model") or parse_diff(state["diff_text"])
+    base_sections = state.get("base_diff_sections") or split_file_sections(state.get("base_diff") or "")
 
-    # Parse hunks for both diffs
-    my_hunks = parse_diff_hunks(my_diff)
-    base_hunks = parse_diff_hunks(base_diff)
+    # Hunk ranges for my diff (already parsed in the model)
+    my_hunks = my_model.hunk_ranges()
 
-    # Analyze each conflict file
-    base_branch = state.get("config", {}).get("conflict_detection", {}).get("base_branch", "origin/main")
-    warnings = []
-    for filepath in conflict_files[:5]:  # Limit to 5 files to avoid too many LLM calls
-        # Extract file-specific diffs
-        my_file_diff = extract_file_diff(my_diff, filepath)
-        base_file_diff = extract_file_diff(base_diff, filepath)
+    conflict_config = state.get("config", {}).get("conflict_detection", {})
+    base_branch = conflict_config.get("base_branch", "origin/main")
 
-        # Check line overlap
+    # CLI: 3-way merge를 메모리에서 실행해 실제 충돌 파일/구간을 정확히 계산
+    simulation = None
+    repo_root = state.get("repo_root")
+    if state.get("mode") == "cli" and repo_root and conflict_config.get("merge_simulation", True):
+        from .git_ops import simulate_merge
+        from .repo_context import get_repo_context
+
+        push_range = state.get("push_range")
+        head_ref = push_range[0] if push_range else "HEAD"
+        simulation = simulate_merge(repo_root, base_branch, head_ref, get_repo_context(repo_root).objects)
+        state["merge_simulation"] = simulation
+        if simulation is not None:
+            print(f"🔀 병합 시뮬레이션: 충돌 파일 {len(simulation.conflicts)}개")
+
+    max_llm_files = conflict_config.get("max_llm_files", 15)
+
+    # 결정적 경고는 바로 채우고, LLM 분석 대상은 모아서 동시에 실행 (결과는 파일 순서대로)
+    results: list = [None] * len(conflict_files)
+    llm_requests = []
+    llm_positions = []
+    for position, filepath in enumerate(conflict_files):
+        # Extract file-specific diffs (slices by offset, no rescans)
+        my_file_diff = my_model.file_text(filepath)
+        base_file_diff = base_sections.get(filepath, "")
+
+        # Check line overlap (base side: parse only this file's section)
         my_ranges = my_hunks.get(filepath, [])
-        base_ranges = base_hunks.get(filepath, [])
-        line_overlap = check_line_overlap(my_ranges, base_ranges)
+        base_ranges = parse_diff(base_file_diff).hunk_ranges().get(filepath, [])
+        overlaps = find_overlapping_ranges(my_ranges, base_ranges)
+        line_overlap = bool(overlaps)
+
+        if simulation is not None:
+            if filepath in simulation.conflicts:
+                # git이 병합할 수 없는 파일: LLM 없이 확정 경고
+                results[position] = _merge_conflict_warning(
+                    filepath,
+                    simulation.conflicts[filepath],
+                    simulation.messages.get(filepath, []),
+                    my_file_diff,
+                    base_file_diff,
+                    base_branch,
+                )
+                print(f"⛔ {filepath}: 병합 충돌 확정 (git merge-tree)")
+                continue
+            if not line_overlap:
+                # 깔끔하게 병합되고 수정 구간도 떨어져 있으면 의미 충돌 의심 없음
+                continue
+
+        if len(llm_requests) >= max_llm_files:  # Limit LLM calls per push
+            continue
+
+        # Analyze with LLM (merges cleanly but edits are close: possible semantic clash)
+        llm_positions.append(position)
+        llm_requests.append(
+            {
+                "file_path": filepath,
+                "my_changes": my_file_diff,
+                "their_changes": base_file_diff,
+                "line_overlap": line_overlap,
+                "my_line_ranges": my_ranges,
+                "base_line_ranges": base_ranges,
+                "base_branch": base_branch,
+                "overlapping_ranges": overlaps,
+                "token_budget": conflict_config.get("prompt_token_budget", 1500),
+                "context_lines": conflict_config.get("prompt_context_lines", 3),
+            }
+        )
 
-        # Analyze with LLM
-        try:
-            warning = analyze_conflict(
-                filepath,
-                my_file_diff,
-                base_file_diff,
-                line_overlap,
-                my_line_ranges=my_ranges,
-                base_line_ranges=base_ranges,
-                base_branch=base_branch,
-            )
-            warnings.append(warning)
-            print(f"⚠️  {filepath}: {warning.conflict_probability*100:.0f}% 충돌 위험 ({warning.conflict_type})")
-        except Exception as e:
-            print(f"⚠️  {filepath}: 분석 실패 - {e}")
+    if llm_requests:
+        from .llm.conflict_analyzer import analyze_conflicts
+
+        analyzed = analyze_conflicts(
+            llm_requests,
+            max_concurrency=conflict_config.get("max_concurrency", 4),
+            timeout=conflict_config.get("llm_timeout", 20),
+        )
+        for position, warning in zip(llm_positions, analyzed):
+            if warning is None:
+                continue
+            results[position] = warning
+            print(f"⚠️  {warning.file_path}: {warning.conflict_probability*100:.0f}% 충돌 위험 ({warning.conflict_type})")
 
-    state["conflict_warnings"] = warnings
+    state["conflict_warnings"] = [warning for warning in results if warning is not None]
 
     return state
 
 
 def extract_file_diff(full_diff: str, filepath: str) -> str:
-    """Extract diff for a specific file from full diff."""
-    lines = full_diff.split("\n")
-    result = []
-    in_file = False
-
-    for line in lines:
-        if line.startswith("diff --git") and filepath in line:
-            in_file = True
-            result.append(line)
-        elif line.startswith("diff --git") and in_file:
-            # Next file started
-            break
-        elif in_file:
-            result.append(line)
-
-    return "\n".join(result)
+    """Extract diff for a specific file from full diff (prefer DiffModel.file_text when parsed)."""
+    return parse_diff(full_diff).file_text(filepath)
 
 
 def hard_policy_check_node(state: GuardianState) -> GuardianState:
     """Check hard abort rules (secrets, sensitive files)."""
-    diff_text = state["diff_text"]
+    diff_model = state.get("diff_model") or parse_diff(state["diff_text"])
     changed_files = state["changed_files"]
     config = state["config"]
     repo_root = state.get("repo_root")
@@ -306,8 +424,34 @@ def hard_policy_check_node(state: GuardianState) -> GuardianState:
     secret_patterns = hard_abort.get("secret_patterns", [])
     file_patterns = hard_abort.get("file_patterns", [])
 
-    # Detect secrets
-    secret_findings = detect_secrets(diff_text, secret_patterns)
+    # Content rules skip files classified with the "skip" policy (e.g. binary);
+    # sensitive-file path rules below still see every changed file
+    file_classes = state.get("file_classes") or {}
+    if file_classes:
+        diff_model = diff_model.select(
+            paths_with_policy(file_classes, config.get("file_classes"), ("full", "hard_only"))
+        )
+
+    # Detect secrets (CLI: reuse results for blob pairs already scanned under this policy)
+    # 대용량 diff는 파일 단위로 나눠 프로세스 풀에서 스캔 (parallel_scan)
+    scan_cache = open_scan_cache(config, secret_patterns) if state.get("mode") == "cli" else None
+    if scan_cache is not None:
+        try:
+            secret_findings = detect_secrets_cached(diff_model, secret_patterns, scan_cache, config)
+        finally:
+            scan_cache.close()
+    else:
+        secret_findings = detect_secrets_parallel(diff_model, secret_patterns, config)
+
+    # Detect random-looking tokens without a known prefix (hex / base64 entropy)
+    # 커밋 SHA/체크섬 오탐이 있을 수 있으므로 차단하지 않고 soft finding(경고)으로만 보고
+    try:
+        state["soft_findings"] = detect_high_entropy_strings(
+            diff_model, config.get("entropy"), secret_patterns, file_classes, config.get("file_classes")
+        )
+    except ImportError as e:
+        state["soft_findings"] = []
+        state["errors"].append(f"Entropy scan skipped: {e}")
 
     # Detect sensitive files
     file_findings = detect_sensitive_files(changed_files, file_patterns)
@@ -322,94 +466,113 @@ def hard_policy_check_node(state: GuardianState) -> GuardianState:
         state["severity"] = "critical"
         state["risk_score"] = 1.0
 
-        # Scan history for when this issue first appeared (only in CLI mode)
+        # Find the exact first-seen commit of every finding in one history pass (only in CLI mode)
         if repo_root and state.get("mode") == "cli":
-            from .git_ops import scan_history_for_first_appearance
-            import subprocess
-
-            max_commits = config.get("history_scan_commits", 5)
-
-            # Try to scan git history for when files were added
-            file_findings_count = len([f for f in hard_findings if f.kind == "file"])
-
-            if file_findings_count > 0:
-                # For file findings, check when the file was added to git
-                for finding in hard_findings:
-                    if finding.kind == "file":
-                        # Extract filename from detail "File: .env"
-                        filename = finding.detail.replace("File: ", "").strip()
-
-                        # Check git log for this file
-                        cmd = ["git", "log", f"-{max_commits}", "--oneline", "--", filename]
-                        result = subprocess.run(
-                            cmd, capture_output=True, text=True, cwd=repo_root, encoding="utf-8"
-                        )
-
-                        if result.returncode == 0 and result.stdout.strip():
-                            commits = result.stdout.strip().split('\n')
-                            first_commit = commits[-1].split()[0]  # Get oldest commit SHA
-
-                            state["history_hint"] = {
-                                "first_seen_commit": first_commit,
-                                "message": f"⚠️ The file '{filename}' was added {len(commits)} commit(s) ago (scanned last {max_commits} commits).",
-                                "scanned_commits": max_commits
-                            }
-                            break  # Only need one
-                        else:
-                            # File is being added in this commit
-                            state["history_hint"] = {
-                                "message": f"The file '{filename}' is being added in this commit (new addition).",
-                                "scanned_commits": 0
-                            }
-                            break
-            else:
-                # For secret findings, try to extract the actual secret line
-                added_lines = []
-                for finding in hard_findings:
-                    if finding.kind == "secret" and finding.detail:
-                        # Extract line from detail
-                        lines = [line.strip() for line in finding.detail.split('\n') if line.strip() and not line.startswith('Found')]
-                        added_lines.extend(lines[:3])  # Top 3 lines per finding
-
-                if added_lines:
-                    first_commit = scan_history_for_first_appearance(repo_root, added_lines, max_commits)
-
-                    if first_commit:
-                        state["history_hint"] = {
-                            "first_seen_commit": first_commit[:8],
-                            "message": f"⚠️ This secret was first introduced approximately {max_commits} commits ago.",
-                            "scanned_commits": max_commits
-                        }
-                    else:
-                        state["history_hint"] = {
-                            "message": f"This secret appears to be new (not found in the last {max_commits} commits).",
-                            "scanned_commits": max_commits
-                        }
+            push_range = state.get("push_range")
+            state["history_hint"] = _history_hint(
+                state.get("diff_model") or diff_model,
+                hard_findings,
+                repo_root,
+                config.get("history_scan_commits", 100),
+                push_range[0] if push_range else "HEAD",
+            )
 
     return state
 
 
+def _history_hint(
+    diff_model: DiffModel, findings: List[Finding], repo_root: str, max_commits: int, start_ref: str
+) -> dict | None:
+    """Trace every hard finding (secret line or sensitive file) to the commit that introduced it."""
+    from .git_ops import scan_history_first_seen
+
+    # Finding detail formats: "라인 {N}: {line}..." (secret) / "파일: {path}" (file)
+    line_re = re.compile(r"^라인 (\d+):")
+    targets = []  # (finding, kind, line_index or path)
+    for finding in findings:
+        if finding.kind == "file":
+            targets.append((finding, "file", finding.detail.split(": ", 1)[-1].strip()))
+        elif finding.kind == "secret":
+            match = line_re.match(finding.detail)
+            if match:
+                targets.append((finding, "line", int(match.group(1))))
+
+    if not targets:
+        return None
+
+    wanted = {target for _, kind, target in targets if kind == "line"}
+    line_text = {
+        added.line_index: added.text[1:].strip()
+        for added in diff_model.iter_added_lines()
+        if added.line_index in wanted
+    }
+    paths = [target for _, kind, target in targets if kind == "file"]
+
+    first_seen = scan_history_first_seen(
+        repo_root, lines=list(line_text.values()), paths=paths, max_commits=max_commits, start_ref=start_ref
+    )
+
+    entries = []
+    for finding, kind, target in targets:
+        query = line_text.get(target) if kind == "line" else target
+        commit = first_seen.get(query) if query else None
+        entries.append({
+            "title": finding.title,
+            "target": f"라인 {target}" if kind == "line" else target,
+            "first_seen_commit": commit[:8] if commit else None,
+        })
+
+    found = sum(1 for entry in entries if entry["first_seen_commit"])
+    return {
+        "first_seen_commit": next((e["first_seen_commit"] for e in entries if e["first_seen_commit"]), None),
+        "findings": entries,
+        "message": (
+            f"Traced {found}/{len(entries)} finding(s) to the commit that introduced them "
+            f"(scanned the last {max_commits} commits in one pass)."
+        ),
+        "scanned_commits": max_commits,
+    }
+
+
 def soft_llm_judge_node(state: GuardianState) -> GuardianState:
     """Run LLM-based soft checks."""
     # Skip if already blocked by hard rules
     if state["decision"] == "block":
         return state
 
-    diff_text = state["diff_text"]
     config = state["config"]
 
-    soft_checks = config.get("soft_checks", [])
-    stacks_known = config.get("stacks_known", [])
-    stacks_weak = config.get("stacks_weak", [])
-
-    # Run judge
-    result = run_soft_judge(diff_text, soft_checks, stacks_known, stacks_weak)
+    # Generated/vendored/oversized files are left out of the LLM prompt
+    diff_text = state["diff_text"]
+    if state.get("file_classes") and state.get("diff_model") is not None:
+        diff_text = llm_diff_text(state["diff_model"], state["file_classes"], config.get("file_classes"))
+
+    # 같은 patch 집합을 이미 분석했다면 (rebase, cherry-pick) LLM/리서치 결과를 재사용
+    cached = _lookup_result_cache(state)
+    if cached is not None:
+        state.update(cached)
+        state["result_cache_hit"] = True
+    else:
+        soft_checks = config.get("soft_checks", [])
+        stacks_known = config.get("stacks_known", [])
+        stacks_weak = config.get("stacks_weak", [])
+
+        # Run judge (nothing left for the LLM when every file was excluded)
+        result = {}
+        if diff_text.strip():
+            result = run_soft_judge(diff_text, soft_checks, stacks_known, stacks_weak, config.get("soft_judge"))
+        state["errors"].extend(f"soft judge {error}" for error in result.get("chunk_errors", []))
+        if result.get("skipped_chunks"):
+            state["errors"].append(
+                f"soft judge: {result['skipped_chunks']} diff chunk(s) over soft_judge.max_chunks were not reviewed"
+            )
 
-    state["soft_findings"] = result.get("findings", [])
-    state["risk_score"] = result.get("risk_score", 0.0)
-    state["severity"] = result.get("severity", "low")
-    state["quick_fixes"] = result.get("quick_fixes", [])
-    state["learning_points"] = result.get("learning_points", [])
+        # LLM findings first (research queries use the first finding), then entropy warnings from hard_rules
+        state["soft_findings"] = result.get("findings", []) + state["soft_findings"]
+        state["risk_score"] = result.get("risk_score", 0.0)
+        state["severity"] = result.get("severity", "low")
+        state["quick_fixes"] = result.get("quick_fixes", [])
+        state["learning_points"] = result.get("learning_points", [])
 
     # Set decision based on severity
     if state["severity"] in ["high", "critical"]:
@@ -422,6 +585,42 @@ def soft_llm_judge_node(state: GuardianState) -> GuardianState:
     return state
 
 
+def _lookup_result_cache(state: GuardianState) -> dict | None:
+    """
+    Compute the push's patch-id key and return the cached result for it (CLI only).
+
+    Sets state["result_cache_key"] so persist_report_node can store a fresh result.
+    """
+    push_range = state.get("push_range")
+    if state.get("mode") != "cli" or not push_range or not state.get("repo_root"):
+        return None
+
+    from .git_ops import get_patch_ids
+
+    try:
+        # 세 번째 값: CLI가 한 번 계산한 새 브랜치 기준 커밋 (없으면 get_patch_ids가 계산)
+        base = push_range[2] if len(push_range) > 2 else None
+        patch_ids = get_patch_ids(push_range[0], push_range[1], state["repo_root"], base)
+    except Exception as e:
+        state["errors"].append(f"patch-id calculation failed: {e}")
+        return None
+
+    key = result_key(patch_ids, state["config"])
+    if key is None:
+        return None
+    state["result_cache_key"] = key
+
+    cache = open_result_cache(state["config"])
+    if cache is None:
+        return None
+    try:
+        payload = cache.get(key)
+    finally:
+        cache.close()
+
+    return load_result(payload) if payload is not None else None
+
+
 def research_tavily_node(state: GuardianState) -> GuardianState:
     """Gather research using Tavily (initial search)."""
     all_findings = state["hard_findings"] + state["soft_findings"]
@@ -538,16 +737,26 @@ def observation_validate_node(state: GuardianState) -> GuardianState:
     recheck_count = state["recheck_count"]
     last_query = state.get("last_query")
 
-    # Step 1: LLM이 evidence 품질 평가 (observation)
-    observation = validate_observation(all_findings, evidence, recheck_count)
+    research_config = state["config"].get("research", {})
 
-    # Step 2: LLM이 다음 액션 계획 (planning)
-    plan = plan_next_research(
-        all_findings,
-        evidence,
-        recheck_count,
-        last_query
-    )
+    # 신뢰 도메인 링크가 이미 충분하면 LLM 없이 규칙으로 판정
+    fast = fast_path_observation(all_findings, evidence, recheck_count, research_config.get("fast_path"))
+    if fast is not None:
+        observation, plan = fast
+    elif research_config.get("combined_observe_plan", True):
+        # 품질 평가와 다음 액션 계획을 LLM 한 번의 호출로 처리
+        observation, plan = observe_and_plan(all_findings, evidence, recheck_count, last_query)
+    else:
+        # Step 1: LLM이 evidence 품질 평가 (observation)
+        observation = validate_observation(all_findings, evidence, recheck_count)
+
+        # Step 2: LLM이 다음 액션 계획 (planning)
+        plan = plan_next_research(
+            all_findings,
+            evidence,
+            recheck_count,
+            last_query
+        )
 
     state["research_plan"] = plan
     # Format notes with bullet points and line breaks for better readability
@@ -757,6 +966,18 @@ def persist_report_node(state: GuardianState) -> GuardianState:
     except Exception as e:
         state["errors"].append(f"Failed to save report: {e}")
 
+    # 새로 분석한 patch 집합의 judge/리서치 결과 저장 (다음 rebase/force-push에서 재사용)
+    key = state.get("result_cache_key")
+    if key and not state.get("result_cache_hit"):
+        cache = open_result_cache(config)
+        if cache is not None:
+            try:
+                cache.put(key, dump_result(state))
+            except Exception as e:
+                state["errors"].append(f"Failed to store result cache: {e}")
+            finally:
+                cache.close()
+
     return state
 
 
@@ -765,6 +986,10 @@ def should_do_research(state: GuardianState) -> Literal["research", "write_repor
     """Decide if research is needed."""
     all_findings = state["hard_findings"] + state["soft_findings"]
 
+    # Evidence already restored from the patch-id result cache
+    if state.get("result_cache_hit"):
+        return "write_report"
+
     # If no findings and no weak stacks, skip research
     if not all_findings and not state["weak_stack_touched"]:
         return "write_report"
@@ -898,7 +1123,8 @@ def build_graph(checkpointer=None) -> StateGraph:
 
 
 # Main execution function
-def run_guardian(diff_text: str, mode: Literal["cli", "web"] = "cli", repo_root: str | None = None) -> GuardianState:
+def run_guardian(diff_text: str, mode: Literal["cli", "web"] = "cli", repo_root: str | None = None,
+                 push_range: tuple | None = None) -> GuardianState:
     """
     Run the PushGuardian workflow.
 
@@ -906,6 +1132,8 @@ def run_guardian(diff_text: str, mode: Literal["cli", "web"] = "cli", repo_root:
         diff_text: Git diff content
         mode: Execution mode (cli or web)
         repo_root: Git repository root (for CLI mode)
+        push_range: (local_sha, remote_sha[, base from resolve_push_base]) of the push,
+            enables the patch-id result cache
 
     Returns:
         Final state
@@ -916,6 +1144,7 @@ def run_guardian(diff_text: str, mode: Literal["cli", "web"] = "cli", repo_root:
         "diff_text": diff_text,
         "mode": mode,
         "repo_root": repo_root,
+        "push_range": push_range,
     }
 
     final_state = graph.invoke(initial_state)
@@ -924,7 +1153,7 @@ def run_guardian(diff_text: str, mode: Literal["cli", "web"] = "cli", repo_root:
 
 
 def run_guardian_stream(diff_text: str, mode: Literal["cli", "web"] = "cli", repo_root: str | None = None,
-                       enable_hitl: bool = False, thread_id: str = "default"):
+                       enable_hitl: bool = False, thread_id: str = "default", push_range: tuple | None = None):
     """
     Run the PushGuardian workflow with streaming support.
 
@@ -934,6 +1163,8 @@ def run_guardian_stream(diff_text: str, mode: Literal["cli", "web"] = "cli", rep
         repo_root: Git repository root
         enable_hitl: Enable Human-in-the-Loop (requires checkpointer)
         thread_id: Thread ID for checkpointer (used to resume interrupted workflows)
+        push_range: (local_sha, remote_sha[, base from resolve_push_base]) of the push,
+            enables the patch-id result cache
 
     Yields:
         Tuple of (node_name, state) for each node execution
@@ -957,6 +1188,7 @@ def run_guardian_stream(diff_text: str, mode: Literal["cli", "web"] = "cli", rep
         "diff_text": diff_text,
         "mode": mode,
         "repo_root": repo_root,
+        "push_range": push_range,
     }
 
     # Set LangSmith trace URL if tracing is enabled
@@ -0,0 +1,147 @@
+"""Content-addressed on-disk cache for chat-model responses, shared by every LLM call site."""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..cache import SqliteCache
+
+
+# 응답 처리 방식(저장 포맷 등)이 바뀌면 올려서 기존 항목을 무효화
+LLM_CACHE_VERSION = 1
+
+DEFAULT_LLM_CACHE_CONFIG = {"enabled": True, "ttl_hours": 168, "max_bytes": 32 * 1024 * 1024}
+
+_lock = threading.Lock()
+_cache: Optional[SqliteCache] = None
+_cache_config: Dict[str, Any] = {}
+_opened = False
+_stats = {"hits": 0, "misses": 0}
+
+
+def cache_key(llm: Any, messages: List[Any], template: str = "") -> str:
+    """
+    Key for one chat call: model settings + rendered messages + prompt template tag.
+
+    Args:
+        llm: Chat model (model name, temperature and model_kwargs are part of the key)
+        messages: Messages passed to llm.invoke
+        template: Call-site prompt template tag (e.g. "judge")
+
+    Returns:
+        "llm:<sha256>"
+    """
+    payload = json.dumps(
+        {
+            "version": LLM_CACHE_VERSION,
+            "model": getattr(llm, "model_name", None) or getattr(llm, "model", None),
+            "temperature": getattr(llm, "temperature", None),
+            "model_kwargs": getattr(llm, "model_kwargs", None) or {},
+            "template": template,
+            "messages": [[getattr(m, "type", type(m).__name__), m.content] for m in messages],
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return "llm:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def configure_llm_cache(config: Optional[dict]) -> None:
+    """
+    (Re)open the shared cache from a loaded configuration.
+
+    Called lazily on the first cached call with load_config(); call it directly
+    to point the cache somewhere else (tests, benchmarks) or pass None to disable.
+    """
+    global _cache, _cache_config, _opened
+
+    with _lock:
+        if _cache is not None:
+            _cache.close()
+        _cache, _opened = None, True
+        _cache_config = {**DEFAULT_LLM_CACHE_CONFIG, **((config or {}).get("llm_cache") or {})}
+
+        report_dir = (config or {}).get("report_dir")
+        if not _cache_config.get("enabled", True) or not report_dir:
+            return
+        try:
+            _cache = SqliteCache(
+                Path(report_dir) / ".cache" / "llm_cache.sqlite",
+                max_bytes=_cache_config.get("max_bytes", DEFAULT_LLM_CACHE_CONFIG["max_bytes"]),
+            )
+        except Exception:
+            _cache = None
+
+
+def _get_cache() -> Optional[SqliteCache]:
+    if not _opened:
+        from ..config import load_config
+
+        try:
+            config = load_config()
+        except Exception:
+            config = None
+        configure_llm_cache(config)
+    return _cache
+
+
+def cached_invoke(llm: Any, messages: List[Any], template: str = "") -> Any:
+    """
+    llm.invoke(messages), answered from the on-disk cache when the same call was made before.
+
+    - 같은 모델/temperature/메시지/템플릿이면 TTL(ttl_hours) 안에서는 API를 다시 호출하지 않음
+    - 전체 크기는 max_bytes로 제한되고 오래 쓰지 않은 항목부터 제거 (LRU)
+    - 캐시를 열 수 없으면 그대로 llm.invoke 호출
+
+    Args:
+        llm: Chat model
+        messages: Messages to send
+        template: Call-site prompt template tag (part of the key)
+
+    Returns:
+        The model response (an AIMessage on cache hits; only .content is stored)
+    """
+    cache = _get_cache()
+    if cache is None:
+        return llm.invoke(messages)
+
+    key = cache_key(llm, messages, template)
+    ttl_seconds = float(_cache_config.get("ttl_hours", 0) or 0) * 3600
+
+    try:
+        entry = cache.get(key)
+    except Exception:
+        entry = None
+    if entry is not None and (not ttl_seconds or time.time() - entry.get("created", 0) <= ttl_seconds):
+        from langchain_core.messages import AIMessage
+
+        with _lock:
+            _stats["hits"] += 1
+        return AIMessage(content=entry["content"])
+
+    with _lock:
+        _stats["misses"] += 1
+    response = llm.invoke(messages)
+
+    if isinstance(response.content, str) and response.content.strip():
+        try:
+            cache.put(key, {"created": time.time(), "content": response.content})
+        except Exception:
+            pass
+    return response
+
+
+def cache_stats() -> Dict[str, int]:
+    """Hit/miss counters since the last reset (process-wide)."""
+    with _lock:
+        return dict(_stats)
+
+
+def reset_cache_stats() -> None:
+    """Zero the hit/miss counters (e.g. before each benchmark case)."""
+    with _lock:
+        _stats["hits"] = _stats["misses"] = 0
@@ -0,0 +1,65 @@
+"""Process-wide pool of chat-model clients shared by every LLM call site."""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_openai import ChatOpenAI
+
+
+DEFAULT_MODEL = "gpt-4o-mini"
+
+_models: Dict[Tuple, ChatOpenAI] = {}
+_models_lock = threading.Lock()
+
+
+def get_chat_model(
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0.1,
+    timeout: Optional[float] = None,
+    max_retries: int = 2,
+    model_kwargs: Optional[Dict[str, Any]] = None,
+) -> ChatOpenAI:
+    """
+    Shared ChatOpenAI instance per settings, created on first use.
+
+    - 같은 설정이면 그래프 노드, Streamlit 세션, FastAPI 요청이 모두 같은 클라이언트를 사용
+    - 클라이언트 내부의 HTTP 커넥션 풀(keep-alive)이 재사용되어 TLS/연결 설정이 프로세스당 한 번으로 줄어듦
+    - 클라이언트는 스레드 간 공유해도 안전 (동시 호출은 커넥션 풀에서 처리)
+    - OPENAI_API_KEY가 바뀌면 (load_api_keys 등) 새 클라이언트를 만듦
+
+    Args:
+        model: OpenAI model name
+        temperature: Sampling temperature
+        timeout: Request timeout in seconds (None: client default)
+        max_retries: Automatic retries on transient errors
+        model_kwargs: Extra request parameters (e.g. response_format)
+
+    Returns:
+        ChatOpenAI instance (do not mutate; it is shared)
+    """
+    key = (
+        os.getenv("OPENAI_API_KEY"),
+        model,
+        temperature,
+        timeout,
+        max_retries,
+        json.dumps(model_kwargs or {}, sort_keys=True),
+    )
+    with _models_lock:
+        if key not in _models:
+            _models[key] = ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                timeout=timeout,
+                max_retries=max_retries,
+                model_kwargs=model_kwargs or {},
+            )
+        return _models[key]
+
+
+def clear_chat_models() -> None:
+    """Drop every pooled client (tests, or to release connections held by clients with an old key)."""
+    with _models_lock:
+        _models.clear()
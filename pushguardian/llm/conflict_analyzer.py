@@ -1,9 +1,12 @@
 """LLM-based merge conflict analyzer."""
 
 import json
-from typing import Dict, Any
-from langchain_openai import ChatOpenAI
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from langchain_core.messages import SystemMessage, HumanMessage
+from .client import get_chat_model
+from .cache import cached_invoke
+from ..diff_model import parse_diff
 from ..report.models import ConflictWarning
 
 
@@ -52,6 +55,89 @@ def _format_line_ranges(ranges: list[tuple[int, int]] | None) -> str:
     return ", ".join(parts)
 
 
+# 프롬프트에 나열할 겹침 구간 최대 개수
+MAX_OVERLAP_PAIRS = 10
+# 토큰 수 추정용 (코드/diff 기준 대략 4 chars ≈ 1 token)
+_CHARS_PER_TOKEN = 4
+
+
+def _truncate_lines(text: str, max_chars: int) -> str:
+    """Cut text at a line boundary so it fits in max_chars."""
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", 0, max_chars)
+    return text[: cut if cut > 0 else max_chars] + "\n... (truncated)"
+
+
+def hunk_windows(
+    file_diff: str,
+    windows: list[tuple[int, int]] | None,
+    context_lines: int = 3,
+    max_chars: int = 3000,
+) -> str:
+    """
+    Only the parts of a file diff that fall inside the given line windows.
+
+    Hunks that don't touch any window are dropped; inside the kept hunks, lines
+    farther than context_lines from a window are replaced by a single " ..." line.
+
+    Args:
+        file_diff: Diff of one file (one side of the conflict)
+        windows: New-file line ranges to keep (None: keep hunks in order until the budget)
+        context_lines: Lines of context kept around each window
+        max_chars: Character budget for the result
+
+    Returns:
+        Hunk header lines plus the windowed lines, cut to max_chars
+    """
+    text = file_diff
+    hunks = [hunk for f in parse_diff(text).files for hunk in f.hunks]
+    if not hunks:
+        # 헝크 헤더가 없는 붙여넣기 diff
+        return _truncate_lines(text, max_chars)
+
+    spans = [(start - context_lines, end + context_lines) for start, end in windows or []]
+    parts = []
+    for hunk in hunks:
+        lines = text[hunk.start:hunk.end].rstrip("\n").split("\n")
+        if not spans:
+            parts.append("\n".join(lines))
+            continue
+
+        hunk_start, hunk_end = hunk.new_range
+        if not any(lo <= hunk_end and hunk_start <= hi for lo, hi in spans):
+            continue
+
+        kept = [lines[0]]
+        new_line = hunk.new_start
+        skipping = False
+        for line in lines[1:]:
+            if any(lo <= new_line <= hi for lo, hi in spans):
+                kept.append(line)
+                skipping = False
+            elif not skipping:
+                kept.append(" ...")
+                skipping = True
+            if not line.startswith("-"):
+                new_line += 1
+        parts.append("\n".join(kept))
+
+    return _truncate_lines("\n".join(parts), max_chars)
+
+
+def _format_overlaps(overlaps: list[tuple[tuple[int, int], tuple[int, int]]] | None) -> str:
+    """Format (my_range, base_range) pairs for the prompt."""
+    if not overlaps:
+        return "none"
+    shown = [
+        f"{_format_line_ranges([mine])} <-> {_format_line_ranges([base])}"
+        for mine, base in overlaps[:MAX_OVERLAP_PAIRS]
+    ]
+    if len(overlaps) > MAX_OVERLAP_PAIRS:
+        shown.append(f"... ({len(overlaps) - MAX_OVERLAP_PAIRS} more)")
+    return ", ".join(shown)
+
+
 def create_conflict_prompt(
     file_path: str,
     my_changes: str,
@@ -60,10 +146,26 @@ def create_conflict_prompt(
     my_line_ranges: list[tuple[int, int]] | None = None,
     base_line_ranges: list[tuple[int, int]] | None = None,
     base_branch: str | None = None,
+    overlapping_ranges: list[tuple[tuple[int, int], tuple[int, int]]] | None = None,
+    token_budget: int = 1500,
+    context_lines: int = 3,
 ) -> str:
-    """Create conflict analysis prompt."""
+    """
+    Create conflict analysis prompt.
+
+    Each side's diff is reduced to the hunks around the overlapping line
+    windows (plus context_lines), and both sides share token_budget.
+    """
     overlap_info = "Yes" if line_overlap else "No"
 
+    # 겹치는 구간(양쪽 범위의 교집합)만 창으로 사용, 겹침이 없으면 앞쪽 헝크부터 예산까지
+    windows = [
+        (max(mine[0], base[0]), min(mine[1], base[1])) for mine, base in overlapping_ranges or []
+    ]
+    side_chars = token_budget * _CHARS_PER_TOKEN // 2
+    my_window = hunk_windows(my_changes, windows, context_lines, side_chars)
+    their_window = hunk_windows(their_changes, windows, context_lines, side_chars)
+
     base_branch_label = base_branch or "base"
     my_ranges = _format_line_ranges(my_line_ranges)
     base_ranges = _format_line_ranges(base_line_ranges)
@@ -73,15 +175,16 @@ Base branch: {base_branch_label}
 Line overlap: {overlap_info}
 My line ranges: {my_ranges}
 {base_branch_label} line ranges: {base_ranges}
+Overlapping ranges (mine <-> {base_branch_label}): {_format_overlaps(overlapping_ranges)}
 
-MY CHANGES:
+MY CHANGES (overlapping hunks only):
 ```diff
-{my_changes[:800]}
+{my_window}
 ```
 
-BASE BRANCH CHANGES:
+BASE BRANCH CHANGES (overlapping hunks only):
 ```diff
-{their_changes[:800]}
+{their_window}
 ```
 
 Analyze and return JSON with these fields:
@@ -136,6 +239,10 @@ def analyze_conflict(
     my_line_ranges: list[tuple[int, int]] | None = None,
     base_line_ranges: list[tuple[int, int]] | None = None,
     base_branch: str | None = None,
+    timeout: float | None = None,
+    overlapping_ranges: list[tuple[tuple[int, int], tuple[int, int]]] | None = None,
+    token_budget: int = 1500,
+    context_lines: int = 3,
 ) -> ConflictWarning:
     """
     Analyze potential merge conflict using LLM.
@@ -145,13 +252,20 @@ def analyze_conflict(
         my_changes: My branch's diff for this file
         their_changes: Base branch's diff for this file
         line_overlap: Whether line ranges overlap
+        overlapping_ranges: Exact overlapping (my_range, base_range) pairs
+            (from git_ops.find_overlapping_ranges)
+        token_budget: Approximate token budget for both diff excerpts in the prompt
+        context_lines: Context lines kept around each overlapping window
+        timeout: Per-call request timeout in seconds (on timeout the line-overlap
+            heuristic below is returned)
 
     Returns:
         ConflictWarning with analysis results
     """
-    llm = ChatOpenAI(
-        model="gpt-4o-mini",
+    llm = get_chat_model(
         temperature=0.1,
+        timeout=timeout,
+        max_retries=0 if timeout else 2,  # 타임아웃이 있으면 재시도로 지연이 배로 늘지 않게 함
         model_kwargs={"response_format": {"type": "json_object"}}
     )
 
@@ -163,6 +277,9 @@ def analyze_conflict(
         my_line_ranges=my_line_ranges,
         base_line_ranges=base_line_ranges,
         base_branch=base_branch,
+        overlapping_ranges=overlapping_ranges,
+        token_budget=token_budget,
+        context_lines=context_lines,
     )
 
     messages = [
@@ -171,7 +288,7 @@ def analyze_conflict(
     ]
 
     try:
-        response = llm.invoke(messages)
+        response = cached_invoke(llm, messages, "conflict_analyzer")
         content = response.content
 
         if isinstance(content, dict):
@@ -216,6 +333,8 @@ def analyze_conflict(
         if line_overlap:
             probability = 0.7
             advice = "같은 라인을 수정하여 충돌 가능성이 높습니다. 수동 병합이 필요할 수 있습니다."
+            if overlapping_ranges:
+                advice += f" (겹치는 구간: {_format_overlaps(overlapping_ranges)})"
         else:
             probability = 0.3
             advice = "다른 라인을 수정하여 자동 병합될 가능성이 높습니다."
@@ -231,3 +350,39 @@ def analyze_conflict(
             their_changes=their_changes[:500],
             line_overlap=line_overlap,
         )
+
+
+def analyze_conflicts(
+    requests: List[Dict[str, Any]],
+    max_concurrency: int = 4,
+    timeout: float | None = None,
+) -> List[Optional[ConflictWarning]]:
+    """
+    Run analyze_conflict for several files concurrently.
+
+    LLM calls are I/O bound, so a small thread pool keeps total latency close to
+    the slowest call instead of the sum of all calls.
+
+    Args:
+        requests: analyze_conflict keyword arguments, one dict per file
+        max_concurrency: Maximum number of LLM calls in flight
+        timeout: Per-call request timeout in seconds
+
+    Returns:
+        ConflictWarning per request, in the same order as requests
+        (None where the analysis itself failed, e.g. missing API key)
+    """
+    if not requests:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(requests)))) as pool:
+        futures = [pool.submit(analyze_conflict, **request, timeout=timeout) for request in requests]
+
+        warnings: List[Optional[ConflictWarning]] = []
+        for request, future in zip(requests, futures):
+            try:
+                warnings.append(future.result())
+            except Exception as e:
+                print(f"⚠️  {request['file_path']}: 분석 실패 - {e}")
+                warnings.append(None)
+        return warnings
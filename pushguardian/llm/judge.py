@@ -1,12 +1,29 @@
 """LLM-based soft check judge using structured output."""
 
 import json
-from typing import List, Dict, Any
-from langchain_openai import ChatOpenAI
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import List, Dict, Any, Optional
 from langchain_core.messages import SystemMessage, HumanMessage
+from .client import get_chat_model
+from .cache import cached_invoke
+from ..diff_model import parse_diff
 from ..report.models import Finding
 
 
+# 토큰 수 추정용 (코드/diff 기준 대략 4 chars ≈ 1 token)
+_CHARS_PER_TOKEN = 4
+_SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+DEFAULT_SOFT_JUDGE_CONFIG = {
+    "chunk_token_budget": 3000,
+    "max_chunks": 12,
+    "max_concurrency": 4,
+    "llm_timeout": 60,
+    "max_retries": 2,
+}
+
+
 JUDGE_SYSTEM_PROMPT = """You are a code security and best-practice analyzer.
 
 Your task is to analyze git diffs and identify potential issues based on soft check rules.
@@ -30,12 +47,25 @@ def create_judge_prompt(
     soft_checks: List[Dict[str, str]],
     stacks_known: List[str],
     stacks_weak: List[str],
+    part: Optional[tuple[int, int]] = None,
 ) -> str:
-    """Create the judge prompt with context."""
+    """
+    Create the judge prompt with context.
+
+    diff_text is embedded as-is; callers keep it within budget (see chunk_diff).
+    part=(index, total) tells the model it is seeing one chunk of a larger push.
+    """
     checks_desc = "\n".join([f"- {c['name']}: {c['description']}" for c in soft_checks])
 
-    return f"""Analyze this git diff for potential issues.
+    scope = ""
+    if part is not None and part[1] > 1:
+        scope = (
+            f"\nThis is part {part[0]} of {part[1]} of the push diff. "
+            "Other parts are reviewed separately: only report issues visible in this part.\n"
+        )
 
+    return f"""Analyze this git diff for potential issues.
+{scope}
 Soft checks to evaluate:
 {checks_desc}
 
@@ -66,7 +96,7 @@ User's stack profile:
 
 Git diff:
 ```
-{diff_text[:3000]}
+{diff_text}
 ```
 
 Provide your analysis in JSON format (remember: all human-facing text must be in Korean):
@@ -118,69 +148,244 @@ Return ONLY the JSON object, no other text.
 """
 
 
+def _split_lines(text: str, max_chars: int) -> List[str]:
+    """Split text at line boundaries into pieces of at most max_chars (a longer line is cut)."""
+    pieces: List[str] = []
+    current = ""
+    for line in text.splitlines(keepends=True):
+        while len(line) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(line[:max_chars])
+            line = line[max_chars:]
+        if len(current) + len(line) > max_chars:
+            pieces.append(current)
+            current = ""
+        current += line
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_diff(diff_text: str, token_budget: int = 3000) -> List[str]:
+    """
+    Split a diff into judge-sized chunks.
+
+    Whole file sections are packed together while they fit in token_budget; a
+    file larger than the budget is split at hunk boundaries (each piece keeps the
+    file header), and a single oversized hunk is split at line boundaries.
+
+    Args:
+        diff_text: Unified diff (or a pasted snippet without file headers)
+        token_budget: Approximate token budget per chunk
+
+    Returns:
+        Chunks in diff order; concatenated they cover the whole diff
+    """
+    max_chars = max(1, token_budget * _CHARS_PER_TOKEN)
+    model = parse_diff(diff_text)
+    text = model.text
+
+    # (header, body) 단위: 파일 전체, 또는 큰 파일은 헝크별
+    units: List[tuple[str, str]] = []
+    if model.files and text[:model.files[0].start].strip():
+        units.append(("", text[:model.files[0].start]))
+    for file_diff in model.files:
+        section = text[file_diff.start:file_diff.end]
+        if len(section) <= max_chars or not file_diff.hunks:
+            units.append(("", section))
+            continue
+        header = text[file_diff.start:file_diff.hunks[0].start]
+        for hunk in file_diff.hunks:
+            units.append((header, text[hunk.start:hunk.end]))
+    if not model.files:
+        units.append(("", text))
+
+    chunks: List[str] = []
+    current = ""
+    current_header = None
+    for header, body in units:
+        # 같은 파일의 연속 헝크는 헤더를 한 번만 넣음
+        piece = body if header and header == current_header else header + body
+        if current and len(current) + len(piece) > max_chars:
+            chunks.append(current)
+            current, piece = "", header + body
+        if len(piece) > max_chars:
+            budget = max(1, max_chars - len(header))
+            for part in _split_lines(body, budget):
+                chunks.append(header + part)
+            current_header = None
+            continue
+        current += piece
+        current_header = header or None
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+
+def _parse_judge_response(content: str) -> Dict[str, Any]:
+    """Judge JSON (optionally wrapped in a markdown code block) -> result dict with Finding objects."""
+    content = content.strip()
+
+    # Try to extract JSON from markdown code blocks if present
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0].strip()
+
+    result = json.loads(content)
+
+    # Convert findings to Finding objects
+    findings_list = []
+    for f in result.get("findings", []):
+        findings_list.append(
+            Finding(
+                kind=f.get("kind", "structure"),
+                title=f["title"],
+                detail=f["detail"],
+                confidence=f.get("confidence", 0.7),
+                severity=f.get("severity", "medium"),
+                fix_now=f.get("fix_now", "Review and address the issue"),
+            )
+        )
+
+    return {
+        "findings": findings_list,
+        "risk_score": result.get("risk_score", 0.5),
+        "severity": result.get("severity", "medium"),
+        "decision_suggestion": result.get("decision_suggestion", "allow"),
+        "quick_fixes": result.get("quick_fixes", []),
+        "learning_points": result.get("learning_points", []),
+    }
+
+
+def _merge_findings(current: Finding, other: Finding) -> Finding:
+    """Merge the same issue reported for another file/chunk, keeping every detail in chunk order."""
+    best = other if other.confidence > current.confidence else current
+    detail = current.detail if other.detail in current.detail else f"{current.detail}\n\n{other.detail}"
+    severity = max((current.severity, other.severity), key=lambda s: _SEVERITY_RANK.get(s, 0))
+    return replace(best, detail=detail, severity=severity)
+
+
+def reduce_judge_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-chunk judge results into one.
+
+    - risk_score / severity: 가장 높은 값 (한 청크라도 위험하면 전체가 위험)
+    - decision_suggestion: 하나라도 block이면 block
+    - findings: (kind, title)이 같으면 하나로 합치되, 파일/위치별 detail은 모두 이어 붙여 유지
+      (confidence/severity는 높은 쪽)
+    - quick_fixes / learning_points: 순서를 유지하며 중복 제거
+
+    Args:
+        results: Parsed judge results in chunk order
+
+    Returns:
+        Single result dict in the run_soft_judge format
+    """
+    findings: Dict[tuple, Finding] = {}
+    quick_fixes: Dict[str, None] = {}
+    learning_points: Dict[tuple, Dict[str, Any]] = {}
+    risk_score = 0.0
+    severity = "low"
+    decision = "allow"
+
+    for result in results:
+        for finding in result.get("findings", []):
+            key = (finding.kind, " ".join(finding.title.lower().split()))
+            findings[key] = _merge_findings(findings[key], finding) if key in findings else finding
+        for fix in result.get("quick_fixes", []):
+            quick_fixes.setdefault(str(fix).strip(), None)
+        for point in result.get("learning_points", []):
+            key = (str(point.get("stack", "")).lower(), str(point.get("concept", "")).strip().lower())
+            learning_points.setdefault(key, point)
+
+        try:
+            risk_score = max(risk_score, float(result.get("risk_score", 0.0)))
+        except (TypeError, ValueError):
+            pass
+        chunk_severity = result.get("severity", "low")
+        if _SEVERITY_RANK.get(chunk_severity, 0) > _SEVERITY_RANK[severity]:
+            severity = chunk_severity
+        if result.get("decision_suggestion") == "block":
+            decision = "block"
+
+    return {
+        "findings": list(findings.values()),
+        "risk_score": risk_score,
+        "severity": severity,
+        "decision_suggestion": decision,
+        "quick_fixes": [fix for fix in quick_fixes if fix],
+        "learning_points": list(learning_points.values()),
+    }
+
+
 def run_soft_judge(
     diff_text: str,
     soft_checks: List[Dict[str, str]],
     stacks_known: List[str],
     stacks_weak: List[str],
+    judge_config: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Run LLM-based soft check analysis.
 
+    The diff is split into chunks (chunk_diff) that are judged concurrently and
+    merged with reduce_judge_results, so every file is reviewed while wall-clock
+    time stays close to a single call.
+
     Args:
         diff_text: Git diff content
         soft_checks: List of soft check definitions from config
         stacks_known: User's known stacks
         stacks_weak: User's weak stacks
+        judge_config: config["soft_judge"] (chunk_token_budget, max_chunks,
+            max_concurrency, llm_timeout, max_retries)
 
     Returns:
         Dictionary with findings, risk_score, severity, etc.
+        ("error" is set when every chunk failed, "chunk_errors" when only some did)
     """
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
+    config = {**DEFAULT_SOFT_JUDGE_CONFIG, **(judge_config or {})}
+    timeout = config.get("llm_timeout") or None
+    llm = get_chat_model(
+        temperature=0.1,
+        timeout=timeout,
+        max_retries=config.get("max_retries", 2),  # 청크 판정이 일시적 429/5xx로 빠지지 않도록 재시도
+    )
 
-    prompt = create_judge_prompt(diff_text, soft_checks, stacks_known, stacks_weak)
+    chunks = chunk_diff(diff_text, config.get("chunk_token_budget", 3000))
+    max_chunks = config.get("max_chunks", 12)
+    skipped = 0
+    if max_chunks and len(chunks) > max_chunks:
+        # 비용 상한: 앞쪽 청크부터 분석하고 나머지는 건너뜀
+        skipped = len(chunks) - max_chunks
+        chunks = chunks[:max_chunks]
 
-    messages = [
-        SystemMessage(content=JUDGE_SYSTEM_PROMPT),
-        HumanMessage(content=prompt),
-    ]
-
-    try:
-        response = llm.invoke(messages)
-        content = response.content.strip()
-
-        # Try to extract JSON from markdown code blocks if present
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0].strip()
-
-        result = json.loads(content)
-
-        # Convert findings to Finding objects
-        findings_list = []
-        for f in result.get("findings", []):
-            findings_list.append(
-                Finding(
-                    kind=f.get("kind", "structure"),
-                    title=f["title"],
-                    detail=f["detail"],
-                    confidence=f.get("confidence", 0.7),
-                    severity=f.get("severity", "medium"),
-                    fix_now=f.get("fix_now", "Review and address the issue"),
-                )
-            )
+    def judge_chunk(index: int) -> Dict[str, Any]:
+        prompt = create_judge_prompt(
+            chunks[index], soft_checks, stacks_known, stacks_weak, part=(index + 1, len(chunks))
+        )
+        messages = [
+            SystemMessage(content=JUDGE_SYSTEM_PROMPT),
+            HumanMessage(content=prompt),
+        ]
+        response = cached_invoke(llm, messages, "judge")
+        return _parse_judge_response(response.content)
 
-        return {
-            "findings": findings_list,
-            "risk_score": result.get("risk_score", 0.5),
-            "severity": result.get("severity", "medium"),
-            "decision_suggestion": result.get("decision_suggestion", "allow"),
-            "quick_fixes": result.get("quick_fixes", []),
-            "learning_points": result.get("learning_points", []),
-        }
+    results: List[Dict[str, Any]] = []
+    errors: List[str] = []
+    workers = max(1, min(config.get("max_concurrency", 4), len(chunks)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(judge_chunk, index) for index in range(len(chunks))]
+        for index, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                errors.append(f"chunk {index + 1}/{len(chunks)}: {e}")
 
-    except Exception as e:
+    if not results:
         # Fallback if LLM fails
         return {
             "findings": [],
@@ -189,5 +394,13 @@ def run_soft_judge(
             "decision_suggestion": "allow",
             "quick_fixes": [],
             "learning_points": [],
-            "error": str(e),
+            "error": "; ".join(errors) or "empty diff",
         }
+
+    merged = reduce_judge_results(results)
+    merged["chunks"] = len(chunks)
+    if skipped:
+        merged["skipped_chunks"] = skipped
+    if errors:
+        merged["chunk_errors"] = errors
+    return merged
@@ -1,10 +1,16 @@
 """Observation validator - checks if research evidence is sufficient."""
 
 import json
-from typing import List, Dict, Any
-from langchain_openai import ChatOpenAI
+from typing import List, Dict, Any, Optional, Tuple
 from langchain_core.messages import SystemMessage, HumanMessage
+from .client import get_chat_model
+from .cache import cached_invoke
+from ..benchmark.metrics import HIGH_QUALITY_DOMAINS
 from ..report.models import Finding, Evidence
+from ..research.gather import EXAMPLE_SOURCES, PRINCIPLE_SOURCES
+
+
+DEFAULT_FAST_PATH_CONFIG = {"enabled": True, "min_principle_links": 1, "min_example_links": 1}
 
 
 OBSERVE_SYSTEM_PROMPT = """You are a research quality validator focusing on QUALITY over QUANTITY.
@@ -36,6 +42,47 @@ You should output a structured JSON response with:
 """
 
 
+OBSERVE_PLAN_SYSTEM_PROMPT = """You are a research quality validator and research planning agent (ReAct pattern).
+
+In ONE step, evaluate whether the gathered evidence (principle and example links) adequately
+supports the identified security/best-practice findings, and decide the next research action.
+
+QUALITY CRITERIA:
+1. Principle links: Prefer OWASP, NIST, official docs over generic blogs/glossaries
+2. Example links: Prefer GitHub repos, Stack Overflow, detailed tutorials over promotional content
+3. Relevance: Links must directly address the specific finding, not just general topics
+4. Practicality: Examples must show actual code/implementation, not just theory
+
+KOREAN CONTENT ASSESSMENT:
+5. Check if the collected links include sufficient Korean language content
+   (.kr, tistory.com, velog.io, naver.com). Set korean_content_sufficient to false if
+   Korean resources would significantly improve understanding.
+
+IMPORTANT: 1-2 HIGH-QUALITY links are better than 5-10 low-quality links!
+
+You should output a structured JSON response with:
+- is_sufficient: boolean - whether evidence is adequate IN QUALITY (not just quantity)
+- need_more: boolean - whether more HIGH-QUALITY research is needed
+- missing_categories: list of category names still needed (principle/example)
+- relevance_score: 0.0 to 1.0 (quality-weighted, not count-based)
+- korean_content_sufficient: boolean - whether Korean language resources are sufficient
+- next_action: "search_serper" (one more search) | "done"
+- refined_query: string - improved search query for the next search (if needed)
+- filter_domains: list - domains to exclude from results
+- notes: Brief quality assessment (MUST be written in Korean)
+- reasoning: Why you chose next_action (MUST be written in Korean)
+"""
+
+
+def _has_korean_links(evidence: Evidence) -> bool:
+    """True if any collected link looks like a Korean-language source."""
+    all_links = evidence.principle_links + evidence.example_links
+    return any(
+        any(domain in link.lower() for domain in ['.kr', 'tistory', 'velog', 'naver'])
+        for link in all_links
+    )
+
+
 def create_observe_prompt(
     findings: List[Finding], evidence: Evidence, recheck_count: int
 ) -> str:
@@ -127,11 +174,7 @@ def validate_observation(
     # If we've already tried once or more, force stop (but still check Korean content)
     if recheck_count >= 1:
         # Check if we have any Korean content
-        all_links = evidence.principle_links + evidence.example_links
-        has_korean = any(
-            any(domain in link.lower() for domain in ['.kr', 'tistory', 'velog', 'naver'])
-            for link in all_links
-        )
+        has_korean = _has_korean_links(evidence)
 
         result = {
             "is_sufficient": True,  # Force sufficient to stop loop
@@ -149,7 +192,7 @@ def validate_observation(
         return result
 
     # Use LLM to validate
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
+    llm = get_chat_model(temperature=0.1)
 
     prompt = create_observe_prompt(findings, evidence, recheck_count)
 
@@ -159,7 +202,7 @@ def validate_observation(
     ]
 
     try:
-        response = llm.invoke(messages)
+        response = cached_invoke(llm, messages, "observe")
         content = response.content.strip()
 
         # Try to extract JSON
@@ -186,11 +229,7 @@ def validate_observation(
 
     except Exception as e:
         # Fallback: simple heuristic check for Korean content
-        all_links = evidence.principle_links + evidence.example_links
-        has_korean = any(
-            any(domain in link.lower() for domain in ['.kr', 'tistory', 'velog', 'naver'])
-            for link in all_links
-        )
+        has_korean = _has_korean_links(evidence)
 
         result = {
             "is_sufficient": has_principle and has_example or recheck_count >= 2,
@@ -209,3 +248,242 @@ def validate_observation(
             **result
         })
         return result
+
+
+def create_observe_plan_prompt(
+    findings: List[Finding],
+    evidence: Evidence,
+    recheck_count: int,
+    previous_query: str | None = None,
+) -> str:
+    """Create the combined observation + planning prompt."""
+    findings_desc = "\n".join(
+        [f"- [{f.severity}] {f.kind}: {f.title}: {f.detail[:200]}" for f in findings]
+    )
+
+    return f"""Evaluate the research evidence (FOCUS ON QUALITY) and decide the next research action.
+
+Findings:
+{findings_desc}
+
+Evidence gathered:
+- Principle links ({len(evidence.principle_links)}): {evidence.principle_links}
+- Example links ({len(evidence.example_links)}): {evidence.example_links}
+- Notes: {evidence.notes}
+
+Current research loop count: {recheck_count}/1
+Previous query: {previous_query or 'N/A'}
+
+QUALITY REQUIREMENTS (not just count):
+1. At least 1 HIGH-QUALITY principle link (OWASP, NIST, CWE, official security docs)
+   - NOT glossary pages, NOT promotional content, NOT generic blogs
+2. At least 1 HIGH-QUALITY example link (GitHub with actual code, detailed Stack Overflow, step-by-step tutorial)
+   - NOT just links to homepage, NOT promotional articles
+3. Links must DIRECTLY address the specific security issue, not just the general topic
+
+DECISION:
+- Evidence good enough → "is_sufficient": true, "next_action": "done"
+- Glossaries, promotional pages or off-topic links → "need_more": true, "next_action": "search_serper"
+  with a "refined_query" that targets the specific issue
+- Max 1 retry allowed, so be realistic in evaluation
+
+KOREAN CONTENT CHECK (for korean_content_sufficient field):
+- FALSE if no Korean language sources were found AND the topic would benefit from Korean examples/tutorials
+- TRUE if there is already 1+ Korean source OR the topic is well-covered by English sources
+
+Provide your answer in JSON format. `notes` and `reasoning` must be written in Korean (한국어):
+{{
+    "is_sufficient": true/false,
+    "need_more": true/false,
+    "missing_categories": ["principle"/"example" if high-quality is missing],
+    "relevance_score": 0.0-1.0,
+    "korean_content_sufficient": true/false,
+    "next_action": "search_serper|done",
+    "refined_query": "improved search query here",
+    "filter_domains": ["domain1.com"],
+    "notes": "품질 평가 (한글 자료 현황 포함)",
+    "reasoning": "다음 액션을 선택한 이유"
+}}
+
+Return ONLY the JSON object, no other text.
+"""
+
+
+def observe_and_plan(
+    findings: List[Finding],
+    evidence: Evidence,
+    recheck_count: int,
+    previous_query: str | None = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Evidence validation and next-action planning in a single LLM call.
+
+    Same outputs as validate_observation + plan_next_research, with one
+    round-trip instead of two. Once the research loop has run
+    (recheck_count >= 1) routing no longer depends on the plan, so no LLM
+    call is made and the Korean-content check uses the domain heuristic.
+
+    Args:
+        findings: Current findings
+        evidence: Evidence gathered so far (the observation is appended to llm_observations)
+        recheck_count: Number of research attempts
+        previous_query: Last search query used
+
+    Returns:
+        (observation, plan) in the validate_observation / plan_next_research formats
+    """
+    if not findings or recheck_count >= 1:
+        # LLM 호출 없이 기존 두 함수의 조기 종료 결과를 그대로 사용
+        observation = validate_observation(findings, evidence, recheck_count)
+        plan = {
+            "is_sufficient": True,
+            "missing_categories": [],
+            "next_action": "done",
+            "refined_query": "",
+            "filter_domains": [],
+            "reasoning": "No findings to research" if not findings else "Max research attempts reached, stopping",
+        }
+        return observation, plan
+
+    llm = get_chat_model(temperature=0.1)
+
+    prompt = create_observe_plan_prompt(findings, evidence, recheck_count, previous_query)
+
+    messages = [
+        SystemMessage(content=OBSERVE_PLAN_SYSTEM_PROMPT),
+        HumanMessage(content=prompt),
+    ]
+
+    try:
+        response = cached_invoke(llm, messages, "observe_plan")
+        content = response.content.strip()
+
+        # Try to extract JSON
+        if "```json" in content:
+            content = content.split("```json")[1].split("```")[0].strip()
+        elif "```" in content:
+            content = content.split("```")[1].split("```")[0].strip()
+
+        result = json.loads(content)
+
+        observation = {
+            "is_sufficient": result.get("is_sufficient", False),
+            "need_more": result.get("need_more", False),
+            "missing_categories": result.get("missing_categories", []),
+            "relevance_score": result.get("relevance_score", 0.5),
+            "korean_content_sufficient": result.get("korean_content_sufficient", True),
+            "notes": result.get("notes", ""),
+        }
+        plan = {
+            "is_sufficient": observation["is_sufficient"],
+            "missing_categories": observation["missing_categories"],
+            "next_action": result.get("next_action", "done"),
+            "refined_query": result.get("refined_query", ""),
+            "filter_domains": result.get("filter_domains", []),
+            "reasoning": result.get("reasoning", "LLM decision"),
+        }
+        model = "gpt-4o-mini (observe+plan)"
+
+    except Exception as e:
+        # Fallback: same heuristics as the two separate calls
+        has_principle = len(evidence.principle_links) > 0
+        has_example = len(evidence.example_links) > 0
+        missing = (["principle"] if not has_principle else []) + (["example"] if not has_example else [])
+
+        observation = {
+            "is_sufficient": has_principle and has_example,
+            "need_more": bool(missing),
+            "missing_categories": missing,
+            "relevance_score": 0.5,
+            "korean_content_sufficient": _has_korean_links(evidence),
+            "notes": f"LLM validation failed: {e}",
+        }
+        plan = {
+            "is_sufficient": has_principle and has_example,
+            "missing_categories": missing,
+            "next_action": "done" if has_principle and has_example else "search_serper",
+            "refined_query": "",
+            "filter_domains": [],
+            "reasoning": f"Fallback heuristic (LLM failed: {e})",
+        }
+        model = "gpt-4o-mini (observe+plan fallback)"
+
+    evidence.llm_observations.append({
+        "iteration": recheck_count,
+        "model": model,
+        **observation
+    })
+    return observation, plan
+
+
+def count_trusted_links(evidence: Evidence) -> Tuple[int, int]:
+    """
+    Number of principle / example links from trusted domains.
+
+    Principle links count when they match gather.PRINCIPLE_SOURCES or the benchmark's
+    HIGH_QUALITY_DOMAINS; example links when they match gather.EXAMPLE_SOURCES.
+    """
+    principle_sources = PRINCIPLE_SOURCES + tuple(HIGH_QUALITY_DOMAINS)
+    principle = sum(
+        1 for link in evidence.principle_links if any(src in link.lower() for src in principle_sources)
+    )
+    example = sum(
+        1 for link in evidence.example_links if any(src in link.lower() for src in EXAMPLE_SOURCES)
+    )
+    return principle, example
+
+
+def fast_path_observation(
+    findings: List[Finding],
+    evidence: Evidence,
+    recheck_count: int,
+    fast_path_config: Optional[Dict[str, Any]] = None,
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Deterministic sufficiency check that skips the observer/planner LLM calls.
+
+    - 신뢰 도메인 원리 링크와 예시 링크가 각각 기준 개수 이상이면 충분하다고 판정
+    - 판정 결과는 evidence.llm_observations에 "fast_path": True로 기록 (발동 빈도 확인용)
+    - 한글 자료 여부는 도메인 휴리스틱으로 판정 (HITL 트리거에 사용)
+
+    Args:
+        findings: Current findings
+        evidence: Evidence gathered so far
+        recheck_count: Number of research attempts
+        fast_path_config: config["research"]["fast_path"] (enabled, min_principle_links, min_example_links)
+
+    Returns:
+        (observation, plan) when the thresholds are met, otherwise None (ask the LLM)
+    """
+    config = {**DEFAULT_FAST_PATH_CONFIG, **(fast_path_config or {})}
+    if not config.get("enabled", True) or not findings:
+        return None
+
+    principle, example = count_trusted_links(evidence)
+    if principle < config.get("min_principle_links", 1) or example < config.get("min_example_links", 1):
+        return None
+
+    notes = f"신뢰 도메인 원리 링크 {principle}개, 예시 링크 {example}개로 충분 (규칙 기반 판정, LLM 생략)"
+    observation = {
+        "is_sufficient": True,
+        "need_more": False,
+        "missing_categories": [],
+        "relevance_score": 1.0,
+        "korean_content_sufficient": _has_korean_links(evidence),
+        "notes": notes,
+    }
+    plan = {
+        "is_sufficient": True,
+        "missing_categories": [],
+        "next_action": "done",
+        "refined_query": "",
+        "filter_domains": [],
+        "reasoning": notes,
+    }
+    evidence.llm_observations.append({
+        "iteration": recheck_count,
+        "model": "rule-based (fast path)",
+        "fast_path": True,
+        **observation
+    })
+    return observation, plan
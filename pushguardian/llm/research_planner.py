@@ -2,8 +2,9 @@
 
 import json
 from typing import List, Dict, Any
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
+from .client import get_chat_model
+from .cache import cached_invoke
 from ..report.models import Finding, Evidence
 
 
@@ -113,7 +114,7 @@ def plan_next_research(
         }
 
     # Use LLM to decide
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
+    llm = get_chat_model(temperature=0.1)
 
     prompt = create_planner_prompt(findings, evidence, recheck_count, previous_query)
 
@@ -123,7 +124,7 @@ def plan_next_research(
     ]
 
     try:
-        response = llm.invoke(messages)
+        response = cached_invoke(llm, messages, "research_planner")
         content = response.content.strip()
 
         # Extract JSON
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import atexit
 import subprocess
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional
+
+from .diff_model import iter_file_chunks
+from .git_objects import GitObjectReader
+from .git_ops import stream_git_lines
 
 
 class RepoContext:
@@ -13,10 +19,30 @@ class RepoContext:
     - 특정 루트 경로 기준으로 git 명령을 실행
     - origin/main 대비 앞서 있는 커밋 개수 계산
     - 마지막 N개 커밋에 대한 diff 범위 추출
+    - 객체 조회(존재 여부, 크기, blob 내용)는 하나의 git cat-file --batch 파이프로 처리
     """
 
     def __init__(self, root: str | Path):
         self.root = Path(root).resolve()
+        self._objects: Optional[GitObjectReader] = None
+
+    @property
+    def objects(self) -> GitObjectReader:
+        """Long-lived cat-file reader for this repository (started on first use)."""
+        if self._objects is None:
+            self._objects = GitObjectReader(self.root)
+        return self._objects
+
+    def close(self) -> None:
+        """Stop the cat-file processes."""
+        if self._objects is not None:
+            self._objects.close()
+
+    def __enter__(self) -> "RepoContext":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def _run_git(self, args: list[str]) -> str:
         """해당 레포 루트 기준으로 git 명령을 실행하고 stdout을 반환."""
@@ -37,8 +63,9 @@ class RepoContext:
         base_ref가 존재하지 않으면 (원격 브랜치가 없는 경우) 전체 커밋 수를 반환.
         """
         try:
-            # 먼저 base_ref가 존재하는지 확인
-            self._run_git(["rev-parse", "--verify", base_ref])
+            # 먼저 base_ref가 존재하는지 확인 (cat-file 파이프 재사용, 프로세스 생성 없음)
+            if not self.objects.exists(base_ref):
+                raise RuntimeError(f"unknown ref: {base_ref}")
             # 존재하면 정상적으로 범위 계산
             out = self._run_git(["rev-list", "--count", f"{base_ref}..{head_ref}"])
             return int(out or "0")
@@ -52,7 +79,12 @@ class RepoContext:
 
     def diff_range(self, base_ref: str, head_ref: str = "HEAD") -> str:
         """특정 ref 범위의 git diff를 반환."""
-        return self._run_git(["git", "diff", f"{base_ref}..{head_ref}"])
+        return self._run_git(["diff", f"{base_ref}..{head_ref}"])
+
+    def stream_diff_range(self, base_ref: str, head_ref: str = "HEAD") -> Iterator[str]:
+        """특정 ref 범위의 git diff를 파일 단위 청크로 스트리밍 (stdout 전체를 메모리에 올리지 않음)."""
+        lines = stream_git_lines(["git", "diff", f"{base_ref}..{head_ref}"], str(self.root))
+        yield from iter_file_chunks(lines)
 
     def diff_last_n_commits(self, n: int, head_ref: str = "HEAD") -> str:
         """마지막 N개 커밋에 대한 diff (HEAD~N..HEAD)를 반환. n<=0이면 빈 문자열.
@@ -63,20 +95,44 @@ class RepoContext:
             return ""
 
         try:
-            # 전체 커밋 수 확인
-            total_commits = int(self._run_git(["rev-list", "--count", head_ref]))
-
-            if total_commits == 0:
+            if not self.objects.exists(head_ref):
+                # 커밋이 하나도 없음
                 return ""
-            elif total_commits <= n:
-                # 전체 커밋 수가 N 이하면, 첫 커밋부터의 diff (빈 트리 대비)
-                return self._run_git(["diff", "4b825dc642cb6eb9a060e54bf8d69288fbee4904", head_ref])
-            else:
+
+            base = f"{head_ref}~{n}"
+            if self.objects.exists(base):
                 # 정상 케이스: HEAD~N..HEAD
-                base = f"{head_ref}~{n}"
                 return self._run_git(["diff", f"{base}..{head_ref}"])
 
+            # 전체 커밋 수가 N 이하면, 첫 커밋부터의 diff (빈 트리 대비)
+            return self._run_git(["diff", "4b825dc642cb6eb9a060e54bf8d69288fbee4904", head_ref])
+
         except (RuntimeError, ValueError):
             return ""
 
 
+_contexts: Dict[str, RepoContext] = {}
+_contexts_lock = threading.Lock()
+
+
+def get_repo_context(root: str | Path) -> RepoContext:
+    """
+    Shared RepoContext per repository root, so every node of a run reuses the same cat-file pipes.
+
+    Args:
+        root: Git repository root
+
+    Returns:
+        RepoContext (closed automatically at interpreter exit)
+    """
+    key = str(Path(root).resolve())
+    with _contexts_lock:
+        if key not in _contexts:
+            _contexts[key] = RepoContext(key)
+        return _contexts[key]
+
+
+@atexit.register
+def _close_contexts() -> None:
+    for context in _contexts.values():
+        context.close()
@@ -10,7 +10,7 @@ class ConflictWarning:
 
     file_path: str  # 충돌 발생 가능 파일
     conflict_probability: float  # 0.0 to 1.0
-    conflict_type: Literal["routing", "config", "refactoring", "semantic_duplicate", "unknown"]
+    conflict_type: Literal["routing", "config", "refactoring", "semantic_duplicate", "merge_conflict", "unknown"]
     recommendation: Literal["keep_both", "choose_one", "manual_merge"]
     advice_ko: str  # 한국어 조언
     merge_suggestion_ko: str  # 병합 권장 방법
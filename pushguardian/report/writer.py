@@ -225,7 +225,14 @@ def generate_report_md(
     # History hint
     if history_hint:
         md_lines.append("## 📅 히스토리 스캔 결과\n")
-        if history_hint.get("first_seen_commit"):
+        if history_hint.get("findings"):
+            # 항목별 최초 커밋 (한 번의 히스토리 스캔으로 정확히 추적)
+            for entry in history_hint["findings"]:
+                commit = entry.get("first_seen_commit")
+                where = f"`{commit}`" if commit else "스캔 범위 내에서 찾지 못함"
+                md_lines.append(f"- {entry.get('title', '')} ({entry.get('target', '')}): {where}\n")
+            md_lines.append("\n")
+        elif history_hint.get("first_seen_commit"):
             md_lines.append(f"최초로 감지된 커밋: `{history_hint['first_seen_commit']}`\n")
         # message 내용 자체는 LLM/로직에서 생성되므로 그대로 사용 (프롬프트를 한국어화하면 이 부분도 자연스럽게 한글로 생성됨)
         md_lines.append(f"{history_hint.get('message', '히스토리 정보가 없습니다.')}\n\n")
@@ -29,6 +29,27 @@ EXAMPLE_KEYWORDS = [
     "step by step",
 ]
 
+# 신뢰할 수 있는 원리/베스트프랙티스 출처 (수집 시 앞쪽에 배치, 충분성 규칙 판정에도 사용)
+PRINCIPLE_SOURCES = (
+    "owasp.org",
+    "cheatsheetseries.owasp.org",
+    "nist.gov",
+    "cwe.mitre.org",
+    "nvd.nist.gov",
+    "docs.github.com/security",
+    "security.googleblog.com",
+    "learn.microsoft.com/security",
+)
+
+# 신뢰할 수 있는 예시 출처
+EXAMPLE_SOURCES = (
+    "github.com",
+    "stackoverflow.com",
+    "dev.to",
+    "auth0.com/blog",
+    "snyk.io/blog",
+)
+
 
 def _build_compact_summary(title: str, content: str, max_len: int = 80) -> str:
     """
@@ -232,30 +253,9 @@ def gather_research(
             content = result.get("content", "") or ""
             category = categorize_link(result.get("url", ""), title, content)
 
-            # High-quality sources for principles
-            principle_sources = [
-                "owasp.org",
-                "cheatsheetseries.owasp.org",
-                "nist.gov",
-                "cwe.mitre.org",
-                "nvd.nist.gov",
-                "docs.github.com/security",
-                "security.googleblog.com",
-                "learn.microsoft.com/security",
-            ]
-
-            # High-quality sources for examples
-            example_sources = [
-                "github.com",
-                "stackoverflow.com",
-                "dev.to",
-                "auth0.com/blog",
-                "snyk.io/blog",
-            ]
-
             # Calculate quality score
-            is_high_quality_principle = any(src in url.lower() for src in principle_sources)
-            is_high_quality_example = any(src in url.lower() for src in example_sources)
+            is_high_quality_principle = any(src in url.lower() for src in PRINCIPLE_SOURCES)
+            is_high_quality_example = any(src in url.lower() for src in EXAMPLE_SOURCES)
 
             # 간단한 source 토큰 분류
             source_tag = "other"
@@ -2,9 +2,10 @@
 
 from typing import List, Dict, Any
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from ..llm.client import get_chat_model
+from ..llm.cache import cached_invoke
 from ..report.models import Evidence
 
 
@@ -62,7 +63,7 @@ def annotate_link_titles_with_llm(evidence: Evidence, max_items: int = 8) -> Non
         return
 
     # LLM 호출 준비
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+    llm = get_chat_model(temperature=0.3)
 
     payload = [
         {"id": idx + 1, "summary": c["summary"]} for idx, c in enumerate(candidates)
@@ -84,7 +85,7 @@ def annotate_link_titles_with_llm(evidence: Evidence, max_items: int = 8) -> Non
     ]
 
     try:
-        response = llm.invoke(messages)
+        response = cached_invoke(llm, messages, "link_annotator")
         content = response.content.strip()
 
         # 코드 블록 감싸짐 방어
@@ -2,8 +2,9 @@
 
 import json
 from typing import List, Dict, Any
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
+from ..llm.client import get_chat_model
+from ..llm.cache import cached_invoke
 
 
 NAVER_FILTER_SYSTEM_PROMPT = """당신은 보안 자료의 품질을 평가하는 전문가입니다.
@@ -136,7 +137,7 @@ JSON 형식으로만 응답하세요 (다른 텍스트 없이).
 JSON 형식으로만 응답하세요 (다른 텍스트 없이).
 """
 
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
+    llm = get_chat_model(temperature=0.1)
 
     messages = [
         SystemMessage(content=NAVER_FILTER_SYSTEM_PROMPT),
@@ -145,7 +146,7 @@ JSON 형식으로만 응답하세요 (다른 텍스트 없이).
 
     try:
         print(f"🤖 LLM 필터링 시작: {len(results)}개 결과 평가 중...")
-        response = llm.invoke(messages)
+        response = cached_invoke(llm, messages, "naver_filter")
         content = response.content.strip()
 
         print(f"📝 LLM 응답 (처음 200자): {content[:200]}")
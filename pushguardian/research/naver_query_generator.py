@@ -1,8 +1,9 @@
 """LLM을 사용하여 네이버 검색 쿼리를 동적으로 생성"""
 
 import json
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
+from ..llm.client import get_chat_model
+from ..llm.cache import cached_invoke
 
 
 QUERY_GEN_SYSTEM_PROMPT = """당신은 보안 이슈에 대한 한글 검색 쿼리를 생성하는 전문가입니다.
@@ -52,7 +53,7 @@ def generate_naver_query(finding_title: str, finding_detail: str, finding_kind:
 JSON 형식으로만 응답하세요 (다른 텍스트 없이).
 """
 
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
+    llm = get_chat_model(temperature=0.2)
 
     messages = [
         SystemMessage(content=QUERY_GEN_SYSTEM_PROMPT),
@@ -60,7 +61,7 @@ JSON 형식으로만 응답하세요 (다른 텍스트 없이).
     ]
 
     try:
-        response = llm.invoke(messages)
+        response = cached_invoke(llm, messages, "naver_query")
         content = response.content.strip()
 
         # JSON 추출
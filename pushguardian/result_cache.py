@@ -0,0 +1,113 @@
+"""Patch-id keyed cache of soft-judge + research results (survives rebases and cherry-picks)."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .cache import SqliteCache
+from .report.models import Evidence, Finding
+
+
+# 저장 포맷이나 결과 병합 방식이 바뀌면 올려서 기존 항목을 무효화
+# 2: 청크 단위 soft judge (create_judge_prompt 변경 + reduce_judge_results 병합)
+RESULT_CACHE_VERSION = 2
+
+# 결과에 영향을 주지 않는 설정 키 (바뀌어도 캐시를 유지)
+_IGNORED_CONFIG_KEYS = (
+    "report_dir", "override_dir", "ui", "scan_cache", "result_cache", "diff_stream", "llm_cache",
+)
+
+
+def prompt_version() -> str:
+    """Hash of every prompt (system prompts + the judge's user-prompt template) that shapes the cached result."""
+    from .llm.judge import JUDGE_SYSTEM_PROMPT, create_judge_prompt
+    from .llm.observe import OBSERVE_PLAN_SYSTEM_PROMPT, OBSERVE_SYSTEM_PROMPT
+    from .llm.research_planner import PLANNER_SYSTEM_PROMPT
+
+    # 판정 유저 프롬프트는 자리표시자로 렌더링해서 템플릿 문구만 해시에 반영
+    judge_template = create_judge_prompt(
+        "{diff}", [{"name": "{check}", "description": "{description}"}], ["{known}"], ["{weak}"], part=(1, 2)
+    )
+    payload = "\n\0".join(
+        [JUDGE_SYSTEM_PROMPT, judge_template, OBSERVE_SYSTEM_PROMPT, OBSERVE_PLAN_SYSTEM_PROMPT, PLANNER_SYSTEM_PROMPT]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def config_hash(config: dict) -> str:
+    """Stable hash of the configuration keys that affect judge/research output."""
+    relevant = {k: v for k, v in config.items() if k not in _IGNORED_CONFIG_KEYS}
+    payload = json.dumps(
+        {"version": RESULT_CACHE_VERSION, "config": relevant}, sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def result_key(patch_ids: List[str], config: dict) -> Optional[str]:
+    """
+    Cache key for a push: the set of patch-ids + config hash + prompt version.
+
+    Patch-ids are sorted, so reordering commits during a rebase still hits.
+
+    Returns:
+        Key string, or None when there are no patch-ids (nothing to key on)
+    """
+    if not patch_ids:
+        return None
+    patches = hashlib.sha256("\n".join(sorted(set(patch_ids))).encode("ascii")).hexdigest()
+    return f"patch:{config_hash(config)}:{prompt_version()}:{patches}"
+
+
+def open_result_cache(config: dict) -> Optional[SqliteCache]:
+    """
+    Open the result cache under the report dir.
+
+    Args:
+        config: Loaded configuration (uses report_dir and result_cache)
+
+    Returns:
+        SqliteCache, or None when disabled or the cache file can't be opened
+    """
+    cache_config = config.get("result_cache", {})
+    if not cache_config.get("enabled", True):
+        return None
+
+    report_dir = config.get("report_dir")
+    if not report_dir:
+        return None
+
+    try:
+        cache = SqliteCache(
+            Path(report_dir) / ".cache" / "result_cache.sqlite",
+            max_bytes=cache_config.get("max_bytes", 16 * 1024 * 1024),
+        )
+        # 설정/프롬프트가 바뀐 이전 결과는 다시 쓰이지 않으므로 정리
+        cache.delete_prefix("patch:", keep_prefix=f"patch:{config_hash(config)}:{prompt_version()}:")
+        return cache
+    except Exception:
+        return None
+
+
+def dump_result(state: dict) -> Dict[str, Any]:
+    """Serialize the soft-judge + research part of a finished run."""
+    return {
+        "soft_findings": [f.to_dict() for f in state.get("soft_findings", [])],
+        "risk_score": state.get("risk_score", 0.0),
+        "severity": state.get("severity", "low"),
+        "quick_fixes": state.get("quick_fixes", []),
+        "learning_points": state.get("learning_points", []),
+        "evidence": state["evidence"].to_dict() if state.get("evidence") else Evidence().to_dict(),
+    }
+
+
+def load_result(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of dump_result: rebuild Finding/Evidence objects."""
+    return {
+        "soft_findings": [Finding(**f) for f in payload.get("soft_findings", [])],
+        "risk_score": payload.get("risk_score", 0.0),
+        "severity": payload.get("severity", "low"),
+        "quick_fixes": payload.get("quick_fixes", []),
+        "learning_points": payload.get("learning_points", []),
+        "evidence": Evidence(**payload.get("evidence", {})),
+    }
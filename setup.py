@@ -8,6 +8,7 @@ setup(
         "python-dotenv>=1.0.0",
         "pyyaml>=6.0",
         "rich>=13.0.0",
+        "numpy>=1.24.0",
         "langgraph>=0.2.0",
         "langchain-core>=0.3.0",
         "langchain-openai>=0.2.0",
@@ -459,6 +459,7 @@ if "final_result" in st.session_state and st.session_state.final_result:
                 "config": "⚙️",
                 "refactoring": "🔧",
                 "semantic_duplicate": "📋",
+                "merge_conflict": "⛔",
                 "unknown": "❓"
             }.get(warning.conflict_type, "⚠️")
 
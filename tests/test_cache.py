@@ -0,0 +1,219 @@
+"""Tests for the on-disk caches."""
+
+import pytest
+from pushguardian.cache import SqliteCache
+from pushguardian.diff_model import parse_diff
+from pushguardian.detectors.secrets import detect_secrets_in_diff
+from pushguardian.detectors import scan_cache
+from pushguardian.detectors.scan_cache import detect_secrets_cached, open_scan_cache
+from pushguardian.llm import cache as llm_cache
+from pushguardian.report.models import Evidence, Finding
+from pushguardian.result_cache import dump_result, load_result, open_result_cache, result_key
+
+
+OLD_BLOB = "1" * 40
+NEW_BLOB = "2" * 40
+
+DIFF_TEXT = f"""diff --git a/app.py b/app.py
+index {OLD_BLOB}..{NEW_BLOB} 100644
+--- a/app.py
++++ b/app.py
+@@ -1,1 +1,3 @@
+ import os
++KEY = "sk-live-123"
++AWS = "AKIAEXAMPLE"
+diff --git a/notes.txt b/notes.txt
+index 1234567..89abcde 100644
+--- a/notes.txt
++++ b/notes.txt
+@@ -0,0 +1 @@
++token sk-abc
+"""
+
+
+def test_sqlite_cache_roundtrip_and_lru(tmp_path):
+    """Values roundtrip as JSON and the least recently used entry is evicted first."""
+    cache = SqliteCache(tmp_path / "c.sqlite", max_bytes=40)
+
+    cache.put("a", ["x" * 10])
+    cache.put("b", ["y" * 10])
+    assert cache.get("a") == ["x" * 10]  # touch "a" so "b" becomes LRU
+
+    cache.put("c", ["z" * 10])
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.total_bytes() <= 40
+
+
+def test_delete_prefix_keeps_current(tmp_path):
+    """Only entries of other prefixes are invalidated."""
+    cache = SqliteCache(tmp_path / "c.sqlite")
+    cache.put_many({"secret:old:k": 1, "secret:new:k": 2, "llm:k": 3})
+
+    deleted = cache.delete_prefix("secret:", keep_prefix="secret:new:")
+
+    assert deleted == 1
+    assert cache.get_many(["secret:old:k", "secret:new:k", "llm:k"]) == {"secret:new:k": 2, "llm:k": 3}
+
+
+def test_detect_secrets_cached_matches_uncached(tmp_path, monkeypatch):
+    """Cached scan returns identical findings and skips blobs scanned before."""
+    patterns = ["sk-", "AKIA"]
+    model = parse_diff(DIFF_TEXT)
+    expected = [f.to_dict() for f in detect_secrets_in_diff(model, patterns)]
+
+    cache = open_scan_cache({"report_dir": str(tmp_path)}, patterns)
+    first = detect_secrets_cached(model, patterns, cache)
+    assert [f.to_dict() for f in first] == expected
+
+    scanned = []
+    original = scan_cache.scan_file_hits
+
+    def tracking_scan(scanner, diff_model, file_diff, active=None):
+        scanned.append(file_diff.path)
+        return original(scanner, diff_model, file_diff, active)
+
+    monkeypatch.setattr(scan_cache, "scan_file_hits", tracking_scan)
+
+    second = detect_secrets_cached(parse_diff(DIFF_TEXT), patterns, cache)
+    assert [f.to_dict() for f in second] == expected
+    assert scanned == ["notes.txt"]  # abbreviated SHAs are never cached
+
+
+def test_header_only_section_is_not_cached(tmp_path):
+    """A section whose patch was skipped (max_file_bytes) is neither stored as clean nor served from cache."""
+    patterns = ["sk-"]
+    header_only = f"diff --git a/app.py b/app.py\nindex {OLD_BLOB}..{NEW_BLOB}\n"
+    cache = open_scan_cache({"report_dir": str(tmp_path)}, patterns)
+
+    assert detect_secrets_cached(parse_diff(header_only), patterns, cache) == []
+    assert cache.total_bytes() == 0
+
+    # the same blob pair later arrives with its patch: it must be scanned
+    findings = detect_secrets_cached(parse_diff(DIFF_TEXT), patterns, cache)
+    assert [f.title for f in findings] == ["시크릿 패턴 감지: sk-"] * 2
+    # ...and a later header-only section doesn't pick up those cached line ordinals
+    assert detect_secrets_cached(parse_diff(header_only), patterns, cache) == []
+
+
+def test_scan_cache_errors_fall_back_to_scanning(tmp_path, monkeypatch):
+    """A locked/full cache database never fails the hard-rule scan."""
+    import sqlite3
+
+    patterns = ["sk-", "AKIA"]
+    expected = [f.to_dict() for f in detect_secrets_in_diff(parse_diff(DIFF_TEXT), patterns)]
+    cache = open_scan_cache({"report_dir": str(tmp_path)}, patterns)
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cache, "get_many", locked)
+    monkeypatch.setattr(cache, "put_many", locked)
+
+    findings = detect_secrets_cached(parse_diff(DIFF_TEXT), patterns, cache)
+    assert [f.to_dict() for f in findings] == expected
+
+
+def test_policy_change_invalidates(tmp_path):
+    """Changing hard_abort patterns drops results computed under the old policy."""
+    config = {"report_dir": str(tmp_path)}
+    model = parse_diff(DIFF_TEXT)
+
+    cache = open_scan_cache(config, ["sk-"])
+    detect_secrets_cached(model, ["sk-"], cache)
+    cache.close()
+
+    cache = open_scan_cache(config, ["AKIA"])
+    assert cache.total_bytes() == 0
+    findings = detect_secrets_cached(model, ["AKIA"], cache)
+    assert [f.title for f in findings] == ["시크릿 패턴 감지: AKIA"]
+
+
+def test_result_cache_key_and_roundtrip(tmp_path):
+    """Same patch set (any order) maps to one key; the stored result restores Finding/Evidence."""
+    pytest.importorskip("langchain_openai")  # prompt_version() hashes the LLM system prompts
+    config = {"report_dir": str(tmp_path), "soft_checks": [{"name": "a", "description": "b"}]}
+    key = result_key(["p2", "p1"], config)
+
+    assert key == result_key(["p1", "p2"], config)
+    assert key != result_key(["p1"], config)
+    assert key != result_key(["p1", "p2"], {**config, "soft_checks": []})
+    assert result_key([], config) is None
+
+    state = {
+        "soft_findings": [Finding("dto", "제목", "상세", 0.8, "medium", "수정")],
+        "risk_score": 0.4,
+        "severity": "medium",
+        "quick_fixes": ["fix"],
+        "learning_points": [{"concept": "c"}],
+        "evidence": Evidence(principle_links=["https://owasp.org"], research_iterations=2),
+    }
+    cache = open_result_cache(config)
+    cache.put(key, dump_result(state))
+    restored = load_result(cache.get(key))
+
+    assert restored["soft_findings"] == state["soft_findings"]
+    assert restored["evidence"] == state["evidence"]
+    assert restored["severity"] == "medium"
+
+
+class _FakeMessage:
+    def __init__(self, content, type="human"):
+        self.content = content
+        self.type = type
+
+
+class _FakeLLM:
+    model_name = "gpt-4o-mini"
+    temperature = 0.0
+    model_kwargs = {}
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return _FakeMessage(f"answer {self.calls}", "ai")
+
+
+def test_llm_cache_key():
+    """Key covers model settings, messages and the call-site template tag."""
+    llm = _FakeLLM()
+    messages = [_FakeMessage("sys", "system"), _FakeMessage("diff")]
+    key = llm_cache.cache_key(llm, messages, "judge")
+
+    assert key == llm_cache.cache_key(_FakeLLM(), [_FakeMessage("sys", "system"), _FakeMessage("diff")], "judge")
+    assert key != llm_cache.cache_key(llm, messages, "observe")
+    assert key != llm_cache.cache_key(llm, [_FakeMessage("sys", "system"), _FakeMessage("other")], "judge")
+
+    warm = _FakeLLM()
+    warm.temperature = 0.7
+    assert key != llm_cache.cache_key(warm, messages, "judge")
+
+
+def test_cached_invoke_hit_miss_and_ttl(tmp_path, monkeypatch):
+    """Second identical call is served from disk; expired entries are fetched again."""
+    pytest.importorskip("langchain_core")  # cache hits are rebuilt as AIMessage
+    llm_cache.configure_llm_cache({"report_dir": str(tmp_path), "llm_cache": {"ttl_hours": 1}})
+    llm_cache.reset_cache_stats()
+    llm = _FakeLLM()
+    messages = [_FakeMessage("diff")]
+
+    try:
+        assert llm_cache.cached_invoke(llm, messages, "judge").content == "answer 1"
+        assert llm_cache.cached_invoke(llm, messages, "judge").content == "answer 1"
+        assert llm.calls == 1
+        assert llm_cache.cache_stats() == {"hits": 1, "misses": 1}
+
+        now = llm_cache.time.time()
+        monkeypatch.setattr(llm_cache.time, "time", lambda: now + 2 * 3600)
+        assert llm_cache.cached_invoke(llm, messages, "judge").content == "answer 2"
+        assert llm.calls == 2
+    finally:
+        llm_cache.configure_llm_cache(None)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
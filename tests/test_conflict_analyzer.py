@@ -0,0 +1,113 @@
+"""Tests for the concurrent LLM conflict analysis."""
+
+import threading
+import time
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from pushguardian.llm import conflict_analyzer
+from pushguardian.report.models import ConflictWarning
+
+
+def _fake_analyze(file_path, my_changes, their_changes, line_overlap, timeout=None, **kwargs):
+    """Slower for earlier files, so completion order is the reverse of input order."""
+    if file_path == "broken.py":
+        raise RuntimeError("no API key")
+    time.sleep(0.05 * (5 - int(file_path[1])))
+    return ConflictWarning(
+        file_path=file_path,
+        conflict_probability=0.5,
+        conflict_type="unknown",
+        recommendation="manual_merge",
+        advice_ko=f"timeout={timeout}",
+        merge_suggestion_ko="",
+        my_changes=my_changes,
+        their_changes=their_changes,
+        line_overlap=line_overlap,
+    )
+
+
+def test_analyze_conflicts_concurrent_in_input_order(monkeypatch):
+    """Results keep input order, calls overlap up to the limit and failures become None."""
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def tracked(**kwargs):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        try:
+            return _fake_analyze(**kwargs)
+        finally:
+            with lock:
+                in_flight.pop()
+
+    monkeypatch.setattr(conflict_analyzer, "analyze_conflict", tracked)
+
+    requests = [
+        {"file_path": f"f{i}.py", "my_changes": "+a", "their_changes": "+b", "line_overlap": True}
+        for i in range(4)
+    ]
+    requests.insert(2, {"file_path": "broken.py", "my_changes": "", "their_changes": "", "line_overlap": False})
+
+    warnings = conflict_analyzer.analyze_conflicts(requests, max_concurrency=2, timeout=7)
+
+    assert [w.file_path if w else None for w in warnings] == ["f0.py", "f1.py", None, "f2.py", "f3.py"]
+    assert warnings[0].advice_ko == "timeout=7"
+    assert max(peak) == 2
+    assert conflict_analyzer.analyze_conflicts([]) == []
+
+
+
+def _file_diff():
+    """Two hunks; the second is long with the interesting change deep inside."""
+    body = "".join(f" line {n}\n" for n in range(100, 140))
+    body = body.replace(" line 120\n", "-line 120\n+line 120 changed\n")
+    return (
+        "diff --git a/app.py b/app.py\n"
+        "index 1111111..2222222 100644\n"
+        "--- a/app.py\n"
+        "+++ b/app.py\n"
+        "@@ -1,3 +1,3 @@\n"
+        " top\n"
+        "-old header\n"
+        "+new header\n"
+        "@@ -100,40 +100,40 @@ def handler():\n" + body
+    )
+
+
+def test_hunk_windows_keep_only_overlapping_lines():
+    """Hunks outside the windows are dropped and long hunks are trimmed around the window."""
+    window = conflict_analyzer.hunk_windows(_file_diff(), [(120, 120)], context_lines=2)
+
+    assert "new header" not in window
+    assert window.startswith("@@ -100,40 +100,40 @@")
+    assert "+line 120 changed" in window and " line 118" in window and " line 122" in window
+    assert " line 117" not in window and " line 123" not in window
+    assert window.count(" ...") == 2
+
+    # 겹침 정보가 없으면 앞쪽 헝크부터, 예산 내에서 라인 단위로 자름
+    head = conflict_analyzer.hunk_windows(_file_diff(), None, max_chars=120)
+    assert head.startswith("@@ -1,3 +1,3 @@") and head.endswith("... (truncated)")
+
+
+def test_conflict_prompt_uses_windows_within_budget():
+    """The prompt carries the overlapping hunk instead of the first 800 characters."""
+    prompt = conflict_analyzer.create_conflict_prompt(
+        "app.py",
+        _file_diff(),
+        _file_diff(),
+        True,
+        overlapping_ranges=[((118, 121), (120, 125))],
+        token_budget=200,
+    )
+
+    assert "+line 120 changed" in prompt
+    assert "new header" not in prompt
+    assert "118-121 <-> 120-125" in prompt
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
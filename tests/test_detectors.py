@@ -1,9 +1,14 @@
 """Tests for detector modules."""
 
 import pytest
-from pushguardian.detectors.secrets import detect_secrets
+from pushguardian.detectors.secrets import detect_secrets, detect_secrets_in_diff
+from pushguardian.detectors.parallel import detect_secrets_parallel
+from pushguardian.detectors.classify import classify_files, llm_diff_text, paths_with_policy
+from pushguardian.detectors.entropy import detect_high_entropy_strings, shannon_entropy_batch
+from pushguardian.diff_model import parse_diff
 from pushguardian.detectors.files import detect_sensitive_files
 from pushguardian.detectors.stack_guess import guess_stacks, identify_weak_stacks
+from pushguardian.benchmark.detector_bench import legacy_detect_secrets, generate_synthetic_diff
 
 
 def test_detect_secrets():
@@ -23,6 +28,123 @@ def test_detect_secrets():
     assert all(f.severity == "critical" for f in findings)
 
 
+def test_detect_secrets_matches_legacy():
+    """Single-pass scanner must produce exactly the same findings as the per-pattern loop."""
+    diff_text = generate_synthetic_diff(3000, secret_every=700) + """
++token = "ghp_abc" + "ghp_def"  # two matches on one line
++auth = "Bearer eyJhbGciOi"; key = "sk-live"
+-removed = "AKIAREMOVED"
++weird = "sk-[unclosed"
+"""
+    patterns = ["sk-", "AKIA", "ghp_", "Bearer eyJ", "sk-[unclosed", r"key\s*=\s*\"sk"]
+
+    expected = [f.to_dict() for f in legacy_detect_secrets(diff_text, patterns)]
+    actual = [f.to_dict() for f in detect_secrets(diff_text, patterns)]
+
+    assert actual == expected
+    assert sum(1 for f in actual if "ghp_" in f["title"]) == 2
+
+
+def test_parallel_scan_matches_serial():
+    """Process-pool scan returns the same findings, in the same order, as the in-process scan."""
+    model = parse_diff(generate_synthetic_diff(6000, secret_every=450) + "\n+stray AKIA line\n")
+    patterns = ["sk-", "AKIA", r"module_\d+"]
+    config = {"parallel_scan": {"enabled": True, "min_added_lines": 1, "max_workers": 2}}
+
+    expected = [f.to_dict() for f in detect_secrets_in_diff(model, patterns)]
+    actual = [f.to_dict() for f in detect_secrets_parallel(model, patterns, config)]
+
+    assert actual == expected
+    assert len(actual) > 10
+
+
+def test_shannon_entropy_batch():
+    """Batched entropy matches the textbook values and flags hex tokens."""
+    pytest.importorskip("numpy")
+    entropy, is_hex = shannon_entropy_batch([b"aaaa", b"abcd", b"0123456789abcdef", b"aabb"])
+
+    assert entropy.tolist() == pytest.approx([0.0, 2.0, 4.0, 1.0])
+    assert is_hex.tolist() == [True, True, True, True]
+    assert shannon_entropy_batch([b"xyz_-+/"])[1].tolist() == [False]
+
+
+def test_detect_high_entropy_strings():
+    """Random tokens under secret-like names are reported (advisory); plain hashes and lock files are not."""
+    pytest.importorskip("numpy")
+    diff_text = """diff --git a/app.py b/app.py
+index 1111111..2222222 100644
+--- a/app.py
++++ b/app.py
+@@ -1,1 +1,9 @@
+ import os
++TOKEN = "q8ZxV3mT9pLkW2rB7nYcJ5hF0dGs4aEu"
++NAME = "this_is_a_very_long_but_boring_identifier"
++SHA = "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b"
++KEY = "sk-q8ZxV3mT9pLkW2rB7nYcJ5hF0dGs4aEu"
++API_SECRET = "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b"
++keyboard_layout = "q8ZxV3mT9pLkW2rB7nYcJ5hF0dGs4aEu"
++MONKEY_SEED = "q8ZxV3mT9pLkW2rB7nYcJ5hF0dGs4aEu"
++clientKey = "Zq8xV3mT9pLkW2rB7nYcJ5hF0dGs4aEu"
+diff --git a/.github/workflows/ci.yml b/.github/workflows/ci.yml
+index 5555555..6666666 100644
+--- a/.github/workflows/ci.yml
++++ b/.github/workflows/ci.yml
+@@ -1,0 +1,2 @@
++      - uses: actions/checkout@b4ffde65f46336ab88eb53be808477a3936bae11
++pip install --hash=sha256:2cf8b3b5d2c0ea4e8d9b1e6a1f7c4a3b5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1
+diff --git a/pnpm-lock.yaml b/pnpm-lock.yaml
+index 3333333..4444444 100644
+--- a/pnpm-lock.yaml
++++ b/pnpm-lock.yaml
+@@ -1,0 +1,1 @@
++    resolution: {integrity: sha512-q8ZxV3mT9pLkW2rB7nYcJ5hF0dGs4aEuXw1Kp9Lm3Nq7Rs5Tv2Wx8Yz4AbCdEf, secret: x}
+"""
+    findings = detect_high_entropy_strings(parse_diff(diff_text), None, ["sk-"])
+
+    # keywords match whole identifier words: clientKey counts, keyboard_layout / MONKEY_SEED do not
+    assert [f.detail.split(":")[0] for f in findings] == ["라인 7", "라인 11", "라인 14"]
+    assert "base64" in findings[0].title
+    assert "hex" in findings[1].title
+    assert "clientKey" in findings[2].detail
+    assert all(f.severity == "medium" for f in findings)
+    # plain hashes (SHA constants, action pins, --hash pins) are not reported
+    assert not any("9f86d0" in f.detail and "SHA =" in f.detail for f in findings)
+    assert detect_high_entropy_strings(parse_diff(diff_text), {"enabled": False}) == []
+    # files classified as generated/vendored are skipped as well
+    assert detect_high_entropy_strings(parse_diff(diff_text), None, ["sk-"], {"app.py": "vendored"}) == []
+
+
+def test_classify_files_and_policies():
+    """Binary, vendored, generated and oversized files get their policies; LLM text keeps only full files."""
+    sections = {
+        "src/app.py": "@@ -0,0 +1 @@\n+print('hi')\n",
+        "assets/logo.png": "Binary files /dev/null and b/assets/logo.png differ\n",
+        "vendor/lib/util.go": "@@ -0,0 +1 @@\n+package util\n",
+        "package-lock.json": "@@ -0,0 +1 @@\n+{}\n",
+        "api/schema.py": "@@ -0,0 +1 @@\n+# Code generated by protoc. DO NOT EDIT.\n",
+        "data/big.csv": "@@ -0,0 +1,3 @@\n+a,b\n+1,2\n+3,4\n",
+    }
+    diff_text = "".join(f"diff --git a/{p} b/{p}\n{body}" for p, body in sections.items())
+    model = parse_diff(diff_text)
+
+    classes = classify_files(model, {"max_changed_lines": 2})
+
+    assert classes == {
+        "src/app.py": "normal",
+        "assets/logo.png": "binary",
+        "vendor/lib/util.go": "vendored",
+        "package-lock.json": "generated",
+        "api/schema.py": "generated",
+        "data/big.csv": "oversized",
+    }
+    assert "assets/logo.png" not in paths_with_policy(classes, None, ("full", "hard_only"))
+    assert paths_with_policy(classes, {"policies": {"vendored": "skip"}}, ("skip",)) == [
+        "assets/logo.png",
+        "vendor/lib/util.go",
+    ]
+    assert llm_diff_text(model, classes) == model.file_text("src/app.py")
+
+
 def test_detect_sensitive_files():
     """Test sensitive file pattern detection."""
     changed_files = [".env", "config/database.yml", "keys/id_rsa", "src/main.py"]
@@ -35,6 +157,32 @@ def test_detect_sensitive_files():
     assert all(f.kind == "file" for f in findings)
 
 
+def test_file_patterns_fnmatch_semantics():
+    """Patterns follow fnmatch (brackets, '+'), are case-insensitive and the first listed pattern wins."""
+    patterns = ["*serviceAccount*.json", "*.KEY", "secrets[0-9].txt", "c++.env", "*.json", ".env.*"]
+    changed = [
+        "gcp/ServiceAccount-prod.json",
+        "certs/server.key",
+        "secrets7.txt",
+        "secretsX.txt",
+        "tools/c++.env",
+        "package.json",
+        "config/.env.local",
+        "src/main.py",
+    ]
+
+    findings = detect_sensitive_files(changed, patterns)
+
+    assert [(f.detail, f.title) for f in findings] == [
+        ("파일: gcp/ServiceAccount-prod.json", "민감한 파일 감지: *serviceAccount*.json"),
+        ("파일: certs/server.key", "민감한 파일 감지: *.KEY"),
+        ("파일: secrets7.txt", "민감한 파일 감지: secrets[0-9].txt"),
+        ("파일: tools/c++.env", "민감한 파일 감지: c++.env"),
+        ("파일: package.json", "민감한 파일 감지: *.json"),
+        ("파일: config/.env.local", "민감한 파일 감지: .env.*"),
+    ]
+
+
 def test_guess_stacks():
     """Test stack guessing from file paths."""
     files = [
@@ -52,6 +200,22 @@ def test_guess_stacks():
     assert "kubernetes" in stacks
 
 
+def test_guess_stacks_index_and_custom_stacks():
+    """Directory indicators match whole path segments; custom stacks extend the index."""
+    assert guess_stacks(["svc/src/main/java/App.kt"]) == {"springboot"}
+    assert guess_stacks(["src/main/JAVA.md"]) == set()  # "java/" must be a directory
+    assert guess_stacks(["docs/mycomponents/readme.md"]) == set()
+
+    custom = {
+        "terraform": {"extensions": [".tf"], "paths": ["infra/"], "files": []},
+        "docker": {"files": ["Containerfile"]},
+    }
+    stacks = guess_stacks(["infra/main.tf", "live/prod.tf", "build/Containerfile"], custom)
+
+    assert stacks == {"terraform", "docker"}
+    assert guess_stacks(["build/Containerfile"]) == set()  # built-in index is unchanged
+
+
 def test_identify_weak_stacks():
     """Test weak stack identification."""
     detected = {"react", "python", "docker"}
@@ -0,0 +1,89 @@
+"""Tests for the shared DiffModel parser."""
+
+import pytest
+from pushguardian.diff_model import parse_diff, split_file_sections
+
+
+DIFF_TEXT = """diff --git a/src/app.py b/src/app.py
+index 1111111..2222222 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -10,4 +10,5 @@ def main():
+ context_a = 1
+-old_value = 2
++new_value = 2
++extra = 3
+ context_b = 4
+diff --git a/.env b/.env
+new file mode 100644
+index 0000000..3333333
+--- /dev/null
++++ b/.env
+@@ -0,0 +1,2 @@
++OPENAI_API_KEY=sk-test
++DEBUG=true
+"""
+
+
+def test_parse_files_and_status():
+    """Files, statuses and blob SHAs are captured from headers."""
+    model = parse_diff(DIFF_TEXT)
+
+    assert model.paths() == ["src/app.py", ".env"]
+    assert model.file(".env").status == "added"
+    assert model.file(".env").new_blob == "3333333"
+    assert model.file("src/app.py").removed_count == 1
+
+
+def test_hunk_ranges_and_line_numbers():
+    """Hunk ranges match parse_diff_hunks and added lines carry new-file line numbers."""
+    model = parse_diff(DIFF_TEXT)
+
+    assert model.hunk_ranges() == {"src/app.py": [(10, 14)], ".env": [(1, 2)]}
+
+    hunk = model.file("src/app.py").hunks[0]
+    assert hunk.added == [(11, 12)]
+    assert hunk.removed == [(11, 11)]
+
+    added = list(model.iter_added_lines())
+    assert [(a.path, a.lineno, a.text) for a in added] == [
+        ("src/app.py", 11, "+new_value = 2"),
+        ("src/app.py", 12, "+extra = 3"),
+        (".env", 1, "+OPENAI_API_KEY=sk-test"),
+        (".env", 2, "+DEBUG=true"),
+    ]
+    # line_index is the position inside the diff text (used in finding details)
+    assert DIFF_TEXT.split("\n")[added[0].line_index - 1] == "+new_value = 2"
+
+
+def test_file_text_is_offset_slice():
+    """file_text returns exactly one file section without rescanning the diff."""
+    model = parse_diff(DIFF_TEXT)
+
+    env_text = model.file_text(".env")
+    assert env_text.startswith("diff --git a/.env b/.env")
+    assert "src/app.py" not in env_text
+    assert model.file_text("missing.py") == ""
+
+
+def test_split_file_sections_matches_file_text():
+    """Header-only split gives the same sections as the full parse."""
+    model = parse_diff(DIFF_TEXT)
+    sections = split_file_sections(DIFF_TEXT)
+
+    assert list(sections) == model.paths()
+    assert all(sections[path] == model.file_text(path) for path in sections)
+    assert parse_diff(sections["src/app.py"]).hunk_ranges() == {"src/app.py": [(10, 14)]}
+    assert split_file_sections("+just a snippet\n") == {}
+
+
+def test_stray_added_lines_without_headers():
+    """Pasted snippets without diff headers still expose their added lines."""
+    model = parse_diff("\n+PASSWORD=test123\n+TOKEN=abc\n")
+
+    assert model.paths() == []
+    assert [a.text for a in model.iter_added_lines()] == ["+PASSWORD=test123", "+TOKEN=abc"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
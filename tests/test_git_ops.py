@@ -1,7 +1,50 @@
 """Tests for git operations."""
 
+import subprocess
 import pytest
-from pushguardian.git_ops import parse_changed_files
+from pushguardian.git_ops import (
+    EMPTY_TREE,
+    check_line_overlap,
+    find_overlapping_ranges,
+    get_base_diff,
+    parse_changed_files,
+    get_diff_range,
+    get_name_status,
+    get_new_branch_base,
+    get_patch_ids,
+    resolve_push_base,
+    scan_history_first_seen,
+    simulate_merge,
+    stream_diff_range,
+    stream_diff_range_sharded,
+)
+import pushguardian.git_ops as git_ops
+
+
+def _git(repo, *args):
+    """Run git in a throwaway repo with a fixed identity."""
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def temp_repo(tmp_path):
+    """Small repo: one base commit and one commit adding two files."""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "README.md").write_text("hello\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "base")
+    base = _git(tmp_path, "rev-parse", "HEAD")
+
+    (tmp_path / "app.py").write_text("print('hi')\n")
+    (tmp_path / "config.py").write_text("KEY = 'sk-test'\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "feature")
+    head = _git(tmp_path, "rev-parse", "HEAD")
+
+    return tmp_path, base, head
 
 
 def test_parse_changed_files():
@@ -26,5 +69,233 @@ index 0000000..abc1234
     assert ".env" in files
 
 
+def test_stream_diff_range_matches_full_diff(temp_repo):
+    """Streaming chunks reassemble into exactly the captured diff, one file per chunk."""
+    repo, base, head = temp_repo
+
+    chunks = list(stream_diff_range(head, base, str(repo)))
+
+    assert len(chunks) == 2
+    assert "".join(chunks) == get_diff_range(head, base, str(repo))
+    assert chunks[0].startswith("diff --git a/app.py")
+
+
+def test_stream_diff_range_early_close(temp_repo):
+    """Closing the stream after the first file stops git without errors."""
+    repo, base, head = temp_repo
+
+    stream = stream_diff_range(head, base, str(repo))
+    first = next(stream)
+    stream.close()
+
+    assert "app.py" in first
+
+
+def test_new_branch_without_remotes_uses_empty_tree(temp_repo):
+    """With no remote-tracking refs, the whole history is new."""
+    repo, base, head = temp_repo
+
+    assert get_new_branch_base(head, str(repo)) == EMPTY_TREE
+
+
+def test_new_branch_diffs_only_unpushed_commits(temp_repo):
+    """A new branch is diffed from the commit the remote already has, not the empty tree."""
+    repo, base, head = temp_repo
+    _git(repo, "update-ref", "refs/remotes/origin/main", base)
+
+    assert get_new_branch_base(head, str(repo)) == base
+
+    files = parse_changed_files(get_diff_range(head, "0" * 40, str(repo)))
+    assert sorted(files) == ["app.py", "config.py"]  # README.md is already on the remote
+
+
+def test_push_base_resolved_once(temp_repo, monkeypatch):
+    """A base resolved up front is reused by every diff helper instead of re-walking rev-list."""
+    repo, base, head = temp_repo
+    _git(repo, "update-ref", "refs/remotes/origin/main", base)
+
+    assert resolve_push_base(head, base, str(repo)) is None  # existing branch: plain range
+    push_base = resolve_push_base(head, "0" * 40, str(repo))
+    assert push_base == base
+
+    calls = []
+    monkeypatch.setattr(git_ops, "get_new_branch_base", lambda *args: calls.append(args) or EMPTY_TREE)
+    entries = get_name_status(head, "0" * 40, str(repo), push_base)
+    assert sorted(e.path for e in entries) == ["app.py", "config.py"]
+    assert get_diff_range(head, "0" * 40, str(repo), shards=2, base=push_base) == get_diff_range(head, base, str(repo))
+    assert len(get_patch_ids(head, "0" * 40, str(repo), push_base)) == 1
+    assert calls == []
+
+    # without a base, the sharded path still resolves it only once
+    get_diff_range(head, "0" * 40, str(repo), shards=2)
+    assert len(calls) == 1
+
+
+def test_name_status_and_excluded_pathspecs(temp_repo):
+    """--raw entries carry status, new path and blob SHAs; exclude pathspecs drop files from the patch."""
+    repo, base, head = temp_repo
+    _git(repo, "mv", "app.py", "main.py")
+    _git(repo, "rm", "-q", "README.md")
+    (repo / "[weird].txt").write_text("x\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "shuffle")
+    new_head = _git(repo, "rev-parse", "HEAD")
+
+    entries = get_name_status(new_head, base, str(repo))
+
+    by_path = {entry.path: entry for entry in entries}
+    assert sorted(by_path) == ["README.md", "[weird].txt", "config.py", "main.py"]
+    assert by_path["README.md"].status == "D" and by_path["README.md"].new_blob is None
+    assert by_path["config.py"].status == "A" and by_path["config.py"].old_blob is None
+    assert by_path["main.py"].new_blob == _git(repo, "rev-parse", f"{new_head}:main.py")
+
+    chunks = list(stream_diff_range(new_head, base, str(repo), [":(exclude,literal)[weird].txt"]))
+    assert sorted(parse_changed_files("".join(chunks))) == ["README.md", "config.py", "main.py"]
+
+    assert get_name_status(new_head, "f" * 40, str(repo)) is None
+
+
+def test_sharded_diff_matches_single_diff(temp_repo, monkeypatch):
+    """Concurrent pathspec shards reproduce the single `git diff` output byte for byte."""
+    repo, _, head = temp_repo
+    _git(repo, "mv", "app.py", "zz_moved.py")
+    for i in range(40):
+        (repo / f"pkg{i % 4}").mkdir(exist_ok=True)
+        (repo / f"pkg{i % 4}" / f"mod {i}.py").write_text(f"VALUE = {i}\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "wide change")
+    new_head = _git(repo, "rev-parse", "HEAD")
+
+    expected = get_diff_range(new_head, head, str(repo))
+    entries = get_name_status(new_head, head, str(repo))
+
+    # 작은 상한으로 샤드 안에서도 git 호출이 여러 번 나뉘도록 함
+    monkeypatch.setattr(git_ops, "_MAX_PATHSPEC_CHARS", 200)
+    # 버퍼 하나짜리: 뒤 샤드는 앞 샤드가 소비될 때까지 대기
+    monkeypatch.setattr(git_ops, "_SHARD_BUFFER_CHUNKS", 1)
+    for shards in (2, 3, 7):
+        assert "".join(stream_diff_range_sharded(new_head, head, str(repo), entries, shards)) == expected
+    assert get_diff_range(new_head, head, str(repo), shards=3) == expected
+    assert "rename to zz_moved.py" in expected
+
+    chunks = stream_diff_range_sharded(new_head, head, str(repo), entries, 3)
+    first = next(chunks)
+    chunks.close()
+    assert expected.startswith(first)
+
+
+def test_base_diff_limited_to_my_paths(temp_repo, monkeypatch):
+    """Base-branch diff only covers the requested files (split over several invocations if needed)."""
+    repo, base, head = temp_repo
+    _git(repo, "branch", "-f", "upstream", head)
+    _git(repo, "checkout", "-q", "upstream")
+    (repo / "app.py").write_text("print('upstream')\n")
+    (repo / "README.md").write_text("hello upstream\n")
+    (repo / "other.py").write_text("x = 1\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "upstream work")
+    _git(repo, "checkout", "-q", head)
+
+    full = parse_changed_files(get_base_diff(str(repo), "upstream"))
+    assert sorted(full) == ["README.md", "app.py", "other.py"]
+
+    monkeypatch.setattr(git_ops, "_MAX_PATHSPEC_CHARS", 20)
+    limited = get_base_diff(str(repo), "upstream", ["app.py", "README.md", "untouched.py"])
+    assert sorted(parse_changed_files(limited)) == ["README.md", "app.py"]
+    assert get_base_diff(str(repo), "upstream", []) == ""
+
+
+def test_simulate_merge_reports_exact_conflicts(temp_repo):
+    """merge-tree finds the conflicting file and its marker lines; clean merges report nothing."""
+    repo, base, head = temp_repo
+    (repo / "settings.py").write_text("A = 1\nB = 2\nC = 3\nD = 4\nE = 5\nF = 6\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "settings")
+    fork = _git(repo, "rev-parse", "HEAD")
+
+    _git(repo, "checkout", "-q", "-b", "upstream")
+    (repo / "settings.py").write_text("A = 1\nB = 20\nC = 3\nD = 4\nE = 5\nF = 6\n")
+    _git(repo, "commit", "-qam", "upstream")
+    _git(repo, "checkout", "-q", fork)
+
+    (repo / "settings.py").write_text("A = 1\nB = 200\nC = 3\nD = 4\nE = 5\nF = 60\n")
+    _git(repo, "commit", "-qam", "mine")
+    mine = _git(repo, "rev-parse", "HEAD")
+
+    simulation = simulate_merge(str(repo), "upstream", mine)
+    assert simulation is not None and not simulation.clean
+    assert list(simulation.conflicts) == ["settings.py"]
+    assert simulation.conflicts["settings.py"] == [(2, 6)]
+    assert simulation.messages["settings.py"][0].startswith("CONFLICT")
+    # 작업 트리/인덱스는 그대로
+    assert _git(repo, "status", "--porcelain") == ""
+
+    clean = simulate_merge(str(repo), "upstream", fork)
+    assert clean is not None and clean.clean
+    assert simulate_merge(str(repo), "no-such-branch", mine) is None
+
+
+def test_find_overlapping_ranges_matches_brute_force():
+    """Sweep-line finds exactly the pairs a nested loop would (inclusive bounds, duplicates kept)."""
+    import random
+
+    rng = random.Random(7)
+    for _ in range(200):
+        mine = [(s, s + rng.randint(0, 8)) for s in (rng.randint(1, 60) for _ in range(rng.randint(0, 12)))]
+        base = [(s, s + rng.randint(0, 8)) for s in (rng.randint(1, 60) for _ in range(rng.randint(0, 12)))]
+        expected = sorted(
+            (m, b) for m in mine for b in base if not (m[1] < b[0] or m[0] > b[1])
+        )
+        assert find_overlapping_ranges(mine, base) == expected
+        assert check_line_overlap(mine, base) == bool(expected)
+
+    assert find_overlapping_ranges([(10, 14)], [(14, 20), (15, 16)]) == [((10, 14), (14, 20))]
+
+
+def test_scan_history_first_seen_in_one_pass(temp_repo):
+    """Every line/path query is answered with the exact commit that introduced it."""
+    repo, base, head = temp_repo
+    (repo / "config.py").write_text("KEY = 'sk-test'\nOTHER = 'AKIA123'\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "more secrets")
+    latest = _git(repo, "rev-parse", "HEAD")
+
+    first_seen = scan_history_first_seen(
+        str(repo),
+        lines=["KEY = 'sk-test'", "  OTHER = 'AKIA123'  ", "never committed"],
+        paths=["app.py", "README.md", "missing.txt"],
+        max_commits=50,
+    )
+
+    assert first_seen == {
+        "KEY = 'sk-test'": head,
+        "OTHER = 'AKIA123'": latest,
+        "never committed": None,
+        "app.py": head,
+        "README.md": base,
+        "missing.txt": None,
+    }
+    # Outside the scan window nothing is reported
+    assert scan_history_first_seen(str(repo), paths=["README.md"], max_commits=1) == {"README.md": None}
+
+
+def test_patch_ids_survive_cherry_pick(temp_repo):
+    """A cherry-picked commit has a new SHA but the same patch-id."""
+    repo, base, head = temp_repo
+    original = get_patch_ids(head, base, str(repo))
+    assert len(original) == 1
+
+    _git(repo, "checkout", "-qb", "rebased", base)
+    (repo / "other.txt").write_text("unrelated\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "unrelated")
+    new_base = _git(repo, "rev-parse", "HEAD")
+    _git(repo, "cherry-pick", head)
+    picked = _git(repo, "rev-parse", "HEAD")
+
+    assert picked != head
+    assert get_patch_ids(picked, new_base, str(repo)) == original
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
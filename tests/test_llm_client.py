@@ -0,0 +1,30 @@
+"""Tests for the shared chat-model pool."""
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from pushguardian.llm.client import clear_chat_models, get_chat_model
+
+
+def test_get_chat_model_reuses_clients(monkeypatch):
+    """Same settings share one client; different settings or API key get their own."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-1")
+    clear_chat_models()
+    try:
+        llm = get_chat_model(temperature=0.1)
+        assert get_chat_model(temperature=0.1) is llm
+        assert get_chat_model(temperature=0.2) is not llm
+        assert get_chat_model(temperature=0.1, timeout=20, max_retries=0) is not llm
+        assert get_chat_model(
+            temperature=0.1, model_kwargs={"response_format": {"type": "json_object"}}
+        ) is not llm
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test-2")
+        assert get_chat_model(temperature=0.1) is not llm
+    finally:
+        clear_chat_models()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,7 +1,8 @@
 """Tests for LLM judge module."""
 
 import pytest
-from pushguardian.llm.judge import run_soft_judge
+from pushguardian.llm.judge import chunk_diff, reduce_judge_results, run_soft_judge
+from pushguardian.report.models import Finding
 
 
 def test_run_soft_judge_basic():
@@ -46,5 +47,53 @@ index abc1234..def5678 100644
             raise
 
 
+def _file_diff(path: str, hunks: int, lines_per_hunk: int = 5) -> str:
+    parts = [f"diff --git a/{path} b/{path}\nindex 1111111..2222222 100644\n--- a/{path}\n+++ b/{path}\n"]
+    for h in range(hunks):
+        start = h * 100 + 1
+        parts.append(f"@@ -{start},0 +{start},{lines_per_hunk} @@\n")
+        parts.extend(f"+{path} hunk {h} line {i}\n" for i in range(lines_per_hunk))
+    return "".join(parts)
+
+
+def test_chunk_diff_covers_whole_diff():
+    """Small files are packed together, a big file is split at hunk boundaries with its header."""
+    small = _file_diff("a.py", 1) + _file_diff("b.py", 1)
+    big = _file_diff("big.py", 20)
+    chunks = chunk_diff(small + big, token_budget=100)
+
+    assert len(chunks) > 2
+    assert chunks[0].startswith("diff --git a/a.py") and "diff --git a/b.py" in chunks[0]
+    assert all(len(chunk) <= 400 for chunk in chunks)
+    assert all(chunk.startswith("diff --git") for chunk in chunks)
+    for h in range(20):
+        assert sum(f"big.py hunk {h} line 4" in chunk for chunk in chunks) == 1
+
+    assert chunk_diff(small, token_budget=3000) == [small]
+    assert chunk_diff("+pasted line\n" * 50, token_budget=10) == ["+pasted line\n" * 3] * 16 + ["+pasted line\n" * 2]
+
+
+def test_reduce_judge_results():
+    """Highest severity/risk wins; same-titled findings keep every file; duplicate fixes are merged."""
+    low = Finding("dto", "DTO 우회", "a.py", 0.6, "medium", "fix")
+    high = Finding("dto", "DTO  우회", "b.py", 0.9, "medium", "fix")
+    merged = reduce_judge_results([
+        {"findings": [low], "risk_score": 0.3, "severity": "medium", "decision_suggestion": "allow",
+         "quick_fixes": ["A", "B"], "learning_points": [{"stack": "react", "concept": "useState"}]},
+        {"findings": [high], "risk_score": 0.8, "severity": "high", "decision_suggestion": "block",
+         "quick_fixes": ["B"], "learning_points": [{"stack": "React", "concept": "useState "}]},
+    ])
+
+    [finding] = merged["findings"]
+    # same issue in two files: one finding that keeps both locations
+    assert finding.detail == "a.py\n\nb.py"
+    assert finding.confidence == 0.9
+    assert merged["risk_score"] == 0.8
+    assert merged["severity"] == "high"
+    assert merged["decision_suggestion"] == "block"
+    assert merged["quick_fixes"] == ["A", "B"]
+    assert len(merged["learning_points"]) == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
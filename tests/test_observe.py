@@ -0,0 +1,94 @@
+"""Tests for the observe + plan step (combined LLM call and rule-based fast path)."""
+
+import json
+import pytest
+
+pytest.importorskip("langchain_openai")
+pytest.importorskip("tavily")  # observe reuses the trusted-domain lists from research.gather
+
+from pushguardian.llm import observe
+from pushguardian.report.models import Evidence, Finding
+
+
+class _Response:
+    def __init__(self, content):
+        self.content = content
+
+
+def _findings():
+    return [Finding("secret", "하드코딩된 API 키", "config.py", 0.9, "high", "fix")]
+
+
+def test_observe_and_plan_single_call(monkeypatch):
+    """One LLM answer is split into the observation and plan formats."""
+    calls = []
+    answer = {
+        "is_sufficient": False,
+        "need_more": True,
+        "missing_categories": ["example"],
+        "relevance_score": 0.4,
+        "korean_content_sufficient": False,
+        "next_action": "search_serper",
+        "refined_query": "python api key environment variable",
+        "filter_domains": ["akamai.com"],
+        "notes": "예시 링크 부족",
+        "reasoning": "예시 자료가 필요함",
+    }
+    monkeypatch.setattr(observe, "get_chat_model", lambda **kwargs: object())
+    monkeypatch.setattr(
+        observe, "cached_invoke",
+        lambda llm, messages, template: calls.append(template) or _Response(json.dumps(answer)),
+    )
+    evidence = Evidence(principle_links=["https://owasp.org"])
+
+    observation, plan = observe.observe_and_plan(_findings(), evidence, 0, "secret security best practices")
+
+    assert calls == ["observe_plan"]
+    assert observation["korean_content_sufficient"] is False
+    assert observation["notes"] == "예시 링크 부족"
+    assert plan["next_action"] == "search_serper"
+    assert plan["refined_query"] == "python api key environment variable"
+    assert evidence.llm_observations[-1]["model"] == "gpt-4o-mini (observe+plan)"
+
+
+def test_observe_and_plan_skips_llm_after_retry(monkeypatch):
+    """After the research loop ran, routing no longer needs the LLM."""
+    monkeypatch.setattr(observe, "cached_invoke", lambda *args: pytest.fail("LLM should not be called"))
+    evidence = Evidence(principle_links=["https://owasp.org"], example_links=["https://velog.io/@a/b"])
+
+    observation, plan = observe.observe_and_plan(_findings(), evidence, 1)
+
+    assert observation["is_sufficient"] is True
+    assert observation["korean_content_sufficient"] is True
+    assert plan["next_action"] == "done"
+
+
+def test_fast_path_skips_llm_when_evidence_is_trusted():
+    """Trusted principle + example links are judged sufficient without the LLM, and the hit is recorded."""
+    evidence = Evidence(
+        principle_links=["https://cheatsheetseries.owasp.org/cheatsheets/Secrets_Management_Cheat_Sheet.html"],
+        example_links=["https://stackoverflow.com/questions/1"],
+    )
+
+    observation, plan = observe.fast_path_observation(_findings(), evidence, 0)
+
+    assert observation["is_sufficient"] is True
+    assert observation["korean_content_sufficient"] is False
+    assert plan["next_action"] == "done"
+    assert evidence.llm_observations[-1]["fast_path"] is True
+
+
+def test_fast_path_falls_back_to_llm():
+    """Untrusted links, a disabled switch or higher thresholds leave the decision to the LLM."""
+    weak = Evidence(principle_links=["https://www.akamai.com/glossary/x"], example_links=["https://github.com/a/b"])
+    strong = Evidence(principle_links=["https://owasp.org/Top10/"], example_links=["https://github.com/a/b"])
+
+    assert observe.fast_path_observation(_findings(), weak, 0) is None
+    assert observe.fast_path_observation([], strong, 0) is None
+    assert observe.fast_path_observation(_findings(), strong, 0, {"enabled": False}) is None
+    assert observe.fast_path_observation(_findings(), strong, 0, {"min_example_links": 2}) is None
+    assert weak.llm_observations == [] and strong.llm_observations == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,8 +1,35 @@
 """Tests for RepoContext (Git repository operations)."""
 
+import subprocess
 import pytest
 from pathlib import Path
-from pushguardian.repo_context import RepoContext
+from pushguardian.cli import collect_push_diff, patch_pathspecs
+from pushguardian.detectors.classify import classify_files
+from pushguardian.diff_model import parse_diff
+from pushguardian.repo_context import RepoContext, get_repo_context
+
+
+def _git(repo, *args):
+    """Run git in a throwaway repo with a fixed identity."""
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def temp_repo(tmp_path):
+    """Repo with two commits: a README, then a small app file and a large data file."""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "README.md").write_text("hello\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "base")
+
+    (tmp_path / "app.py").write_text("print('hi')\n")
+    (tmp_path / "data.txt").write_text("x" * 100 + "\n" * 2000)
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "feature")
+    return tmp_path
 
 
 def test_repo_context_initialization():
@@ -38,5 +65,142 @@ def test_diff_last_n_commits_negative():
     assert diff == ""
 
 
+def test_object_reader_lookups(temp_repo):
+    """info/read/info_many are answered over the persistent cat-file pipes."""
+    with RepoContext(temp_repo) as repo:
+        objects = repo.objects
+        head = _git(temp_repo, "rev-parse", "HEAD")
+
+        assert objects.resolve("HEAD") == head
+        assert objects.exists("HEAD~1")
+        assert not objects.exists("HEAD~2")
+        assert not objects.exists("origin/nonexistent-branch")
+
+        info = objects.info("HEAD:app.py")
+        assert info.type == "blob" and info.size == len("print('hi')\n")
+        assert objects.read_text("HEAD:app.py") == "print('hi')\n"
+        assert objects.read("HEAD:missing.py") is None
+
+        found = objects.info_many(["HEAD:README.md", "HEAD:nope", "HEAD:README.md"])
+        assert list(found) == ["HEAD:README.md", "HEAD:nope"]
+        assert found["HEAD:README.md"].size == len("hello\n")
+        assert found["HEAD:nope"] is None
+
+        # 같은 프로세스가 계속 재사용되어야 함
+        proc = objects._check
+        objects.info("HEAD")
+        assert objects._check is proc
+
+    # close 이후에도 다시 사용 가능
+    assert repo.objects.exists("HEAD")
+    repo.close()
+
+
+def test_diff_last_n_commits_uses_object_checks(temp_repo):
+    """HEAD~N existence decides between a range diff and an empty-tree diff."""
+    with RepoContext(temp_repo) as repo:
+        assert "app.py" in repo.diff_last_n_commits(1)
+        assert "README.md" not in repo.diff_last_n_commits(1)
+        assert "README.md" in repo.diff_last_n_commits(5)
+        assert repo.ahead_count(base_ref="HEAD~1") == 1
+
+
+def test_shared_context_and_blob_size_classification(temp_repo):
+    """get_repo_context shares one reader; classify_files flags large blobs from cat-file sizes."""
+    repo = get_repo_context(temp_repo)
+    assert get_repo_context(str(temp_repo)) is repo
+
+    model = parse_diff(_git(temp_repo, "diff", "HEAD~1", "HEAD", "--full-index"))
+    classes = classify_files(model, {"max_blob_bytes": 1000}, objects=repo.objects)
+    assert classes == {"app.py": "normal", "data.txt": "oversized"}
+
+
+def test_header_only_sections_sniffed_from_blob(temp_repo):
+    """Sections without a patch body are classified from the blob: NUL bytes → binary."""
+    (temp_repo / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
+    _git(temp_repo, "add", ".")
+    _git(temp_repo, "commit", "-qm", "logo")
+    blob = _git(temp_repo, "rev-parse", "HEAD:logo.png")
+    app_blob = _git(temp_repo, "rev-parse", "HEAD:app.py")
+
+    # cli._header_only 형식: 경로와 blob SHA만 있고 본문이 없는 구간
+    header_only = (
+        f"diff --git a/logo.png b/logo.png\nindex {'0' * 40}..{blob}\n"
+        f"diff --git a/app.py b/app.py\nindex {'0' * 40}..{app_blob}\n"
+    )
+    classes = classify_files(parse_diff(header_only), None, objects=get_repo_context(temp_repo).objects)
+    assert classes == {"logo.png": "binary", "app.py": "normal"}
+
+
+def test_patch_pathspecs_excludes_both_sides_of_oversized_rename(temp_repo):
+    """A renamed file above max_file_bytes is left out of the patch under its old and new path."""
+    from pushguardian.git_ops import get_name_status, stream_diff_range
+
+    _git(temp_repo, "mv", "data.txt", "data_v2.txt")
+    _git(temp_repo, "commit", "-qm", "rename")
+
+    entries = get_name_status("HEAD", "HEAD~1", str(temp_repo))
+    assert [(e.status[0], e.old_path, e.path) for e in entries] == [("R", "data.txt", "data_v2.txt")]
+
+    config = {"diff_stream": {"max_file_bytes": 1000}}
+    pathspecs, excluded = patch_pathspecs(entries, str(temp_repo), config)
+    assert pathspecs == [":(exclude,literal)data.txt", ":(exclude,literal)data_v2.txt"]
+    assert excluded == entries
+    assert "".join(stream_diff_range("HEAD", "HEAD~1", str(temp_repo), pathspecs)) == ""
+
+
+def test_collect_push_diff_reads_every_file(temp_repo):
+    """Sections over the retention cap keep only headers unless their body hits a secret rule; nothing is cut off."""
+    (temp_repo / "a_big.txt").write_text("filler line\n" * 50)
+    (temp_repo / "b_secret.py").write_text("KEY = 'sk-first'\n" + "x = 1\n" * 50)
+    (temp_repo / "c_later.py").write_text("TOKEN = 'sk-second'\n")
+    (temp_repo / "d_vendor.js").write_text("const k = 'sk-vendored'\n" * 50)
+    _git(temp_repo, "add", ".")
+    _git(temp_repo, "commit", "-qm", "more")
+
+    config = {
+        "diff_stream": {"max_retained_bytes": 100},
+        "hard_abort": {"secret_patterns": ["sk-"]},
+        "file_classes": {"vendored_paths": ["d_vendor.js"], "policies": {"vendored": "skip"}},
+    }
+    diff_text = collect_push_diff("HEAD", "HEAD~1", str(temp_repo), config)
+    model = parse_diff(diff_text)
+
+    assert model.paths() == ["a_big.txt", "b_secret.py", "c_later.py", "d_vendor.js"]
+    assert "filler line" not in diff_text
+    assert "sk-first" in diff_text and "sk-second" in diff_text
+    # skip 정책 파일은 그래프와 마찬가지로 내용 규칙을 적용하지 않음
+    assert "sk-vendored" not in diff_text
+
+
+def test_collect_push_diff_uses_scan_cache(temp_repo, tmp_path, monkeypatch):
+    """Over-cap sections already scanned under the same policy are not regex-scanned again."""
+    import pushguardian.cli as cli
+    import pushguardian.detectors.scan_cache as scan_cache_module
+
+    (temp_repo / "a_big.txt").write_text("filler line\n" * 50)
+    (temp_repo / "b_secret.py").write_text("KEY = 'sk-first'\n" + "x = 1\n" * 50)
+    _git(temp_repo, "add", ".")
+    _git(temp_repo, "commit", "-qm", "more")
+
+    config = {
+        "report_dir": str(tmp_path / "reports"),
+        "diff_stream": {"max_retained_bytes": 100},
+        "hard_abort": {"secret_patterns": ["sk-"]},
+    }
+    scans = []
+    original = scan_cache_module.scan_file_hits
+    monkeypatch.setattr(scan_cache_module, "scan_file_hits", lambda *a: scans.append(a) or original(*a))
+    monkeypatch.setattr(cli, "detect_secrets_in_diff", lambda *a: scans.append(a) or [])
+
+    first = collect_push_diff("HEAD", "HEAD~1", str(temp_repo), config)
+    assert len(scans) == 2  # both over-cap sections scanned once
+
+    scans.clear()
+    assert collect_push_diff("HEAD", "HEAD~1", str(temp_repo), config) == first
+    assert scans == []
+    assert "sk-first" in first and "filler line" not in first
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])